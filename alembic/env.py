@@ -26,7 +26,15 @@ target_metadata = Base.metadata
 def include_object(object, name, type_, reflected, compare_to):
     """Inclui apenas tabelas específicas nas migrations automáticas."""
     if type_ == "table":
-        return name in ("fazendas", "seed_control")
+        # fazendas_partes é mantida por triggers/funções (migration
+        # c4f1d8a2b6e9) que o autogenerate não enxerga: mudanças nelas, ou
+        # em PARTES_MAX_VERTICES, exigem migrations escritas à mão.
+        return name in (
+            "fazendas",
+            "fazendas_partes",
+            "seed_control",
+            "dataset_version",
+        )
     return True
 
 
@@ -0,0 +1,55 @@
+"""add_simplified_geometries
+
+Revision ID: 2ec56e4d828e
+Revises: 4d780f4e338f
+Create Date: 2026-10-17 09:12:41.402113
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+revision: str = "2ec56e4d828e"
+down_revision: Union[str, Sequence[str], None] = "4d780f4e338f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tolerâncias em graus (SRID 4326): ~11 m e ~110 m no equador.
+# Mantenha em sincronia com GEOM_TOLERANCIAS em app/db/models.py.
+TOLERANCIA_MEDIUM = 0.0001
+TOLERANCIA_LOW = 0.001
+
+
+def upgrade() -> None:
+    op.add_column(
+        "fazendas",
+        sa.Column(
+            "geom_medium",
+            Geometry("MULTIPOLYGON", srid=4326, spatial_index=False),
+            nullable=True,
+            comment="Geometria simplificada (detalhe médio)",
+        ),
+    )
+    op.add_column(
+        "fazendas",
+        sa.Column(
+            "geom_low",
+            Geometry("MULTIPOLYGON", srid=4326, spatial_index=False),
+            nullable=True,
+            comment="Geometria simplificada (detalhe baixo)",
+        ),
+    )
+
+    op.execute(f"""
+        UPDATE fazendas SET
+            geom_medium = ST_Multi(
+                ST_SimplifyPreserveTopology(geom, {TOLERANCIA_MEDIUM})
+            ),
+            geom_low = ST_Multi(ST_SimplifyPreserveTopology(geom, {TOLERANCIA_LOW}));
+        """)
+
+
+def downgrade() -> None:
+    op.drop_column("fazendas", "geom_low")
+    op.drop_column("fazendas", "geom_medium")
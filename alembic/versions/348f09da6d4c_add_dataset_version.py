@@ -0,0 +1,39 @@
+"""add_dataset_version
+
+Revision ID: 348f09da6d4c
+Revises: b3a87aa4f364
+Create Date: 2026-10-17 10:41:55.630214
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "348f09da6d4c"
+down_revision: Union[str, Sequence[str], None] = "b3a87aa4f364"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dataset_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("versao", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "atualizado_em",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+    # Linha única; bases já carregadas partem da quantidade de seeds executados
+    op.execute("""
+        INSERT INTO dataset_version (id, versao)
+        SELECT 1, count(*) FROM seed_control;
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("dataset_version")
@@ -0,0 +1,66 @@
+"""add_incremental_seed_columns
+
+Revision ID: 5c1e7a9b2d44
+Revises: 348f09da6d4c
+Create Date: 2026-10-17 14:02:17.518930
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "5c1e7a9b2d44"
+down_revision: Union[str, Sequence[str], None] = "348f09da6d4c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mantenha em sincronia com HASH_CONTEUDO_SQL em app/db/models.py.
+HASH_CONTEUDO_SQL = (
+    "md5(ROW(cod_tema, nom_tema, cod_imovel, mod_fiscal, num_area, ind_status, "
+    "ind_tipo, des_condic, municipio, cod_estado, dat_criaca, dat_atuali, geom)"
+    "::text)"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "fazendas",
+        sa.Column(
+            "hash_conteudo",
+            sa.String(length=32),
+            nullable=True,
+            comment="Hash dos atributos + geometria (seed incremental)",
+        ),
+    )
+    op.execute(f"UPDATE fazendas SET hash_conteudo = {HASH_CONTEUDO_SQL};")
+    op.create_index("idx_fazendas_chave", "fazendas", ["cod_imovel", "cod_tema"])
+
+    op.add_column(
+        "seed_control",
+        sa.Column(
+            "checksum",
+            sa.String(length=64),
+            nullable=True,
+            comment="SHA-256 do(s) arquivo(s) carregado(s)",
+        ),
+    )
+    op.add_column(
+        "seed_control",
+        sa.Column(
+            "stats",
+            sa.JSON(),
+            nullable=True,
+            comment="Estatísticas da execução (inseridos, atualizados, ...)",
+        ),
+    )
+    op.create_index(
+        op.f("ix_seed_control_checksum"), "seed_control", ["checksum"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_seed_control_checksum"), table_name="seed_control")
+    op.drop_column("seed_control", "stats")
+    op.drop_column("seed_control", "checksum")
+    op.drop_index("idx_fazendas_chave", table_name="fazendas")
+    op.drop_column("fazendas", "hash_conteudo")
@@ -0,0 +1,32 @@
+"""add_area_covering_index
+
+Revision ID: 9e4b2f6c1a37
+Revises: 5c1e7a9b2d44
+Create Date: 2026-10-17 16:20:44.302115
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "9e4b2f6c1a37"
+down_revision: Union[str, Sequence[str], None] = "5c1e7a9b2d44"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Índice de cobertura da busca por área com `fields`: o filtro usa
+    # `num_area` e a projeção típica (id, cod_imovel, municipio, num_area) sai
+    # inteira do índice (Index Only Scan, sem visitar a tabela nem o TOAST das
+    # geometrias). Mantenha em sincronia com app/db/models.py.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_fazendas_area
+        ON fazendas (num_area) INCLUDE (id, cod_imovel, municipio);
+        """)
+    # Estatísticas para o planner; o Index Only Scan também depende do
+    # visibility map, mantido pelo (auto)vacuum
+    op.execute("ANALYZE fazendas;")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_fazendas_area;")
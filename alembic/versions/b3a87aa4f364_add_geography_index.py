@@ -0,0 +1,28 @@
+"""add_geography_index
+
+Revision ID: b3a87aa4f364
+Revises: 2ec56e4d828e
+Create Date: 2026-10-17 10:03:27.118540
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "b3a87aa4f364"
+down_revision: Union[str, Sequence[str], None] = "2ec56e4d828e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A expressão precisa ser idêntica à usada em app/services/geospatial.py
+    # (`geography(geom)`) para o planner escolher o índice.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_fazendas_geog
+        ON fazendas USING gist (geography(geom));
+        """)
+    op.execute("ANALYZE fazendas;")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_fazendas_geog;")
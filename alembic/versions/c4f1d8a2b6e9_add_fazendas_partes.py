@@ -0,0 +1,116 @@
+"""add_fazendas_partes
+
+Revision ID: c4f1d8a2b6e9
+Revises: 9e4b2f6c1a37
+Create Date: 2026-10-17 18:05:12.840276
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+revision: str = "c4f1d8a2b6e9"
+down_revision: Union[str, Sequence[str], None] = "9e4b2f6c1a37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mantenha em sincronia com PARTES_MAX_VERTICES em app/db/models.py.
+MAX_VERTICES = 128
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fazendas_partes",
+        sa.Column(
+            "fazenda_id",
+            sa.Integer(),
+            sa.ForeignKey("fazendas.id", ondelete="CASCADE"),
+            primary_key=True,
+            comment="Fazenda de origem",
+        ),
+        sa.Column(
+            "parte",
+            sa.Integer(),
+            primary_key=True,
+            comment="Número da parte (ordem de ST_Subdivide)",
+        ),
+        sa.Column(
+            "geom",
+            Geometry("GEOMETRY", srid=4326, spatial_index=False),
+            nullable=False,
+            comment="Parte da geometria da fazenda (SRID 4326)",
+        ),
+    )
+
+    # Carga inicial, antes do índice (mais rápido que mantê-lo linha a linha)
+    op.execute(f"""
+        INSERT INTO fazendas_partes (fazenda_id, parte, geom)
+        SELECT f.id, s.parte, s.geom
+        FROM fazendas f,
+             ST_Subdivide(f.geom, {MAX_VERTICES}) WITH ORDINALITY AS s(geom, parte);
+        """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_fazendas_partes_geom
+        ON fazendas_partes USING gist (geom);
+        """)
+    # Busca por raio (ST_DWithin em geography); a expressão deve ser idêntica
+    # à de app/services/geospatial.py (`geography(geom)`)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_fazendas_partes_geog
+        ON fazendas_partes USING gist (geography(geom));
+        """)
+
+    # Inserções (INSERT, COPY do seed, publicação do staging): um trigger por
+    # comando, que subdivide todas as linhas novas de uma vez (tabela de
+    # transição), em vez de um por linha
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION fazendas_partes_inserir() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO fazendas_partes (fazenda_id, parte, geom)
+            SELECT n.id, s.parte, s.geom
+            FROM novas n,
+                 ST_Subdivide(n.geom, {MAX_VERTICES}) WITH ORDINALITY AS s(geom, parte);
+            RETURN NULL;
+        END;
+        $$;
+        """)
+    op.execute("""
+        CREATE TRIGGER trg_fazendas_partes_inserir
+        AFTER INSERT ON fazendas
+        REFERENCING NEW TABLE AS novas
+        FOR EACH STATEMENT EXECUTE FUNCTION fazendas_partes_inserir();
+        """)
+
+    # Atualizações: só quando a geometria muda de fato (o seed incremental
+    # reescreve todas as colunas das fazendas alteradas); remoções seguem pelo
+    # ON DELETE CASCADE
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION fazendas_partes_atualizar() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM fazendas_partes WHERE fazenda_id = NEW.id;
+            INSERT INTO fazendas_partes (fazenda_id, parte, geom)
+            SELECT NEW.id, s.parte, s.geom
+            FROM ST_Subdivide(NEW.geom, {MAX_VERTICES}) WITH ORDINALITY AS s(geom, parte);
+            RETURN NULL;
+        END;
+        $$;
+        """)
+    op.execute("""
+        CREATE TRIGGER trg_fazendas_partes_atualizar
+        AFTER UPDATE OF geom ON fazendas
+        FOR EACH ROW WHEN (OLD.geom IS DISTINCT FROM NEW.geom)
+        EXECUTE FUNCTION fazendas_partes_atualizar();
+        """)
+
+    op.execute("ANALYZE fazendas_partes;")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_fazendas_partes_atualizar ON fazendas;")
+    op.execute("DROP TRIGGER IF EXISTS trg_fazendas_partes_inserir ON fazendas;")
+    op.execute("DROP FUNCTION IF EXISTS fazendas_partes_atualizar();")
+    op.execute("DROP FUNCTION IF EXISTS fazendas_partes_inserir();")
+    op.drop_table("fazendas_partes")
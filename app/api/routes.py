@@ -1,16 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
-from app.db.session import SessionLocal
-from app.schemas.fazenda import BuscaAreaIn, FazendaOut, BuscaPontoIn, BuscaRaioIn
-from app.schemas.pagination import PageResponse
-from app.services.geospatial import (
+from app.core.config import AOI_SUBDIVIDE_VERTICES
+from app.core.responses import RawJSONResponse
+from app.db.session import AsyncSessionLocal
+from app.schemas.fazenda import (
+    BuscaAreaIn,
+    FazendaOut,
+    FazendaInterseccaoOut,
+    FazendaProximaOut,
+    BuscaPoligonoIn,
+    BuscaPontoIn,
+    BuscaPontosIn,
+    BuscaPontosOut,
+    BuscaRaioIn,
+    FormatoExport,
+    GeomDetail,
+    busca_pontos_json,
+)
+from app.schemas.pagination import PageResponse, TotalMode, page_json
+from app.services.export import (
+    MEDIA_TYPES,
+    exportar_por_area,
+    exportar_por_ponto,
+    exportar_por_raio,
+)
+from app.services.cache import result_cache
+from app.services.etag import etag_corresponde
+from app.services.tile_cache import tile_cache
+from app.services.tiles import obter_tile
+from app.services.geospatial_async import (
     buscar_fazendas_por_area,
+    buscar_fazendas_por_poligono,
+    buscar_fazendas_por_pontos,
     obter_fazenda_por_id,
     buscar_fazendas_por_ponto,
     buscar_fazendas_por_raio,
+    buscar_fazendas_proximas,
+    etag_busca,
+    etag_fazenda,
 )
+from app.services.geospatial import resolver_campos
 
 # -------------------- Logger --------------------
 logger = logging.getLogger("routes")
@@ -24,15 +58,82 @@ router = APIRouter(
 
 
 # -------------------- Dependency --------------------
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+# -------------------- Helpers --------------------
+def nao_modificado(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def precondicao_falhou(etag: str) -> Response:
+    """`If-None-Match` atendido num POST: pela RFC 9110 (13.1.2), 304 só vale
+    para GET/HEAD; nos demais métodos a resposta é 412."""
+    return Response(
+        status_code=status.HTTP_412_PRECONDITION_FAILED, headers={"ETag": etag}
+    )
+
+
+IF_NONE_MATCH = Header(
+    None,
+    alias="If-None-Match",
+    description="ETag de uma resposta anterior; se ainda válida, retorna 304",
+)
+
+IF_NONE_MATCH_BUSCA = Header(
+    None,
+    alias="If-None-Match",
+    description="ETag de uma busca anterior; se ainda válida, retorna 412 "
+    "(Precondition Failed) sem executar a busca: a resposta em cache do "
+    "cliente continua atual",
+)
+
+FIELDS = Query(
+    None,
+    description="Campos a retornar, separados por vírgula (ex.: "
+    "`id,cod_imovel,municipio,num_area`); `id` é sempre incluído e a geometria "
+    "só vem se `geom` estiver na lista. Colunas não pedidas não são lidas.",
+)
+
+INCLUDE_GEOM = Query(
+    True,
+    description="`false` omite a geometria (a coluna não é lida nem serializada)",
+)
 
 
 # -------------------- Endpoints --------------------
+@router.get(
+    "/cache/stats",
+    summary="Estatísticas do cache de resultados das buscas",
+)
+async def estatisticas_cache():
+    return result_cache.stats()
+
+
+@router.get(
+    "/tiles/stats",
+    summary="Estatísticas do cache de tiles",
+)
+async def estatisticas_tiles():
+    return tile_cache.stats()
+
+
+@router.get(
+    "/tiles/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    responses={
+        200: {
+            "description": "Tile vetorial (camada `fazendas`)",
+            "content": {"application/vnd.mapbox-vector-tile": {}},
+        }
+    },
+    summary="Tile vetorial (MVT) das fazendas",
+)
+async def tile_fazendas(z: int, x: int, y: int, db: AsyncSession = Depends(get_db)):
+    tile = await obter_tile(db, z, x, y)
+    return Response(content=tile, media_type="application/vnd.mapbox-vector-tile")
 
 
 @router.get(
@@ -41,9 +142,31 @@ def get_db() -> Session:
     status_code=status.HTTP_200_OK,
     summary="Buscar fazenda por ID",
 )
-def obter_fazenda(id: int, db: Session = Depends(get_db)):
+async def obter_fazenda(
+    id: int,
+    detail: GeomDetail = Query(
+        GeomDetail.full,
+        description="Detalhe da geometria: `full`, `medium`, `low` "
+        "(simplificadas) ou `none` (sem geometria)",
+    ),
+    if_none_match: Optional[str] = IF_NONE_MATCH,
+    db: AsyncSession = Depends(get_db),
+):
     try:
-        fazenda = obter_fazenda_por_id(db, id)
+        etag = await etag_fazenda(db, id, detail)
+        if etag is not None and etag_corresponde(if_none_match, etag):
+            logger.info(
+                "fazenda_nao_modificada",
+                extra={
+                    "method": "GET",
+                    "path": f"/fazendas/{id}",
+                    "status_code": 304,
+                    "id": id,
+                },
+            )
+            return nao_modificado(etag)
+
+        fazenda = await obter_fazenda_por_id(db, id, detail) if etag else None
         if not fazenda:
             logger.warning(
                 "fazenda_nao_encontrada",
@@ -60,7 +183,7 @@ def obter_fazenda(id: int, db: Session = Depends(get_db)):
                 "id": id,
             },
         )
-        return fazenda
+        return RawJSONResponse(fazenda, headers={"ETag": etag})
     except Exception as exc:
         logger.exception(
             "erro_ao_buscar_fazenda", extra={"method": "GET", "path": f"/fazendas/{id}"}
@@ -74,18 +197,55 @@ def obter_fazenda(id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_200_OK,
     summary="Buscar fazendas por ponto geográfico",
 )
-def busca_por_ponto(
+async def busca_por_ponto(
     payload: BuscaPontoIn,
     limit: int = Query(10, ge=1, le=100, description="Quantidade máxima de registros"),
     offset: int = Query(0, ge=0, description="Deslocamento para paginação"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor opaco (`next_cursor` da página anterior); "
+        "quando informado, `offset` é ignorado",
+    ),
+    total: TotalMode = Query(
+        TotalMode.exact,
+        description="Cálculo do total: `exact`, `estimate` (contagem com teto) "
+        "ou `none` (sem contagem)",
+    ),
+    detail: GeomDetail = Query(
+        GeomDetail.full,
+        description="Detalhe da geometria: `full`, `medium`, `low` "
+        "(simplificadas) ou `none` (sem geometria)",
+    ),
+    fields: Optional[str] = FIELDS,
+    include_geom: bool = INCLUDE_GEOM,
+    if_none_match: Optional[str] = IF_NONE_MATCH_BUSCA,
+    db: AsyncSession = Depends(get_db),
 ):
-    result = buscar_fazendas_por_ponto(
+    campos = resolver_campos(fields, include_geom)
+    etag = await etag_busca(
+        db,
+        "ponto",
+        **payload.model_dump(),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        total=total,
+        detail=detail,
+        campos=campos,
+    )
+    if etag_corresponde(if_none_match, etag):
+        return precondicao_falhou(etag)
+
+    result = await buscar_fazendas_por_ponto(
         db=db,
         latitude=payload.latitude,
         longitude=payload.longitude,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total,
+        detail=detail,
+        campos=campos,
     )
 
     logger.info(
@@ -98,10 +258,48 @@ def busca_por_ponto(
             "longitude": payload.longitude,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
             "total": result["total"],
+            "total_mode": result["total_mode"],
+            "detail": detail,
+            "fields": campos,
         },
     )
-    return result
+    return RawJSONResponse(page_json(result), headers={"ETag": etag})
+
+
+@router.post(
+    "/busca-pontos",
+    response_model=BuscaPontosOut,
+    status_code=status.HTTP_200_OK,
+    summary="Buscar fazendas para um lote de pontos",
+)
+async def busca_por_pontos(
+    payload: BuscaPontosIn,
+    detail: GeomDetail = Query(
+        GeomDetail.none,
+        description="Detalhe da geometria das fazendas (com `incluir_atributos`)",
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await buscar_fazendas_por_pontos(
+        db=db,
+        pontos=[(p.latitude, p.longitude) for p in payload.pontos],
+        incluir_atributos=payload.incluir_atributos,
+        detail=detail,
+    )
+
+    logger.info(
+        "busca_por_pontos_executada",
+        extra={
+            "method": "POST",
+            "path": "/fazendas/busca-pontos",
+            "status_code": 200,
+            "pontos": len(payload.pontos),
+            "incluir_atributos": payload.incluir_atributos,
+        },
+    )
+    return RawJSONResponse(busca_pontos_json(result))
 
 
 @router.post(
@@ -110,19 +308,56 @@ def busca_por_ponto(
     status_code=status.HTTP_200_OK,
     summary="Buscar fazendas por raio",
 )
-def busca_por_raio(
+async def busca_por_raio(
     payload: BuscaRaioIn,
     limit: int = Query(10, ge=1, le=100, description="Quantidade máxima de registros"),
     offset: int = Query(0, ge=0, description="Deslocamento para paginação"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor opaco (`next_cursor` da página anterior); "
+        "quando informado, `offset` é ignorado",
+    ),
+    total: TotalMode = Query(
+        TotalMode.exact,
+        description="Cálculo do total: `exact`, `estimate` (contagem com teto) "
+        "ou `none` (sem contagem)",
+    ),
+    detail: GeomDetail = Query(
+        GeomDetail.full,
+        description="Detalhe da geometria: `full`, `medium`, `low` "
+        "(simplificadas) ou `none` (sem geometria)",
+    ),
+    fields: Optional[str] = FIELDS,
+    include_geom: bool = INCLUDE_GEOM,
+    if_none_match: Optional[str] = IF_NONE_MATCH_BUSCA,
+    db: AsyncSession = Depends(get_db),
 ):
-    result = buscar_fazendas_por_raio(
+    campos = resolver_campos(fields, include_geom)
+    etag = await etag_busca(
+        db,
+        "raio",
+        **payload.model_dump(),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        total=total,
+        detail=detail,
+        campos=campos,
+    )
+    if etag_corresponde(if_none_match, etag):
+        return precondicao_falhou(etag)
+
+    result = await buscar_fazendas_por_raio(
         db=db,
         latitude=payload.latitude,
         longitude=payload.longitude,
         raio_km=payload.raio_km,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total,
+        detail=detail,
+        campos=campos,
     )
 
     logger.info(
@@ -136,10 +371,159 @@ def busca_por_raio(
             "raio_km": payload.raio_km,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
+            "total": result["total"],
+            "total_mode": result["total_mode"],
+            "detail": detail,
+            "fields": campos,
+        },
+    )
+    return RawJSONResponse(page_json(result), headers={"ETag": etag})
+
+
+@router.post(
+    "/busca-proximas",
+    response_model=PageResponse[FazendaProximaOut],
+    status_code=status.HTTP_200_OK,
+    summary="Buscar as fazendas mais próximas de um ponto",
+    description="Retorna as `limit` fazendas mais próximas do ponto, ordenadas "
+    "pela distância geodésica (`distancia_m`, 0 para fazendas que contêm o "
+    "ponto). Use `next_cursor` para as próximas; `total` não é calculado.",
+)
+async def busca_proximas(
+    payload: BuscaPontoIn,
+    limit: int = Query(10, ge=1, le=100, description="Quantidade de fazendas (k)"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor opaco (`next_cursor` da página anterior)"
+    ),
+    detail: GeomDetail = Query(
+        GeomDetail.full,
+        description="Detalhe da geometria: `full`, `medium`, `low` "
+        "(simplificadas) ou `none` (sem geometria)",
+    ),
+    fields: Optional[str] = FIELDS,
+    include_geom: bool = INCLUDE_GEOM,
+    if_none_match: Optional[str] = IF_NONE_MATCH_BUSCA,
+    db: AsyncSession = Depends(get_db),
+):
+    campos = resolver_campos(fields, include_geom)
+    etag = await etag_busca(
+        db,
+        "proximas",
+        **payload.model_dump(),
+        limit=limit,
+        cursor=cursor,
+        detail=detail,
+        campos=campos,
+    )
+    if etag_corresponde(if_none_match, etag):
+        return precondicao_falhou(etag)
+
+    result = await buscar_fazendas_proximas(
+        db=db,
+        latitude=payload.latitude,
+        longitude=payload.longitude,
+        limit=limit,
+        cursor=cursor,
+        detail=detail,
+        campos=campos,
+    )
+
+    logger.info(
+        "busca_proximas_executada",
+        extra={
+            "method": "POST",
+            "path": "/fazendas/busca-proximas",
+            "status_code": 200,
+            "latitude": payload.latitude,
+            "longitude": payload.longitude,
+            "limit": limit,
+            "cursor": cursor,
+            "detail": detail,
+            "fields": campos,
+        },
+    )
+    return RawJSONResponse(page_json(result), headers={"ETag": etag})
+
+
+@router.post(
+    "/busca-poligono",
+    response_model=PageResponse[FazendaInterseccaoOut],
+    status_code=status.HTTP_200_OK,
+    summary="Buscar fazendas que intersectam uma área de interesse",
+    description="Retorna as fazendas que intersectam o polígono informado, com "
+    "a área da interseção (ha) e os percentuais da fazenda e da AOI cobertos.",
+)
+async def busca_poligono(
+    payload: BuscaPoligonoIn,
+    limit: int = Query(10, ge=1, le=100, description="Quantidade máxima de registros"),
+    offset: int = Query(0, ge=0, description="Deslocamento para paginação"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor opaco (`next_cursor` da página anterior); "
+        "quando informado, `offset` é ignorado",
+    ),
+    total: TotalMode = Query(
+        TotalMode.exact,
+        description="Cálculo do total: `exact`, `estimate` (contagem com teto) "
+        "ou `none` (sem contagem)",
+    ),
+    detail: GeomDetail = Query(
+        GeomDetail.full,
+        description="Detalhe da geometria: `full`, `medium`, `low` "
+        "(simplificadas) ou `none` (sem geometria)",
+    ),
+    fields: Optional[str] = FIELDS,
+    include_geom: bool = INCLUDE_GEOM,
+    if_none_match: Optional[str] = IF_NONE_MATCH_BUSCA,
+    db: AsyncSession = Depends(get_db),
+):
+    campos = resolver_campos(fields, include_geom)
+    geojson = payload.geojson()
+    etag = await etag_busca(
+        db,
+        "poligono",
+        geometria=geojson,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        total=total,
+        detail=detail,
+        campos=campos,
+    )
+    if etag_corresponde(if_none_match, etag):
+        return precondicao_falhou(etag)
+
+    vertices = payload.vertices()
+    result = await buscar_fazendas_por_poligono(
+        db=db,
+        geojson=geojson,
+        subdividir=vertices > AOI_SUBDIVIDE_VERTICES,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        total_mode=total,
+        detail=detail,
+        campos=campos,
+    )
+
+    logger.info(
+        "busca_poligono_executada",
+        extra={
+            "method": "POST",
+            "path": "/fazendas/busca-poligono",
+            "status_code": 200,
+            "vertices": vertices,
+            "limit": limit,
+            "offset": offset,
+            "cursor": cursor,
             "total": result["total"],
+            "total_mode": result["total_mode"],
+            "detail": detail,
+            "fields": campos,
         },
     )
-    return result
+    return RawJSONResponse(page_json(result), headers={"ETag": etag})
 
 
 @router.post(
@@ -148,18 +532,55 @@ def busca_por_raio(
     status_code=status.HTTP_200_OK,
     summary="Buscar fazendas por área",
 )
-def busca_area(
+async def busca_area(
     payload: BuscaAreaIn,
     limit: int = Query(10, ge=1, le=100, description="Quantidade máxima de registros"),
     offset: int = Query(0, ge=0, description="Deslocamento para paginação"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor opaco (`next_cursor` da página anterior); "
+        "quando informado, `offset` é ignorado",
+    ),
+    total: TotalMode = Query(
+        TotalMode.exact,
+        description="Cálculo do total: `exact`, `estimate` (contagem com teto) "
+        "ou `none` (sem contagem)",
+    ),
+    detail: GeomDetail = Query(
+        GeomDetail.full,
+        description="Detalhe da geometria: `full`, `medium`, `low` "
+        "(simplificadas) ou `none` (sem geometria)",
+    ),
+    fields: Optional[str] = FIELDS,
+    include_geom: bool = INCLUDE_GEOM,
+    if_none_match: Optional[str] = IF_NONE_MATCH_BUSCA,
+    db: AsyncSession = Depends(get_db),
 ):
-    result = buscar_fazendas_por_area(
+    campos = resolver_campos(fields, include_geom)
+    etag = await etag_busca(
+        db,
+        "area",
+        **payload.model_dump(),
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        total=total,
+        detail=detail,
+        campos=campos,
+    )
+    if etag_corresponde(if_none_match, etag):
+        return precondicao_falhou(etag)
+
+    result = await buscar_fazendas_por_area(
         db=db,
         area_min=payload.area_min,
         area_max=payload.area_max,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        total_mode=total,
+        detail=detail,
+        campos=campos,
     )
 
     logger.info(
@@ -172,7 +593,119 @@ def busca_area(
             "area_max": payload.area_max,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
             "total": result["total"],
+            "total_mode": result["total_mode"],
+            "detail": detail,
+            "fields": campos,
         },
     )
-    return result
+    return RawJSONResponse(page_json(result), headers={"ETag": etag})
+
+
+# -------------------- Exportação (streaming) --------------------
+EXPORT_RESPONSES = {
+    200: {
+        "description": "Features GeoJSON em NDJSON ou FeatureCollection",
+        "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+    }
+}
+
+
+@router.post(
+    "/busca-ponto/export",
+    response_class=StreamingResponse,
+    responses=EXPORT_RESPONSES,
+    summary="Exportar todas as fazendas que contêm um ponto (streaming)",
+)
+async def exportar_ponto(
+    payload: BuscaPontoIn,
+    formato: FormatoExport = Query(
+        FormatoExport.ndjson,
+        description="`ndjson` (uma Feature por linha) ou `geojson` "
+        "(FeatureCollection enviada em partes)",
+    ),
+    detail: GeomDetail = Query(GeomDetail.full, description="Detalhe da geometria"),
+):
+    logger.info(
+        "exportacao_por_ponto_iniciada",
+        extra={
+            "method": "POST",
+            "path": "/fazendas/busca-ponto/export",
+            "latitude": payload.latitude,
+            "longitude": payload.longitude,
+            "formato": formato,
+            "detail": detail,
+        },
+    )
+    return StreamingResponse(
+        exportar_por_ponto(payload.latitude, payload.longitude, formato, detail),
+        media_type=MEDIA_TYPES[formato],
+    )
+
+
+@router.post(
+    "/busca-raio/export",
+    response_class=StreamingResponse,
+    responses=EXPORT_RESPONSES,
+    summary="Exportar todas as fazendas dentro de um raio (streaming)",
+)
+async def exportar_raio(
+    payload: BuscaRaioIn,
+    formato: FormatoExport = Query(
+        FormatoExport.ndjson,
+        description="`ndjson` (uma Feature por linha) ou `geojson` "
+        "(FeatureCollection enviada em partes)",
+    ),
+    detail: GeomDetail = Query(GeomDetail.full, description="Detalhe da geometria"),
+):
+    logger.info(
+        "exportacao_por_raio_iniciada",
+        extra={
+            "method": "POST",
+            "path": "/fazendas/busca-raio/export",
+            "latitude": payload.latitude,
+            "longitude": payload.longitude,
+            "raio_km": payload.raio_km,
+            "formato": formato,
+            "detail": detail,
+        },
+    )
+    return StreamingResponse(
+        exportar_por_raio(
+            payload.latitude, payload.longitude, payload.raio_km, formato, detail
+        ),
+        media_type=MEDIA_TYPES[formato],
+    )
+
+
+@router.post(
+    "/busca-area/export",
+    response_class=StreamingResponse,
+    responses=EXPORT_RESPONSES,
+    summary="Exportar todas as fazendas por área (streaming)",
+)
+async def exportar_area(
+    payload: BuscaAreaIn,
+    formato: FormatoExport = Query(
+        FormatoExport.ndjson,
+        description="`ndjson` (uma Feature por linha) ou `geojson` "
+        "(FeatureCollection enviada em partes)",
+    ),
+    detail: GeomDetail = Query(GeomDetail.full, description="Detalhe da geometria"),
+):
+    logger.info(
+        "exportacao_por_area_iniciada",
+        extra={
+            "method": "POST",
+            "path": "/fazendas/busca-area/export",
+            "area_min": payload.area_min,
+            "area_max": payload.area_max,
+            "formato": formato,
+            "detail": detail,
+        },
+    )
+    return StreamingResponse(
+        exportar_por_area(payload.area_min, payload.area_max, formato, detail),
+        media_type=MEDIA_TYPES[formato],
+    )
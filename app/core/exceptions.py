@@ -59,3 +59,35 @@ async def sqlalchemy_exception_handler(
             }
         },
     )
+
+
+# -------------------- Erros de domínio --------------------
+class ParametroInvalido(ValueError):
+    """Parâmetro de consulta inválido (ex.: cursor corrompido)."""
+
+
+async def parametro_invalido_handler(
+    request: Request, exc: ParametroInvalido
+) -> JSONResponse:
+    """
+    Converte erros de parâmetro da camada de serviço em 400.
+    """
+    logger.warning(
+        "Invalid parameter",
+        extra={
+            "method": request.method,
+            "path": request.url.path,
+            "status_code": 400,
+        },
+    )
+    return JSONResponse(
+        status_code=400,
+        content={
+            "error": {
+                "type": "invalid_parameter",
+                "message": str(exc),
+                "method": request.method,
+                "path": str(request.url),
+            }
+        },
+    )
@@ -1,7 +1,14 @@
 import logging
 import sys
 import json
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Optional
+
+from app.core.config import SLOW_QUERY_LOG_FILE
+
+# Id da requisição em andamento (definido pelo LoggingMiddleware)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
 class JsonFormatter(logging.Formatter):
@@ -16,6 +23,9 @@ class JsonFormatter(logging.Formatter):
         }
 
         # Contexto adicional (quando disponível)
+        request_id = request_id_var.get()
+        if request_id is not None:
+            log_record["request_id"] = request_id
         if hasattr(record, "method"):
             log_record["method"] = record.method
         if hasattr(record, "path"):
@@ -53,6 +63,7 @@ def setup_logging(level: int = logging.INFO) -> None:
     - Saída em stdout
     - Formato JSON estruturado
     - Filter de contexto de request
+    - Log de consultas lentas também em arquivo (`SLOW_QUERY_LOG_FILE`)
     """
 
     handler = logging.StreamHandler(sys.stdout)
@@ -68,4 +79,11 @@ def setup_logging(level: int = logging.INFO) -> None:
     root_logger.addHandler(handler)
     root_logger.addFilter(RequestContextFilter())
 
+    slow_logger = logging.getLogger("slow_query")
+    slow_logger.handlers.clear()
+    if SLOW_QUERY_LOG_FILE:
+        arquivo = logging.FileHandler(SLOW_QUERY_LOG_FILE)
+        arquivo.setFormatter(JsonFormatter())
+        slow_logger.addHandler(arquivo)
+
     root_logger.info("Logging configurado com sucesso")
@@ -0,0 +1,255 @@
+"""
+Métricas no formato Prometheus (`GET /metrics`).
+
+- HTTP: histograma de latência e contador de status por rota (o template da
+  rota, não a URL, para manter a cardinalidade limitada) e requisições em
+  andamento;
+- pool de conexões: conexões em uso, overflow e tempo de espera por uma
+  conexão, atualizados pelos eventos do pool;
+- serviços: tempo total e tempo de banco por chamada das funções de
+  `app.services.geospatial*` (decorador `medir_servico`).
+
+Com vários workers do uvicorn, defina `PROMETHEUS_MULTIPROC_DIR`: cada
+processo grava seus valores em arquivos próprios (sem coordenação no caminho
+quente) e o `/metrics` agrega todos na leitura.
+"""
+
+import functools
+import inspect
+import os
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.profiling import registrar_consulta
+
+MULTIPROCESSO = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+# -------------------- HTTP --------------------
+HTTP_DURACAO = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP",
+    ["method", "route"],
+)
+HTTP_REQUISICOES = Counter(
+    "http_requests_total",
+    "Requisições HTTP por status",
+    ["method", "route", "status"],
+)
+HTTP_EM_ANDAMENTO = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# -------------------- Pool de conexões --------------------
+DB_POOL_TAMANHO = Gauge(
+    "db_pool_size",
+    "Tamanho configurado do pool de conexões",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_EM_USO = Gauge(
+    "db_pool_checked_out",
+    "Conexões do pool em uso",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Conexões abertas além do tamanho do pool",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_ESPERA = Histogram(
+    "db_pool_wait_seconds",
+    "Tempo para obter uma conexão do pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+# -------------------- Serviços --------------------
+SERVICO_DURACAO = Histogram(
+    "service_duration_seconds",
+    "Duração das funções de serviço",
+    ["function"],
+)
+SERVICO_DB = Histogram(
+    "service_db_seconds",
+    "Tempo de banco (soma das consultas) por chamada de função de serviço",
+    ["function"],
+)
+DB_CONSULTAS = Counter(
+    "db_queries_total",
+    "Consultas SQL executadas, por função de serviço",
+    ["function"],
+)
+
+# Tempo de banco acumulado da chamada de serviço em andamento
+_tempo_db: ContextVar[Optional[List[float]]] = ContextVar("tempo_db", default=None)
+_servico: ContextVar[str] = ContextVar("servico", default="none")
+
+
+def medir_servico(fn: Callable) -> Callable:
+    """Registra a duração e o tempo de banco de cada chamada da função."""
+    nome = fn.__name__
+
+    def _observar(inicio: float, acumulado: List[float]) -> None:
+        SERVICO_DURACAO.labels(nome).observe(time.perf_counter() - inicio)
+        SERVICO_DB.labels(nome).observe(acumulado[0])
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def wrapper_async(*args, **kwargs):
+            acumulado = [0.0]
+            tokens = (_tempo_db.set(acumulado), _servico.set(nome))
+            inicio = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                _observar(inicio, acumulado)
+                _tempo_db.reset(tokens[0])
+                _servico.reset(tokens[1])
+
+        return wrapper_async
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        acumulado = [0.0]
+        tokens = (_tempo_db.set(acumulado), _servico.set(nome))
+        inicio = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _observar(inicio, acumulado)
+            _tempo_db.reset(tokens[0])
+            _servico.reset(tokens[1])
+
+    return wrapper
+
+
+# -------------------- Instrumentação do engine --------------------
+def _antes_da_consulta(conn, cursor, statement, parameters, context, executemany):
+    context._inicio_consulta = time.perf_counter()
+
+
+def _depois_da_consulta(conn, cursor, statement, parameters, context, executemany):
+    duracao = time.perf_counter() - context._inicio_consulta
+    DB_CONSULTAS.labels(_servico.get()).inc()
+    acumulado = _tempo_db.get()
+    if acumulado is not None:
+        acumulado[0] += duracao
+    # Mesma medição alimenta o perfil da requisição e o log de consultas lentas
+    registrar_consulta(conn, statement, parameters, context, executemany, duracao)
+
+
+def instrumentar_engine(engine: Engine, nome: str) -> None:
+    """Registra os eventos de consulta e de pool de um engine (síncrono, ou o
+    `sync_engine` de um engine assíncrono)."""
+    event.listen(engine, "before_cursor_execute", _antes_da_consulta)
+    event.listen(engine, "after_cursor_execute", _depois_da_consulta)
+
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        DB_POOL_TAMANHO.labels(nome).set(pool.size())
+
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_EM_USO.labels(nome).inc()
+        if isinstance(pool, QueuePool):
+            DB_POOL_OVERFLOW.labels(nome).set(max(pool.overflow(), 0))
+
+    def checkin(dbapi_connection, connection_record):
+        DB_POOL_EM_USO.labels(nome).dec()
+        if isinstance(pool, QueuePool):
+            DB_POOL_OVERFLOW.labels(nome).set(max(pool.overflow(), 0))
+
+    event.listen(pool, "checkout", checkout)
+    event.listen(pool, "checkin", checkin)
+
+
+def _pool_medido(base: type) -> type:
+    class PoolMedido(base):
+        """Pool que mede o tempo de espera por uma conexão."""
+
+        def _do_get(self):
+            inicio = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                DB_POOL_ESPERA.labels(self.logging_name).observe(
+                    time.perf_counter() - inicio
+                )
+
+    PoolMedido.__name__ = f"Medido{base.__name__}"
+    return PoolMedido
+
+
+QueuePoolMedido = _pool_medido(QueuePool)
+AsyncQueuePoolMedido = _pool_medido(AsyncAdaptedQueuePool)
+
+
+# -------------------- Exposição --------------------
+def gerar_metricas() -> Tuple[bytes, str]:
+    """Corpo e content-type do `/metrics` (agregando os workers, se houver)."""
+    if MULTIPROCESSO:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def encerrar_processo() -> None:
+    """Descarta os gauges `livesum` deste processo (no shutdown do worker)."""
+    if MULTIPROCESSO:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+# -------------------- Middleware --------------------
+class MetricsMiddleware:
+    """Middleware ASGI puro (sem `BaseHTTPMiddleware`) que alimenta as
+    métricas HTTP; o custo por requisição é o de dois `perf_counter` e três
+    atualizações de métricas."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = [500]
+
+        async def send_com_status(message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        em_andamento = HTTP_EM_ANDAMENTO.labels(method)
+        em_andamento.inc()
+        inicio = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_com_status)
+        finally:
+            duracao = time.perf_counter() - inicio
+            em_andamento.dec()
+            rota = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_DURACAO.labels(method, rota).observe(duracao)
+            HTTP_REQUISICOES.labels(method, rota, str(status[0])).inc()
@@ -1,49 +1,91 @@
 import logging
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+import uuid
+
+from starlette.datastructures import MutableHeaders
+
+from app.core.logging import request_id_var
+from app.core.profiling import encerrar_perfil, iniciar_perfil
 
 logger = logging.getLogger("middleware")
 
+# Aceito do cliente/proxy apenas se for curto e imprimível
+REQUEST_ID_MAX = 64
+
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+def _request_id(scope) -> str:
+    for nome, valor in scope["headers"]:
+        if nome == b"x-request-id":
+            recebido = valor.decode("latin-1")
+            if 0 < len(recebido) <= REQUEST_ID_MAX and recebido.isprintable():
+                return recebido
+            break
+    return uuid.uuid4().hex
+
+
+class LoggingMiddleware:
     """
-    Middleware para logging estruturado de requisições HTTP.
+    Middleware ASGI para logging estruturado de requisições HTTP.
+
+    - Uma linha de log por requisição (`request_finished`, ou
+      `request_failed` em caso de exceção), com método, caminho, status,
+      duração, quantidade de consultas SQL e tempo de banco;
+    - `X-Request-ID` (o recebido ou um novo UUID) na resposta e em todos os
+      logs emitidos durante a requisição (via `request_id_var`);
+    - cabeçalho `Server-Timing` com o tempo de banco e o tempo até o início
+      da resposta.
+
+    ASGI puro (sem `BaseHTTPMiddleware`): não cria uma task nem um stream
+    intermediário por requisição, respostas em streaming passam direto e as
+    contextvars definidas aqui são vistas pelo endpoint.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter()
+        request_id = _request_id(scope)
+        token_id = request_id_var.set(request_id)
+        perfil, token_perfil = iniciar_perfil()
+        status_code = [500]
 
-        logger.info(
-            "request_started",
-            extra={
-                "method": request.method,
-                "path": str(request.url),
-            },
-        )
+        async def send_com_cabecalhos(message) -> None:
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+                duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["Server-Timing"] = perfil.server_timing(duration_ms)
+            await send(message)
 
         try:
-            response = await call_next(request)
-        except Exception as exc:
+            await self.app(scope, receive, send_com_cabecalhos)
+        except Exception:
             logger.exception(
-                "request_failed",
-                extra={
-                    "method": request.method,
-                    "path": str(request.url),
-                },
+                "request_failed", extra=self._contexto(scope, perfil, start_time)
             )
-            raise exc
-
-        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            raise
+        else:
+            extra = self._contexto(scope, perfil, start_time)
+            extra["status_code"] = status_code[0]
+            logger.info("request_finished", extra=extra)
+        finally:
+            encerrar_perfil(token_perfil)
+            request_id_var.reset(token_id)
 
-        logger.info(
-            "request_finished",
-            extra={
-                "method": request.method,
-                "path": str(request.url),
-                "status_code": response.status_code,
-                "duration_ms": duration_ms,
+    @staticmethod
+    def _contexto(scope, perfil, start_time: float) -> dict:
+        return {
+            "method": scope["method"],
+            "path": scope["path"],
+            "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
+            "extra_data": {
+                "db_queries": perfil.consultas,
+                "db_ms": perfil.tempo_ms,
             },
-        )
-
-        return response
+        }
@@ -0,0 +1,144 @@
+"""
+Perfil de SQL por requisição e log de consultas lentas.
+
+Os eventos `before_cursor_execute`/`after_cursor_execute` dos engines
+(registrados em `app.core.metrics`, que chama `registrar_consulta`) somam, no
+`PerfilSQL` da requisição em andamento (uma `ContextVar`), a quantidade de
+consultas e o tempo total de banco. O middleware de logging publica esses
+valores na linha de log da requisição e no cabeçalho `Server-Timing`.
+
+Consultas acima de `SLOW_QUERY_MS` vão para o logger `slow_query` com o plano
+de `EXPLAIN (ANALYZE, BUFFERS)`, capturado na mesma conexão e isolado por um
+SAVEPOINT (um erro no EXPLAIN não aborta a transação da requisição). Só
+`SELECT`s são reexecutados, e cada texto de consulta é explicado no máximo uma
+vez a cada `SLOW_QUERY_EXPLAIN_INTERVAL` segundos.
+"""
+
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.core.config import (
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_EXPLAIN_INTERVAL,
+    SLOW_QUERY_MS,
+)
+
+logger = logging.getLogger("slow_query")
+
+# Apenas consultas de leitura podem ser reexecutadas pelo EXPLAIN ANALYZE
+SOMENTE_LEITURA = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+
+# -------------------- Perfil da requisição --------------------
+@dataclass
+class PerfilSQL:
+    """Consultas executadas e tempo de banco acumulado de uma requisição."""
+
+    consultas: int = 0
+    tempo_s: float = 0.0
+
+    @property
+    def tempo_ms(self) -> float:
+        return round(self.tempo_s * 1000, 2)
+
+    def server_timing(self, total_ms: Optional[float] = None) -> str:
+        """Valor do cabeçalho `Server-Timing` (banco e, opcionalmente, total)."""
+        valor = f'db;dur={self.tempo_ms};desc="{self.consultas} consultas"'
+        if total_ms is not None:
+            valor += f", total;dur={total_ms}"
+        return valor
+
+
+_perfil: ContextVar[Optional[PerfilSQL]] = ContextVar("perfil_sql", default=None)
+
+
+def iniciar_perfil() -> tuple:
+    """Abre um perfil para a requisição atual; retorna `(perfil, token)`."""
+    perfil = PerfilSQL()
+    return perfil, _perfil.set(perfil)
+
+
+def encerrar_perfil(token: Token) -> None:
+    _perfil.reset(token)
+
+
+# -------------------- Consultas lentas --------------------
+_ultimo_explain: Dict[str, float] = {}
+_lock_explain = threading.Lock()
+
+
+def _deve_explicar(statement: str) -> bool:
+    """Limita a um EXPLAIN por texto de consulta por intervalo."""
+    agora = time.monotonic()
+    with _lock_explain:
+        ultimo = _ultimo_explain.get(statement)
+        if ultimo is not None and agora - ultimo < SLOW_QUERY_EXPLAIN_INTERVAL:
+            return False
+        if len(_ultimo_explain) >= 1000:
+            _ultimo_explain.clear()
+        _ultimo_explain[statement] = agora
+        return True
+
+
+def _explicar(conn, statement: str, parameters) -> Optional[str]:
+    """Plano de `EXPLAIN (ANALYZE, BUFFERS)` num cursor à parte (o cursor da
+    consulta original ainda tem o resultado a ser lido)."""
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT explain_consulta_lenta")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plano = "\n".join(linha[0] for linha in cursor.fetchall())
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT explain_consulta_lenta")
+            raise
+        cursor.execute("RELEASE SAVEPOINT explain_consulta_lenta")
+        return plano
+    finally:
+        cursor.close()
+
+
+def _registrar_lenta(conn, statement: str, parameters, context, duracao_ms) -> None:
+    plano = None
+    if (
+        SLOW_QUERY_EXPLAIN
+        and not context.execution_options.get("stream_results")
+        and SOMENTE_LEITURA.match(statement)
+        and _deve_explicar(statement)
+    ):
+        try:
+            plano = _explicar(conn, statement, parameters)
+        except Exception:
+            logger.warning("slow_query_explain_failed", exc_info=True)
+
+    logger.warning(
+        "slow_query",
+        extra={
+            "duration_ms": duracao_ms,
+            "extra_data": {"statement": statement, "plan": plano},
+        },
+    )
+
+
+# -------------------- Registro de consultas --------------------
+def registrar_consulta(
+    conn, statement, parameters, context, executemany, duracao: float
+) -> None:
+    """Soma a consulta ao perfil da requisição e registra se for lenta.
+
+    Chamada pelo único par de eventos de cursor dos engines, em
+    `app.core.metrics` (que mede a duração uma vez para as métricas e o perfil).
+    """
+    perfil = _perfil.get()
+    if perfil is not None:
+        perfil.consultas += 1
+        perfil.tempo_s += duracao
+
+    duracao_ms = round(duracao * 1000, 2)
+    if SLOW_QUERY_MS > 0 and duracao_ms >= SLOW_QUERY_MS and not executemany:
+        _registrar_lenta(conn, statement, parameters, context, duracao_ms)
@@ -0,0 +1,28 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+
+class RawJSONResponse(Response):
+    """
+    Resposta cujo corpo já está codificado em JSON.
+
+    Usada quando o payload é montado a partir de GeoJSON gerado pelo PostGIS:
+    o FastAPI não revalida nem re-serializa o conteúdo (o `response_model` da
+    rota continua valendo para a documentação OpenAPI).
+    """
+
+    media_type = "application/json"
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Resposta JSON codificada com orjson.
+
+    Classe de resposta padrão da aplicação (`default_response_class`), usada
+    pelos endpoints que retornam dicts (estatísticas, health check).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import declarative_base
 from sqlalchemy import (
+    JSON,
     Column,
     Integer,
     String,
@@ -8,12 +9,33 @@ from sqlalchemy import (
     DateTime,
     CheckConstraint,
     Index,
+    ForeignKey,
 )
 from sqlalchemy.sql import func
 from geoalchemy2 import Geometry
 
 Base = declarative_base()
 
+# Tolerâncias (graus, SRID 4326) das geometrias simplificadas de `Fazenda`.
+# Mantenha em sincronia com a migration 2ec56e4d828e.
+GEOM_TOLERANCIAS = {
+    "geom_medium": 0.0001,
+    "geom_low": 0.001,
+}
+
+# Hash do conteúdo de uma fazenda (atributos + geometria), usado pelo seed
+# incremental para detectar alterações. Mantenha em sincronia com a
+# migration 5c1e7a9b2d44.
+HASH_CONTEUDO_SQL = (
+    "md5(ROW(cod_tema, nom_tema, cod_imovel, mod_fiscal, num_area, ind_status, "
+    "ind_tipo, des_condic, municipio, cod_estado, dat_criaca, dat_atuali, geom)"
+    "::text)"
+)
+
+# Máximo de vértices por parte em `fazendas_partes` (ST_Subdivide). Mantenha
+# em sincronia com a migration c4f1d8a2b6e9.
+PARTES_MAX_VERTICES = 128
+
 
 class Fazenda(Base):
     __tablename__ = "fazendas"
@@ -84,10 +106,66 @@ class Fazenda(Base):
         nullable=False,
         comment="Geometria da fazenda (SRID 4326)",
     )
+    geom_medium = Column(
+        Geometry("MULTIPOLYGON", srid=4326, spatial_index=False),
+        nullable=True,
+        comment="Geometria simplificada (detalhe médio)",
+    )
+    geom_low = Column(
+        Geometry("MULTIPOLYGON", srid=4326, spatial_index=False),
+        nullable=True,
+        comment="Geometria simplificada (detalhe baixo)",
+    )
+    hash_conteudo = Column(
+        String(32),
+        nullable=True,
+        comment="Hash dos atributos + geometria (seed incremental)",
+    )
 
     __table_args__ = (
         CheckConstraint("num_area >= 0", name="ck_fazendas_num_area_positive"),
         Index("idx_fazendas_geom", "geom", postgresql_using="gist"),
+        Index("idx_fazendas_chave", "cod_imovel", "cod_tema"),
+        # Cobertura da busca por área com `fields` (migration 9e4b2f6c1a37)
+        Index(
+            "idx_fazendas_area",
+            "num_area",
+            postgresql_include=["id", "cod_imovel", "municipio"],
+        ),
+    )
+
+
+class FazendaParte(Base):
+    """Partes de `ST_Subdivide` da geometria de cada fazenda.
+
+    Cada parte tem no máximo `PARTES_MAX_VERTICES` vértices e uma bbox justa,
+    então o índice GiST desta tabela descarta bem mais candidatos que o de
+    `fazendas.geom` (fazendas grandes e recortadas têm bboxes enormes) e os
+    testes exatos percorrem só a parte. A tabela é preenchida e mantida pelos
+    triggers de `fazendas` (migration c4f1d8a2b6e9).
+    """
+
+    __tablename__ = "fazendas_partes"
+
+    fazenda_id = Column(
+        Integer,
+        ForeignKey("fazendas.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Fazenda de origem",
+    )
+    parte = Column(
+        Integer,
+        primary_key=True,
+        comment="Número da parte (ordem de ST_Subdivide)",
+    )
+    geom = Column(
+        Geometry("GEOMETRY", srid=4326, spatial_index=False),
+        nullable=False,
+        comment="Parte da geometria da fazenda (SRID 4326)",
+    )
+
+    __table_args__ = (
+        Index("idx_fazendas_partes_geom", "geom", postgresql_using="gist"),
     )
 
 
@@ -111,3 +189,56 @@ class SeedControl(Base):
         nullable=False,
         comment="Data/hora de execução do seed",
     )
+    checksum = Column(
+        String(64),
+        nullable=True,
+        index=True,
+        comment="SHA-256 do(s) arquivo(s) carregado(s)",
+    )
+    stats = Column(
+        JSON,
+        nullable=True,
+        comment="Estatísticas da execução (inseridos, atualizados, ...)",
+    )
+
+
+class DatasetVersion(Base):
+    """Contador de versão dos dados, incrementado a cada carga do seed.
+
+    Caches (resultados, tiles, índice em memória) usam o valor como parte da
+    chave, de modo que uma nova carga os invalida.
+    """
+
+    __tablename__ = "dataset_version"
+
+    id = Column(
+        Integer,
+        primary_key=True,
+        comment="Identificador único (linha única, id=1)",
+    )
+    versao = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Versão atual dos dados",
+    )
+    atualizado_em = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="Data/hora da última carga",
+    )
+
+
+# Índice funcional para buscas por distância em metros (ST_DWithin em
+# geography); a expressão deve ser idêntica à usada nas consultas.
+Index(
+    "idx_fazendas_geog",
+    func.geography(Fazenda.geom),
+    postgresql_using="gist",
+)
+Index(
+    "idx_fazendas_partes_geog",
+    func.geography(FazendaParte.geom),
+    postgresql_using="gist",
+)
@@ -1,16 +1,30 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.core.config import DATABASE_URL
-
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+)
+from app.core.metrics import (
+    AsyncQueuePoolMedido,
+    QueuePoolMedido,
+    instrumentar_engine,
+)
 
+# -------------------- Engine síncrono (seed, scripts) --------------------
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    poolclass=QueuePoolMedido,
+    pool_logging_name="sync",
     future=True,
 )
+instrumentar_engine(engine, "sync")
 
 SessionLocal = sessionmaker(
     bind=engine,
@@ -18,3 +32,22 @@ SessionLocal = sessionmaker(
     autoflush=False,
     expire_on_commit=False,
 )
+
+
+# -------------------- Engine assíncrono (API) --------------------
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    poolclass=AsyncQueuePoolMedido,
+    pool_logging_name="async",
+)
+instrumentar_engine(async_engine.sync_engine, "async")
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
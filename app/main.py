@@ -1,14 +1,24 @@
 from contextlib import asynccontextmanager
 from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from app.core.logging import setup_logging
+from app.core.metrics import MetricsMiddleware, encerrar_processo, gerar_metricas
 from app.core.middleware import LoggingMiddleware
-from app.core.exceptions import http_exception_handler, sqlalchemy_exception_handler
+from app.core.responses import FastJSONResponse
+from app.core.exceptions import (
+    ParametroInvalido,
+    http_exception_handler,
+    parametro_invalido_handler,
+    sqlalchemy_exception_handler,
+)
+from app.db.session import AsyncSessionLocal, async_engine
+from app.services.spatial_index import indice_espacial
 from app.api import routes
 
 # -------------------- Logger --------------------
@@ -21,8 +31,13 @@ async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
     logger.info("startup", extra={"event": "app_start"})
+    if indice_espacial is not None:
+        async with AsyncSessionLocal() as db:
+            await indice_espacial.carregar(db)
     yield
     # Shutdown
+    await async_engine.dispose()
+    encerrar_processo()
     logger.info("shutdown", extra={"event": "app_stop"})
 
 
@@ -32,11 +47,13 @@ app = FastAPI(
     description="API para consulta de fazendas com PostGIS",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
 # -------------------- Middlewares --------------------
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -50,6 +67,7 @@ app.add_middleware(
 # -------------------- Exception Handlers --------------------
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
+app.add_exception_handler(ParametroInvalido, parametro_invalido_handler)
 
 
 # -------------------- Routers --------------------
@@ -64,16 +82,24 @@ app.include_router(routes.router)
     description="Verifica conectividade com o banco de dados",
     tags=["Health"],
 )
-def health_check(db: Session = Depends(routes.get_db)):
+async def health_check(db: AsyncSession = Depends(routes.get_db)):
     try:
-        db.execute(text("SELECT 1"))
-        logger.info(
-            "health_check_ok",
-            extra={"method": "GET", "path": "/health", "status_code": 200},
-        )
+        await db.execute(text("SELECT 1"))
         return {"status": "ok", "database": "connected"}
     except SQLAlchemyError as exc:
         logger.error("health_check_fail", extra={"method": "GET", "path": "/health"})
         raise HTTPException(
             status_code=503, detail="Banco de dados inacessível"
         ) from exc
+
+
+# -------------------- Métricas --------------------
+@app.get(
+    "/metrics",
+    summary="Métricas no formato Prometheus",
+    response_class=Response,
+    tags=["Health"],
+)
+async def metrics():
+    corpo, content_type = gerar_metricas()
+    return Response(content=corpo, media_type=content_type)
@@ -1,10 +1,30 @@
-from typing import Optional, Any
+from enum import Enum
+from typing import Dict, List, Optional, Any, Mapping
 from datetime import date
 
-from pydantic import BaseModel, Field, ConfigDict
-from shapely.geometry import mapping, Polygon, MultiPolygon, GeometryCollection
-from geoalchemy2.shape import to_shape
-from app.db.models import Fazenda
+import orjson
+import shapely
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator
+from shapely.geometry import shape, Polygon, MultiPolygon
+from shapely.validation import explain_validity
+from app.core.config import AOI_MAX_VERTICES, MAX_PONTOS_LOTE
+
+
+# -------------------- Enums --------------------
+class GeomDetail(str, Enum):
+    """Nível de detalhe da geometria retornada."""
+
+    full = "full"
+    medium = "medium"
+    low = "low"
+    none = "none"
+
+
+class FormatoExport(str, Enum):
+    """Formato da exportação em streaming."""
+
+    ndjson = "ndjson"
+    geojson = "geojson"
 
 
 # -------------------- Input Schemas --------------------
@@ -48,6 +68,71 @@ class BuscaAreaIn(BaseModel):
     )
 
 
+class BuscaPontosIn(BaseModel):
+    pontos: List[BuscaPontoIn] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_PONTOS_LOTE,
+        description=f"Pontos a geocodificar (máximo {MAX_PONTOS_LOTE})",
+    )
+    incluir_atributos: bool = Field(
+        False,
+        description="Inclui os atributos das fazendas encontradas em `fazendas`",
+    )
+
+
+class BuscaPoligonoIn(BaseModel):
+    _forma: Any = PrivateAttr(None)
+
+    geometria: Dict[str, Any] = Field(
+        ...,
+        example={
+            "type": "Polygon",
+            "coordinates": [
+                [[-47.1, -22.95], [-47.0, -22.95], [-47.0, -22.85], [-47.1, -22.95]]
+            ],
+        },
+        description="Área de interesse em GeoJSON (Polygon ou MultiPolygon, "
+        f"WGS84), com até {AOI_MAX_VERTICES} vértices",
+    )
+
+    @field_validator("geometria")
+    @classmethod
+    def validar_geometria(cls, valor: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            geom = shape(valor)
+        except (
+            AttributeError,
+            IndexError,
+            KeyError,
+            TypeError,
+            ValueError,
+            shapely.errors.GEOSException,
+        ) as exc:
+            raise ValueError("GeoJSON inválido") from exc
+
+        if not isinstance(geom, (Polygon, MultiPolygon)):
+            raise ValueError("A geometria deve ser um Polygon ou MultiPolygon")
+        if geom.is_empty:
+            raise ValueError("A geometria está vazia")
+        if shapely.get_num_coordinates(geom) > AOI_MAX_VERTICES:
+            raise ValueError(f"A geometria excede {AOI_MAX_VERTICES} vértices")
+        if not geom.is_valid:
+            raise ValueError(f"Geometria inválida: {explain_validity(geom)}")
+        return valor
+
+    def model_post_init(self, __context: Any) -> None:
+        self._forma = shape(self.geometria)
+
+    def geojson(self) -> str:
+        """GeoJSON normalizado pelo Shapely (chave de cache/ETag e parâmetro
+        da consulta)."""
+        return shapely.to_geojson(self._forma)
+
+    def vertices(self) -> int:
+        return shapely.get_num_coordinates(self._forma)
+
+
 # -------------------- GeoJSON Schema --------------------
 class GeoJSONGeometry(BaseModel):
     type: str = Field(..., example="MultiPolygon")
@@ -77,47 +162,87 @@ class FazendaOut(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @classmethod
-    def from_model(cls, fazenda: Fazenda) -> "FazendaOut":
-        """Converte o model Fazenda (SQLAlchemy) para schema com GeoJSON."""
-
-        geom_geojson: Optional[GeoJSONGeometry] = None
-
-        if fazenda.geom is not None:
-            shape_obj = to_shape(fazenda.geom)
-
-            # Normaliza GeometryCollection para Polygon/MultiPolygon
-            if isinstance(shape_obj, GeometryCollection):
-                polygons = [
-                    g for g in shape_obj.geoms if isinstance(g, (Polygon, MultiPolygon))
-                ]
-                if len(polygons) == 1:
-                    shape_obj = polygons[0]
-                elif len(polygons) > 1:
-                    shape_obj = MultiPolygon(polygons)
-                else:
-                    shape_obj = None
-
-            if shape_obj is not None:
-                geojson = mapping(shape_obj)
-                geom_geojson = GeoJSONGeometry(
-                    type=geojson.get("type"),
-                    coordinates=geojson.get("coordinates"),
-                )
-
-        return cls(
-            id=fazenda.id,
-            cod_tema=fazenda.cod_tema,
-            nom_tema=fazenda.nom_tema,
-            cod_imovel=fazenda.cod_imovel,
-            mod_fiscal=fazenda.mod_fiscal,
-            num_area=fazenda.num_area,
-            ind_status=fazenda.ind_status,
-            ind_tipo=fazenda.ind_tipo,
-            des_condic=fazenda.des_condic,
-            municipio=fazenda.municipio,
-            cod_estado=fazenda.cod_estado,
-            dat_criaca=fazenda.dat_criaca,
-            dat_atuali=fazenda.dat_atuali,
-            geom=geom_geojson,
-        )
+
+class FazendaProximaOut(FazendaOut):
+    distancia_m: float = Field(
+        ..., description="Distância geodésica do ponto à fazenda, em metros"
+    )
+
+
+class FazendaInterseccaoOut(FazendaOut):
+    area_interseccao_ha: float = Field(
+        ..., description="Área da interseção entre a fazenda e a AOI, em hectares"
+    )
+    percentual_fazenda: Optional[float] = Field(
+        None, description="Percentual da área da fazenda dentro da AOI"
+    )
+    percentual_aoi: Optional[float] = Field(
+        None, description="Percentual da área da AOI ocupado pela fazenda"
+    )
+
+
+class PontoResultado(BaseModel):
+    indice: int = Field(..., description="Posição do ponto na requisição")
+    fazenda_ids: List[int] = Field(
+        ..., description="IDs das fazendas que contêm o ponto"
+    )
+
+
+class BuscaPontosOut(BaseModel):
+    resultados: List[PontoResultado] = Field(
+        ..., description="Resultado por ponto, na ordem da requisição"
+    )
+    fazendas: Optional[List[FazendaOut]] = Field(
+        None,
+        description="Fazendas encontradas, sem repetição "
+        "(apenas com `incluir_atributos`)",
+    )
+
+
+# -------------------- Serialização pré-codificada --------------------
+# orjson codifica `date` em ISO 8601 e NaN como `null` nativamente, sem o
+# `default` e a varredura dos valores que o `json` da stdlib exigiria.
+def _atributos(row: Mapping[str, Any]) -> dict:
+    return {k: v for k, v in row.items() if k != "geom"}
+
+
+def _dumps(valor: Any) -> bytes:
+    return orjson.dumps(valor)
+
+
+def _geom(row: Mapping[str, Any]) -> bytes:
+    geom = row.get("geom")
+    return geom.encode() if geom is not None else b"null"
+
+
+def fazenda_json(row: Mapping[str, Any]) -> bytes:
+    """
+    Serializa uma linha (atributos + `geom` já em GeoJSON textual, gerado pelo
+    PostGIS) no mesmo formato de `FazendaOut`, sem materializar coordenadas
+    em objetos Python: a geometria é inserida no JSON como está.
+    """
+    atributos = _atributos(row)
+    corpo = _dumps(atributos)
+    if "geom" not in row:
+        return corpo
+    separador = b"," if atributos else b""
+    return b'%s%s"geom":%s}' % (corpo[:-1], separador, _geom(row))
+
+
+def feature_json(row: Mapping[str, Any]) -> bytes:
+    """Serializa uma linha como GeoJSON `Feature` (atributos em `properties`)."""
+    atributos = _atributos(row)
+    return b'{"type":"Feature","id":%s,"geometry":%s,"properties":%s}' % (
+        _dumps(atributos.get("id")),
+        _geom(row),
+        _dumps(atributos),
+    )
+
+
+def busca_pontos_json(result: dict) -> bytes:
+    """Codifica `BuscaPontosOut` com as fazendas já pré-codificadas."""
+    resultados = _dumps(result["resultados"])
+    if result["fazendas"] is None:
+        return b'{"resultados":%s,"fazendas":null}' % resultados
+    fazendas = b",".join(result["fazendas"])
+    return b'{"resultados":%s,"fazendas":[%s]}' % (resultados, fazendas)
@@ -1,10 +1,26 @@
-from typing import Generic, List, TypeVar
+from enum import Enum
+from typing import Generic, List, Optional, TypeVar
+import orjson
 from pydantic import BaseModel, Field
 
 # Tipo genérico para PageResponse
 T = TypeVar("T")
 
 
+class TotalMode(str, Enum):
+    """
+    Como o total de registros é calculado.
+
+    - exact: COUNT completo (dispensado quando a página já é a última).
+    - estimate: COUNT limitado a um teto; acima dele o total é um limite inferior.
+    - none: nenhuma contagem; `total` vem nulo.
+    """
+
+    exact = "exact"
+    estimate = "estimate"
+    none = "none"
+
+
 class PageResponse(BaseModel, Generic[T]):
     """
     Schema genérico de resposta paginada.
@@ -12,8 +28,10 @@ class PageResponse(BaseModel, Generic[T]):
     Attributes:
         items (List[T]): Lista de itens retornados.
         limit (int): Quantidade máxima de registros retornados.
-        offset (int): Deslocamento usado na paginação.
-        total (int): Total de registros disponíveis na query.
+        offset (Optional[int]): Deslocamento usado na paginação (None com cursor).
+        total (Optional[int]): Total de registros disponíveis na query.
+        total_mode (TotalMode): Modo que produziu o valor de `total`.
+        next_cursor (Optional[str]): Cursor opaco para a próxima página.
     """
 
     items: List[T] = Field(..., description="Lista de itens da página")
@@ -22,7 +40,31 @@ class PageResponse(BaseModel, Generic[T]):
         description="Quantidade máxima de registros retornados na página",
         example=10,
     )
-    offset: int = Field(..., description="Deslocamento usado para paginação", example=0)
-    total: int = Field(
-        ..., description="Total de registros disponíveis na consulta", example=125
+    offset: Optional[int] = Field(
+        None,
+        description="Deslocamento usado para paginação (nulo em modo cursor)",
+        example=0,
+    )
+    total: Optional[int] = Field(
+        None, description="Total de registros disponíveis na consulta", example=125
     )
+    total_mode: TotalMode = Field(
+        TotalMode.exact,
+        description="Modo que produziu `total`: `exact`, `estimate` (limite "
+        "inferior, ex.: 1000 = '1000+') ou `none` (não contado)",
+        example=TotalMode.exact,
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor opaco para buscar a próxima página (nulo na última)",
+        example="eyJpZCI6MTIzfQ",
+    )
+
+
+def page_json(result: dict) -> bytes:
+    """
+    Codifica o payload paginado cujos `items` já são fragmentos JSON
+    (ver `fazenda_json`), sem revalidar nem re-serializar os itens.
+    """
+    meta = orjson.dumps({k: v for k, v in result.items() if k != "items"})
+    return b'{"items":[%s],%s' % (b",".join(result["items"]), meta[1:])
@@ -0,0 +1,140 @@
+"""
+Cache de resultados das buscas.
+
+Os dados só mudam quando o seed roda, então resultados idênticos podem ser
+reaproveitados. As chaves incluem a versão dos dados (`dataset_version`): uma
+nova carga torna todas as entradas anteriores inalcançáveis, e elas são
+descartadas assim que a versão nova é vista.
+
+`ResultCache` é o contrato; `LRUTTLCache` é a implementação em processo
+(limitada em entradas e com expiração), e `NullCache` desabilita o cache.
+"""
+
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Protocol, Tuple
+
+from app.core.config import (
+    RESULT_CACHE_COORD_PRECISION,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_TTL,
+)
+
+
+class ResultCache(Protocol):
+    def get(self, chave: Hashable) -> Optional[Any]: ...
+
+    def set(self, chave: Hashable, valor: Any) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> Dict[str, Any]: ...
+
+
+class LRUTTLCache:
+    def __init__(self, max_itens: int, ttl: float) -> None:
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self._itens: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._versao: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, chave: Hashable) -> Optional[Any]:
+        self._sincronizar_versao(chave)
+        item = self._itens.get(chave)
+        if item is None:
+            self.misses += 1
+            return None
+        expira_em, valor = item
+        if time.monotonic() >= expira_em:
+            del self._itens[chave]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._itens.move_to_end(chave)
+        self.hits += 1
+        return valor
+
+    def set(self, chave: Hashable, valor: Any) -> None:
+        self._sincronizar_versao(chave)
+        self._itens[chave] = (time.monotonic() + self.ttl, valor)
+        self._itens.move_to_end(chave)
+        while len(self._itens) > self.max_itens:
+            self._itens.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._itens.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "versao": self._versao,
+            "itens": len(self._itens),
+            "max_itens": self.max_itens,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _sincronizar_versao(self, chave: Hashable) -> None:
+        # Chaves de `chave_busca` começam pela versão dos dados
+        versao = chave[0] if isinstance(chave, tuple) else None
+        if versao is not None and versao != self._versao:
+            self._itens.clear()
+            self._versao = versao
+
+
+class NullCache:
+    def get(self, chave: Hashable) -> Optional[Any]:
+        return None
+
+    def set(self, chave: Hashable, valor: Any) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"habilitado": False}
+
+
+# -------------------- Chaves --------------------
+# Parâmetros arredondados na chave (a consulta usa os valores originais)
+COORDENADAS = ("latitude", "longitude")
+
+
+def arredondar_coordenada(valor: float) -> float:
+    return round(valor, RESULT_CACHE_COORD_PRECISION)
+
+
+def _normalizar(nome: str, valor: Any) -> Any:
+    if isinstance(valor, Enum):
+        return valor.value
+    if nome in COORDENADAS and isinstance(valor, float):
+        return arredondar_coordenada(valor)
+    return valor
+
+
+def chave_busca(versao: int, operacao: str, **params: Any) -> tuple:
+    """Chave normalizada: (versão, operação, parâmetros ordenados por nome).
+
+    Coordenadas entram arredondadas a `RESULT_CACHE_COORD_PRECISION` casas,
+    para que pontos praticamente iguais compartilhem a entrada.
+    """
+    normalizados = tuple(
+        sorted((nome, _normalizar(nome, valor)) for nome, valor in params.items())
+    )
+    return (versao, operacao, normalizados)
+
+
+result_cache: ResultCache = (
+    LRUTTLCache(RESULT_CACHE_SIZE, RESULT_CACHE_TTL)
+    if RESULT_CACHE_SIZE > 0
+    else NullCache()
+)
@@ -0,0 +1,33 @@
+"""
+Cursores opacos para paginação keyset.
+
+O cursor é um JSON compacto codificado em base64 url-safe contendo a chave de
+ordenação do último item visto (ex.: `{"id": 123}`). Clientes não devem
+interpretar o conteúdo, apenas repassá-lo no parâmetro `cursor`.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, Iterable
+
+from app.core.exceptions import ParametroInvalido
+
+
+def encode_cursor(valores: Dict[str, Any]) -> str:
+    """Serializa a chave de ordenação em um cursor opaco."""
+    raw = json.dumps(valores, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, campos: Iterable[str] = ("id",)) -> Dict[str, Any]:
+    """Decodifica um cursor e valida que contém os campos esperados."""
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        valores = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError, UnicodeDecodeError) as exc:
+        raise ParametroInvalido("Cursor inválido") from exc
+
+    if not isinstance(valores, dict) or any(c not in valores for c in campos):
+        raise ParametroInvalido("Cursor inválido")
+    return valores
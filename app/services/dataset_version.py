@@ -0,0 +1,44 @@
+"""
+Versão dos dados de fazendas.
+
+Os dados só mudam quando o seed roda, e cada carga incrementa o contador da
+tabela `dataset_version` na mesma transação. A leitura é cacheada por
+`DATASET_VERSION_TTL` segundos para não custar uma consulta por requisição.
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import DATASET_VERSION_TTL
+from app.db.models import DatasetVersion
+
+_versao: Optional[int] = None
+_expira_em = 0.0
+
+
+async def obter_versao_dados(db: AsyncSession) -> int:
+    """Versão atual dos dados (muda a cada carga do seed)."""
+    global _versao, _expira_em
+
+    agora = time.monotonic()
+    if _versao is None or agora >= _expira_em:
+        _versao = await db.scalar(
+            select(func.coalesce(func.max(DatasetVersion.versao), 0))
+        )
+        _expira_em = agora + DATASET_VERSION_TTL
+    return _versao
+
+
+def incrementar_versao_dados(db: Session) -> None:
+    """Incrementa a versão dos dados; chamar na transação da carga."""
+    result = db.execute(
+        update(DatasetVersion)
+        .where(DatasetVersion.id == 1)
+        .values(versao=DatasetVersion.versao + 1, atualizado_em=func.now())
+    )
+    if result.rowcount == 0:
+        db.add(DatasetVersion(id=1, versao=1))
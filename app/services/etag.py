@@ -0,0 +1,34 @@
+"""
+ETags das respostas de fazendas.
+
+O conteúdo de uma resposta só muda quando os dados mudam (nova carga do seed,
+ver `dataset_version`) ou, no detalhe de uma fazenda, quando a linha é
+atualizada (`dat_atuali`). As ETags são derivadas desses valores e dos
+parâmetros da requisição, então o `If-None-Match` é avaliado antes de carregar
+ou serializar qualquer geometria.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+
+def gerar_etag(*partes: Any) -> str:
+    """ETag forte (entre aspas) a partir de valores determinísticos."""
+    digest = hashlib.blake2b(repr(partes).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_corresponde(if_none_match: Optional[str], etag: str) -> bool:
+    """Avalia o cabeçalho `If-None-Match` (lista de ETags ou `*`).
+
+    Segue a comparação fraca exigida pela RFC 9110 para `If-None-Match`:
+    o prefixo `W/` é ignorado. Com correspondência, a rota responde 304 em
+    GET/HEAD e 412 nos demais métodos (as buscas via POST).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
@@ -0,0 +1,84 @@
+"""
+Exportação em streaming dos resultados de busca (sem paginação).
+
+As linhas são lidas por um cursor server-side (`AsyncSession.stream` com
+`yield_per`) e escritas em blocos, de modo que a memória fica constante
+independentemente do tamanho do resultado. Cada exportação abre a própria
+sessão, que vive enquanto o corpo da resposta está sendo enviado.
+"""
+
+import logging
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import Select
+
+from app.core.config import EXPORT_CHUNK_SIZE
+from app.db.models import Fazenda
+from app.db.session import AsyncSessionLocal
+from app.schemas.fazenda import FormatoExport, GeomDetail, feature_json
+from app.services.geospatial import consulta_area, consulta_ponto, consulta_raio
+
+logger = logging.getLogger("export")
+
+MEDIA_TYPES = {
+    FormatoExport.ndjson: "application/x-ndjson",
+    FormatoExport.geojson: "application/geo+json",
+}
+
+
+async def exportar(query: Select, formato: FormatoExport) -> AsyncIterator[bytes]:
+    """Gera o corpo da exportação: NDJSON (uma Feature por linha) ou uma
+    FeatureCollection GeoJSON enviada em partes."""
+    query = query.order_by(Fazenda.id).execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    total = 0
+
+    if formato == FormatoExport.geojson:
+        yield b'{"type":"FeatureCollection","features":['
+
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query)
+            async for linhas in result.mappings().partitions():
+                features = [feature_json(linha) for linha in linhas]
+                if formato == FormatoExport.ndjson:
+                    yield b"\n".join(features) + b"\n"
+                else:
+                    yield (b"," if total else b"") + b",".join(features)
+                total += len(features)
+    except Exception:
+        logger.exception("Exportação interrompida", extra={"total": total})
+        raise
+
+    if formato == FormatoExport.geojson:
+        yield b"]}"
+
+    logger.info("Exportação concluída", extra={"total": total})
+
+
+# -------------------- Buscas --------------------
+def exportar_por_ponto(
+    latitude: float,
+    longitude: float,
+    formato: FormatoExport,
+    detail: GeomDetail = GeomDetail.full,
+) -> AsyncIterator[bytes]:
+    return exportar(consulta_ponto(latitude, longitude, detail), formato)
+
+
+def exportar_por_raio(
+    latitude: float,
+    longitude: float,
+    raio_km: float,
+    formato: FormatoExport,
+    detail: GeomDetail = GeomDetail.full,
+) -> AsyncIterator[bytes]:
+    return exportar(consulta_raio(latitude, longitude, raio_km, detail), formato)
+
+
+def exportar_por_area(
+    area_min: Optional[float],
+    area_max: Optional[float],
+    formato: FormatoExport,
+    detail: GeomDetail = GeomDetail.full,
+) -> AsyncIterator[bytes]:
+    return exportar(consulta_area(area_min, area_max, None, detail), formato)
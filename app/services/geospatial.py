@@ -1,67 +1,599 @@
 import logging
-from typing import Optional, List
+from bisect import bisect_right
+from typing import Any, Callable, Mapping, Optional, List, Sequence, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Select, Text, TextClause, case, func, literal_column, null
+from sqlalchemy import Float, select, text, true, tuple_
+from sqlalchemy import type_coerce
 from geoalchemy2.types import Geography
 
-from app.db.models import Fazenda
-from app.schemas.fazenda import FazendaOut
+from app.core.config import AOI_SUBDIVIDE_VERTICES, TOTAL_ESTIMATE_CAP
+from app.core.exceptions import ParametroInvalido
+from app.core.metrics import medir_servico
+from app.db.models import Fazenda, FazendaParte
+from app.schemas.fazenda import GeomDetail, fazenda_json
+from app.schemas.pagination import TotalMode
+from app.services.cursor import decode_cursor, encode_cursor
 
 logger = logging.getLogger("geospatial")
 
 
 # -------------------- Helpers --------------------
-def paginate(query, limit: int, offset: int):
-    """Aplica paginação com validação mínima."""
-    offset = max(offset, 0)
-    limit = max(min(limit, 100), 1)
-    return query.limit(limit).offset(offset)
+def clamp_limit(limit: int) -> int:
+    return max(min(limit, 100), 1)
 
 
-def count_scalar(query) -> int:
+def paginate(query, limit: int, offset: int, cursor: Optional[str] = None):
+    """
+    Aplica paginação ordenada por `Fazenda.id`.
+
+    Com `cursor`, usa keyset (`id > último id visto`), cujo custo não depende
+    da profundidade da página; sem cursor, cai no LIMIT/OFFSET legado.
+    Busca um registro a mais para saber se existe próxima página.
+    """
+    query = query.order_by(Fazenda.id)
+    if cursor:
+        query = query.where(Fazenda.id > ultimo_id_do_cursor(cursor))
+    else:
+        query = query.offset(max(offset, 0))
+    return query.limit(clamp_limit(limit) + 1)
+
+
+def ultimo_id_do_cursor(cursor: str) -> int:
+    ultimo_id = decode_cursor(cursor)["id"]
+    if not isinstance(ultimo_id, int):
+        raise ParametroInvalido("Cursor inválido")
+    return ultimo_id
+
+
+def paginar_ids(
+    ids: Sequence[int], limit: int, offset: int, cursor: Optional[str] = None
+) -> Sequence[int]:
+    """Equivalente de `paginate` para uma lista ordenada de ids em memória."""
+    inicio = bisect_right(ids, ultimo_id_do_cursor(cursor)) if cursor else offset
+    return ids[max(inicio, 0) : max(inicio, 0) + clamp_limit(limit) + 1]
+
+
+def count_statement(query: Select) -> Select:
+    """Transforma uma consulta em `SELECT count(*)` mantendo os filtros."""
+    return query.with_only_columns(func.count(), maintain_column_froms=True).order_by(
+        None
+    )
+
+
+def capped_count_statement(query: Select, cap: int) -> Select:
+    """`count(*)` limitado a `cap + 1` linhas: o predicado é avaliado no máximo
+    `cap + 1` vezes, independentemente do tamanho do resultado."""
+    limitada = (
+        query.with_only_columns(literal_column("1"), maintain_column_froms=True)
+        .order_by(None)
+        .limit(cap + 1)
+    )
+    return select(func.count()).select_from(limitada.subquery())
+
+
+def count_scalar(db: Session, query: Select) -> int:
     """Conta total de registros de uma query SQLAlchemy."""
-    return query.with_entities(func.count()).order_by(None).scalar() or 0
+    return db.scalar(count_statement(query)) or 0
+
+
+def _total_pela_pagina(
+    n_linhas: int, limit: int, offset: int, cursor: Optional[str]
+) -> Optional[int]:
+    """Total deduzido da própria página quando ela é a última (sem COUNT)."""
+    if cursor or n_linhas > clamp_limit(limit) or (n_linhas == 0 and offset > 0):
+        return None
+    return offset + n_linhas
+
+
+def total_statement(
+    query: Select,
+    n_linhas: int,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+) -> Optional[Select]:
+    """Consulta de total exigida pelo modo, ou None quando é dispensável."""
+    if total_mode == TotalMode.none:
+        return None
+    if _total_pela_pagina(n_linhas, limit, offset, cursor) is not None:
+        return None
+    if total_mode == TotalMode.estimate:
+        return capped_count_statement(query, TOTAL_ESTIMATE_CAP)
+    return count_statement(query)
+
+
+def resolver_total(
+    contagem: Optional[int],
+    n_linhas: int,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+) -> Tuple[Optional[int], TotalMode]:
+    """Combina a contagem executada (se houve) com o modo pedido.
+
+    Retorna o total e o modo que efetivamente o produziu: uma estimativa que
+    não atingiu o teto é exata; acima do teto, `total` é um limite inferior
+    (`TOTAL_ESTIMATE_CAP` significa "TOTAL_ESTIMATE_CAP+").
+    """
+    if total_mode == TotalMode.none:
+        return None, TotalMode.none
+    if contagem is None:
+        return _total_pela_pagina(n_linhas, limit, offset, cursor), TotalMode.exact
+    if total_mode == TotalMode.estimate and contagem > TOTAL_ESTIMATE_CAP:
+        return TOTAL_ESTIMATE_CAP, TotalMode.estimate
+    return contagem, TotalMode.exact
+
+
+def montar_pagina(
+    fazendas: List[Mapping[str, Any]],
+    limit: int,
+    offset: int,
+    total: Optional[int],
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+) -> dict:
+    """Monta o payload paginado a partir das linhas retornadas por `paginate`.
+
+    Os itens saem como fragmentos JSON prontos (ver `fazenda_json`).
+    """
+    limit = clamp_limit(limit)
+    tem_proxima = len(fazendas) > limit
+    fazendas = fazendas[:limit]
+    return {
+        "items": [fazenda_json(f) for f in fazendas],
+        "limit": limit,
+        "offset": None if cursor else offset,
+        "total": total,
+        "total_mode": total_mode,
+        "next_cursor": (
+            encode_cursor({"id": fazendas[-1]["id"]}) if tem_proxima else None
+        ),
+    }
+
+
+def distancia_do_cursor(cursor: str) -> Tuple[float, int]:
+    """Chave (distância, id) do último item de uma página de `busca-proximas`."""
+    valores = decode_cursor(cursor, ("distancia_m", "id"))
+    distancia, ultimo_id = valores["distancia_m"], valores["id"]
+    if not isinstance(ultimo_id, int) or not isinstance(distancia, (int, float)):
+        raise ParametroInvalido("Cursor inválido")
+    return float(distancia), ultimo_id
+
+
+def montar_pagina_proximas(fazendas: List[Mapping[str, Any]], limit: int) -> dict:
+    """Página da busca por proximidade: ordenada por (distância, id), sempre
+    em modo cursor e sem total (o resultado não tem um limite natural)."""
+    limit = clamp_limit(limit)
+    tem_proxima = len(fazendas) > limit
+    fazendas = fazendas[:limit]
+    ultima = fazendas[-1] if fazendas else None
+    return {
+        "items": [fazenda_json(f) for f in fazendas],
+        "limit": limit,
+        "offset": None,
+        "total": None,
+        "total_mode": TotalMode.none,
+        "next_cursor": (
+            encode_cursor({"distancia_m": ultima["distancia_m"], "id": ultima["id"]})
+            if tem_proxima
+            else None
+        ),
+    }
+
+
+# -------------------- Projeção --------------------
+def geojson_sql(geom, max_decimais: int = 9):
+    """
+    GeoJSON (texto) gerado pelo PostGIS. GeometryCollections são reduzidas às
+    partes poligonais (Polygon se houver uma, MultiPolygon se várias, nulo se
+    nenhuma), como fazia a conversão anterior em Python (Shapely).
+    """
+    normalizada = case(
+        (
+            func.ST_GeometryType(geom) == "ST_GeometryCollection",
+            func.ST_CollectionHomogenize(func.ST_CollectionExtract(geom, 3)),
+        ),
+        else_=geom,
+    )
+    return type_coerce(
+        case(
+            (func.ST_IsEmpty(normalizada), null()),
+            else_=func.ST_AsGeoJSON(normalizada, max_decimais),
+        ),
+        Text,
+    )
+
+
+COLUNAS_GEOMETRIA = ("geom", "geom_medium", "geom_low")
+COLUNAS_INTERNAS = ("hash_conteudo",)
+ATRIBUTOS = [
+    c for c in Fazenda.__table__.c if c.name not in COLUNAS_GEOMETRIA + COLUNAS_INTERNAS
+]
+
+# Coluna de origem e casas decimais do GeoJSON por nível de detalhe. As
+# versões simplificadas são pré-calculadas no seed/migration; enquanto não
+# existirem, cai-se na geometria completa.
+DETALHES = {
+    GeomDetail.full: (Fazenda.geom, 9),
+    GeomDetail.medium: (func.coalesce(Fazenda.geom_medium, Fazenda.geom), 6),
+    GeomDetail.low: (func.coalesce(Fazenda.geom_low, Fazenda.geom), 5),
+}
+
+
+CAMPOS_ATRIBUTOS = tuple(c.name for c in ATRIBUTOS)
+
+
+def resolver_campos(
+    fields: Optional[str], include_geom: bool = True
+) -> Optional[Tuple[str, ...]]:
+    """
+    Normaliza `fields` (lista separada por vírgulas) e `include_geom` nos
+    campos a projetar, na ordem da tabela; None significa todos os atributos
+    com geometria. `id` é sempre incluído (ordenação e cursor) e `geom` só
+    quando pedido em `fields` (ou quando `fields` é omitido).
+    """
+    if fields is None:
+        return None if include_geom else CAMPOS_ATRIBUTOS
+
+    pedidos = {campo.strip() for campo in fields.split(",") if campo.strip()}
+    invalidos = pedidos - {*CAMPOS_ATRIBUTOS, "geom"}
+    if invalidos:
+        raise ParametroInvalido(f"Campos inválidos: {', '.join(sorted(invalidos))}")
+    if not include_geom:
+        pedidos.discard("geom")
+    return tuple(c for c in (*CAMPOS_ATRIBUTOS, "geom") if c in pedidos or c == "id")
+
+
+def colunas_saida(
+    detail: GeomDetail = GeomDetail.full, campos: Optional[Sequence[str]] = None
+) -> list:
+    """Colunas de saída: atributos + geometria já codificada em GeoJSON.
+
+    Com `detail=none` nenhuma coluna de geometria é lida. Com `campos` (ver
+    `resolver_campos`), só as colunas pedidas entram no SELECT e, sem `geom`,
+    a geometria nem aparece na resposta.
+    """
+    atributos = ATRIBUTOS
+    if campos is not None:
+        atributos = [c for c in ATRIBUTOS if c.name in campos]
+        if "geom" not in campos:
+            return atributos
+    if detail == GeomDetail.none:
+        return [*atributos, null().label("geom")]
+    coluna, max_decimais = DETALHES[detail]
+    return [*atributos, geojson_sql(coluna, max_decimais).label("geom")]
+
+
+# -------------------- Consultas (compartilhadas sync/async) --------------------
+def ponto_wgs84(latitude: float, longitude: float):
+    """Ponto PostGIS em SRID 4326."""
+    return func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
+
+
+def consulta_por_id(fazenda_id: int, detail: GeomDetail = GeomDetail.full) -> Select:
+    return select(*colunas_saida(detail)).where(Fazenda.id == fazenda_id)
+
+
+def consulta_dat_atuali(fazenda_id: int) -> Select:
+    """Só a data de atualização, para validar ETags sem ler a geometria."""
+    return select(Fazenda.dat_atuali).where(Fazenda.id == fazenda_id)
+
+
+def consulta_ids(
+    ids: Sequence[int],
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> Select:
+    return (
+        select(*colunas_saida(detail, campos))
+        .where(Fazenda.id.in_(ids))
+        .order_by(Fazenda.id)
+    )
+
+
+def consulta_pontos_lote() -> TextClause:
+    """
+    Geocodificação em lote: os pontos chegam como dois arrays (`lons`,
+    `lats`), são expandidos com `unnest ... WITH ORDINALITY` e cruzados
+    lateralmente com `fazendas`, em uma única consulta. Candidatas pelas
+    partes (como em `consulta_ponto`) e `ST_Contains` na fazenda. Retorna
+    (idx, id) apenas dos pontos com correspondência; `idx` começa em 1.
+    """
+    return text("""
+        SELECT p.idx, f.id
+        FROM unnest(
+            CAST(:lons AS double precision[]), CAST(:lats AS double precision[])
+        ) WITH ORDINALITY AS p(lon, lat, idx)
+        CROSS JOIN LATERAL ST_SetSRID(ST_MakePoint(p.lon, p.lat), 4326) AS pt
+        JOIN LATERAL (
+            SELECT fz.id
+            FROM fazendas fz
+            WHERE fz.id IN (
+                SELECT fp.fazenda_id
+                FROM fazendas_partes fp
+                WHERE ST_Intersects(fp.geom, pt)
+            )
+            AND ST_Contains(fz.geom, pt)
+        ) f ON true
+        ORDER BY p.idx, f.id
+        """)
+
+
+def com_partes(*filtros) -> Any:
+    """`Fazenda.id IN (...)` das fazendas com alguma parte (`fazendas_partes`)
+    que satisfaz os filtros: o índice GiST das partes seleciona os candidatos
+    e os testes exatos percorrem só partes pequenas, não a geometria inteira."""
+    return Fazenda.id.in_(select(FazendaParte.fazenda_id).where(*filtros))
+
+
+def consulta_ponto(
+    latitude: float,
+    longitude: float,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> Select:
+    """Fazendas que contêm o ponto (interior, como `ST_Contains` e o motor em
+    memória). As candidatas saem das partes por `ST_Intersects` (um ponto
+    sobre o corte entre duas partes não está contido em nenhuma delas, mas
+    toca as duas) e o `ST_Contains` na fazenda só roda para elas, descartando
+    os pontos na borda externa."""
+    ponto = ponto_wgs84(latitude, longitude)
+    return select(*colunas_saida(detail, campos)).where(
+        com_partes(func.ST_Intersects(FazendaParte.geom, ponto)),
+        func.ST_Contains(Fazenda.geom, ponto),
+    )
+
+
+def geography(geom):
+    """`geography(geom)`: mesma expressão dos índices funcionais
+    `idx_fazendas_geog` e `idx_fazendas_partes_geog`, para que o planner possa
+    usá-los (um CAST com typmod,
+    como `geom::geography(GEOMETRY,-1)`, não casa com o índice)."""
+    return func.geography(geom, type_=Geography)
+
+
+def consulta_raio(
+    latitude: float,
+    longitude: float,
+    raio_km: float,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> Select:
+    """Fazendas a até `raio_km` do ponto: a distância até a fazenda é a menor
+    distância até uma de suas partes. `ST_DWithin` em geography nas partes,
+    pelo índice funcional `idx_fazendas_partes_geog`; as bboxes justas das
+    partes dispensam um pré-filtro por bbox em geometry."""
+    ponto = geography(ponto_wgs84(latitude, longitude))
+    dentro = func.ST_DWithin(geography(FazendaParte.geom), ponto, raio_km * 1000)
+    return select(*colunas_saida(detail, campos)).where(com_partes(dentro))
+
+
+def consulta_area(
+    area_min: Optional[float] = None,
+    area_max: Optional[float] = None,
+    nom_tema: Optional[str] = None,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> Select:
+    query = select(*colunas_saida(detail, campos))
+
+    if area_min is not None:
+        query = query.where(Fazenda.num_area >= area_min)
+    if area_max is not None:
+        query = query.where(Fazenda.num_area <= area_max)
+    if nom_tema:
+        query = query.where(Fazenda.nom_tema.ilike(f"%{nom_tema}%"))
+
+    return query
+
+
+def consulta_proximas(
+    latitude: float,
+    longitude: float,
+    limit: int,
+    cursor: Optional[str] = None,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> Select:
+    """
+    K vizinhos mais próximos por distância geodésica, em duas etapas numa
+    única consulta:
+
+    1. `ORDER BY geom <-> ponto LIMIT k+1`: KNN assistido pelo índice GiST
+       `idx_fazendas_geom` (distância planar, em graus) escolhe candidatos;
+    2. a maior distância geodésica entre eles vira o raio de um `ST_DWithin`
+       em geography (índice `idx_fazendas_geog`), e o resultado é reordenado
+       pela distância exata em metros. Toda fazenda mais próxima que algum
+       candidato cai nesse raio, então os k primeiros são exatos mesmo onde a
+       ordem planar difere da geodésica.
+
+    Com `cursor`, as duas etapas só consideram fazendas depois da chave
+    (distância, id) do último item, e o raio da etapa 2 é o da página atual.
+    """
+    ponto = ponto_wgs84(latitude, longitude)
+    distancia = func.ST_Distance(geography(Fazenda.geom), geography(ponto))
+    n = clamp_limit(limit) + 1
+
+    apos_cursor = []
+    if cursor:
+        apos_cursor.append(
+            tuple_(distancia, Fazenda.id) > tuple_(*distancia_do_cursor(cursor))
+        )
+
+    candidatos = (
+        select(distancia.label("distancia"))
+        .where(*apos_cursor)
+        .order_by(Fazenda.geom.op("<->")(ponto))
+        .limit(n)
+        .subquery("knn")
+    )
+    raio = select(func.max(candidatos.c.distancia)).scalar_subquery()
+
+    distancia_m = distancia.label("distancia_m")
+    return (
+        select(*colunas_saida(detail, campos), distancia_m)
+        .where(func.ST_DWithin(geography(Fazenda.geom), geography(ponto), raio))
+        .where(*apos_cursor)
+        .order_by(distancia_m, Fazenda.id)
+        .limit(n)
+    )
+
+
+def partes_aoi(geojson: str, subdividir: bool):
+    """CTE com a área de interesse (AOI) em SRID 4326: uma linha, ou as partes
+    de `ST_Subdivide` (até `AOI_SUBDIVIDE_VERTICES` vértices cada, sem
+    sobreposição) quando `subdividir`. Partes pequenas têm bboxes justas, então
+    o índice GiST descarta mais candidatos e cada teste/interseção é barato."""
+    aoi = func.ST_SetSRID(func.ST_GeomFromGeoJSON(geojson), 4326)
+    if subdividir:
+        aoi = func.ST_Subdivide(aoi, AOI_SUBDIVIDE_VERTICES)
+    return select(aoi.label("geom")).cte("aoi_partes")
+
+
+def consulta_poligono(partes) -> Select:
+    """Fazendas que intersectam alguma parte da AOI. As partes da AOI são
+    cruzadas com as de `fazendas_partes` num join comum (não um EXISTS), para
+    que o planner percorra as poucas partes da AOI e busque as das fazendas
+    pelo índice `idx_fazendas_partes_geom`. Só `id`: paginação e total; as
+    métricas são calculadas para a página (`hidratar_poligono`)."""
+    candidatas = select(FazendaParte.fazenda_id).join(
+        partes, func.ST_Intersects(FazendaParte.geom, partes.c.geom)
+    )
+    return select(Fazenda.id).where(Fazenda.id.in_(candidatas))
+
+
+def hidratar_poligono(
+    partes,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> Callable[[Select], Select]:
+    """
+    Converte a página de ids (`paginate(consulta_poligono(...))`) na consulta
+    de saída, com as métricas de sobreposição calculadas apenas para as
+    fazendas da página:
+
+    - `area_interseccao_ha`: soma, por parte da AOI, da área geodésica da
+      interseção (as partes não se sobrepõem); quando a fazenda está inteira
+      numa parte (`ST_CoveredBy`), usa-se a própria área, sem `ST_Intersection`;
+    - `percentual_fazenda` / `percentual_aoi`: a interseção em relação à área
+      da fazenda e à da AOI.
+    """
+    area_fazenda = func.ST_Area(geography(Fazenda.geom), type_=Float)
+    area_parte = case(
+        (func.ST_CoveredBy(Fazenda.geom, partes.c.geom), area_fazenda),
+        else_=func.ST_Area(
+            geography(func.ST_Intersection(Fazenda.geom, partes.c.geom)), type_=Float
+        ),
+    )
+    # LATERAL: as áreas são calculadas uma única vez por fazenda da página
+    areas = (
+        select(
+            func.coalesce(func.sum(area_parte), 0.0, type_=Float).label("m2"),
+            area_fazenda.label("fazenda_m2"),
+        )
+        .where(func.ST_Intersects(Fazenda.geom, partes.c.geom))
+        .lateral("areas")
+    )
+    area_aoi = select(
+        func.sum(func.ST_Area(geography(partes.c.geom), type_=Float))
+    ).scalar_subquery()
+
+    def hidratar(pagina: Select) -> Select:
+        ids = pagina.subquery("pagina")
+        return (
+            select(
+                *colunas_saida(detail, campos),
+                (areas.c.m2 / 10000.0).label("area_interseccao_ha"),
+                (
+                    areas.c.m2
+                    * 100.0
+                    / func.nullif(areas.c.fazenda_m2, 0.0, type_=Float)
+                ).label("percentual_fazenda"),
+                (areas.c.m2 * 100.0 / func.nullif(area_aoi, 0.0, type_=Float)).label(
+                    "percentual_aoi"
+                ),
+            )
+            .join(ids, ids.c.id == Fazenda.id)
+            .join(areas, true())
+            .order_by(Fazenda.id)
+        )
+
+    return hidratar
+
+
+def _buscar_pagina(
+    db: Session,
+    query: Select,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+    hidratar: Optional[Callable[[Select], Select]] = None,
+) -> dict:
+    pagina = paginate(query, limit, offset, cursor)
+    if hidratar is not None:
+        pagina = hidratar(pagina)
+    items = db.execute(pagina).mappings().all()
+
+    args = (len(items), limit, offset, cursor, total_mode)
+    stmt = total_statement(query, *args)
+    contagem = (db.scalar(stmt) or 0) if stmt is not None else None
+    total, total_mode = resolver_total(contagem, *args)
+
+    return montar_pagina(items, limit, offset, total, cursor, total_mode)
 
 
 # -------------------- Obter por ID --------------------
-def obter_fazenda_por_id(db: Session, fazenda_id: int) -> Optional[FazendaOut]:
-    fazenda = db.query(Fazenda).filter(Fazenda.id == fazenda_id).first()
+@medir_servico
+def obter_fazenda_por_id(
+    db: Session, fazenda_id: int, detail: GeomDetail = GeomDetail.full
+) -> Optional[str]:
+    """Retorna a fazenda já serializada em JSON (formato `FazendaOut`)."""
+    fazenda = db.execute(consulta_por_id(fazenda_id, detail)).mappings().first()
     if fazenda:
         logger.info("Fazenda encontrada por ID", extra={"id": fazenda_id})
-        return FazendaOut.from_model(fazenda)
+        return fazenda_json(fazenda)
     logger.warning("Fazenda não encontrada", extra={"id": fazenda_id})
     return None
 
 
 # -------------------- Busca por ponto --------------------
+@medir_servico
 def buscar_fazendas_por_ponto(
     db: Session,
     latitude: float,
     longitude: float,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
 ) -> dict:
-    ponto = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
-    base_query = db.query(Fazenda).filter(func.ST_Contains(Fazenda.geom, ponto))
-
-    total = count_scalar(base_query)
-    items = paginate(base_query.order_by(Fazenda.id), limit, offset).all()
+    result = _buscar_pagina(
+        db,
+        consulta_ponto(latitude, longitude, detail, campos),
+        limit,
+        offset,
+        cursor,
+        total_mode,
+    )
 
     logger.info(
         "Busca por ponto concluída",
-        extra={"latitude": latitude, "longitude": longitude, "total": total},
+        extra={"latitude": latitude, "longitude": longitude, "total": result["total"]},
     )
 
-    return {
-        "items": [FazendaOut.from_model(f) for f in items],
-        "limit": limit,
-        "offset": offset,
-        "total": total,
-    }
+    return result
 
 
 # -------------------- Busca por raio --------------------
+@medir_servico
 def buscar_fazendas_por_raio(
     db: Session,
     latitude: float,
@@ -69,36 +601,93 @@ def buscar_fazendas_por_raio(
     raio_km: float,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
 ) -> dict:
-    ponto = func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
-    base_query = db.query(Fazenda).filter(
-        func.ST_DWithin(
-            Fazenda.geom.cast(Geography), ponto.cast(Geography), raio_km * 1000
-        )
+    result = _buscar_pagina(
+        db,
+        consulta_raio(latitude, longitude, raio_km, detail, campos),
+        limit,
+        offset,
+        cursor,
+        total_mode,
     )
 
-    total = count_scalar(base_query)
-    items = paginate(base_query.order_by(Fazenda.id), limit, offset).all()
-
     logger.info(
         "Busca por raio concluída",
         extra={
             "latitude": latitude,
             "longitude": longitude,
             "raio_km": raio_km,
-            "total": total,
+            "total": result["total"],
         },
     )
 
-    return {
-        "items": [FazendaOut.from_model(f) for f in items],
-        "limit": limit,
-        "offset": offset,
-        "total": total,
-    }
+    return result
+
+
+# -------------------- Busca por proximidade (KNN) --------------------
+@medir_servico
+def buscar_fazendas_proximas(
+    db: Session,
+    latitude: float,
+    longitude: float,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    query = consulta_proximas(latitude, longitude, limit, cursor, detail, campos)
+    result = montar_pagina_proximas(db.execute(query).mappings().all(), limit)
+
+    logger.info(
+        "Busca por proximidade concluída",
+        extra={
+            "latitude": latitude,
+            "longitude": longitude,
+            "itens": len(result["items"]),
+        },
+    )
+
+    return result
+
+
+# -------------------- Busca por polígono (AOI) --------------------
+@medir_servico
+def buscar_fazendas_por_poligono(
+    db: Session,
+    geojson: str,
+    subdividir: bool = False,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    partes = partes_aoi(geojson, subdividir)
+    result = _buscar_pagina(
+        db,
+        consulta_poligono(partes),
+        limit,
+        offset,
+        cursor,
+        total_mode,
+        hidratar_poligono(partes, detail, campos),
+    )
+
+    logger.info(
+        "Busca por polígono concluída",
+        extra={"subdividir": subdividir, "total": result["total"]},
+    )
+
+    return result
 
 
 # -------------------- Busca por área com filtros adicionais --------------------
+@medir_servico
 def buscar_fazendas_por_area(
     db: Session,
     area_min: Optional[float] = None,
@@ -106,21 +695,22 @@ def buscar_fazendas_por_area(
     nom_tema: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
 ) -> dict:
     """
     Busca fazendas filtrando por área e nome do tema.
     """
-    query = db.query(Fazenda)
-
-    if area_min is not None:
-        query = query.filter(Fazenda.num_area >= area_min)
-    if area_max is not None:
-        query = query.filter(Fazenda.num_area <= area_max)
-    if nom_tema:
-        query = query.filter(Fazenda.nom_tema.ilike(f"%{nom_tema}%"))
-
-    total = count_scalar(query)
-    items = paginate(query.order_by(Fazenda.id), limit, offset).all()
+    result = _buscar_pagina(
+        db,
+        consulta_area(area_min, area_max, nom_tema, detail, campos),
+        limit,
+        offset,
+        cursor,
+        total_mode,
+    )
 
     logger.info(
         "Busca por área concluída",
@@ -128,13 +718,8 @@ def buscar_fazendas_por_area(
             "area_min": area_min,
             "area_max": area_max,
             "nom_tema": nom_tema,
-            "total": total,
+            "total": result["total"],
         },
     )
 
-    return {
-        "items": [FazendaOut.from_model(f) for f in items],
-        "limit": limit,
-        "offset": offset,
-        "total": total,
-    }
+    return result
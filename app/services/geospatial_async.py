@@ -0,0 +1,439 @@
+"""
+Versões assíncronas (AsyncSession/asyncpg) das buscas geoespaciais.
+
+As consultas são montadas pelas mesmas funções de `app.services.geospatial`,
+de modo que os caminhos síncrono (seed/scripts) e assíncrono (API) produzem
+exatamente o mesmo SQL.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import medir_servico
+from app.schemas.fazenda import GeomDetail, fazenda_json
+from app.schemas.pagination import TotalMode
+from app.services.cache import chave_busca, result_cache
+from app.services.dataset_version import obter_versao_dados
+from app.services.etag import gerar_etag
+from app.services.geospatial import (
+    consulta_area,
+    consulta_dat_atuali,
+    consulta_ids,
+    consulta_pontos_lote,
+    consulta_por_id,
+    consulta_poligono,
+    consulta_ponto,
+    consulta_proximas,
+    consulta_raio,
+    clamp_limit,
+    count_statement,
+    hidratar_poligono,
+    montar_pagina,
+    montar_pagina_proximas,
+    paginar_ids,
+    paginate,
+    partes_aoi,
+    resolver_total,
+    total_statement,
+)
+from app.services.spatial_index import indice_espacial
+
+logger = logging.getLogger("geospatial")
+
+
+# -------------------- Helpers --------------------
+async def count_scalar(db: AsyncSession, query: Select) -> int:
+    """Conta total de registros de uma query SQLAlchemy."""
+    return (await db.scalar(count_statement(query))) or 0
+
+
+async def _buscar_pagina(
+    db: AsyncSession,
+    query: Select,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+    hidratar: Optional[Callable[[Select], Select]] = None,
+) -> dict:
+    pagina = paginate(query, limit, offset, cursor)
+    if hidratar is not None:
+        pagina = hidratar(pagina)
+    result = await db.execute(pagina)
+    items = result.mappings().all()
+
+    args = (len(items), limit, offset, cursor, total_mode)
+    stmt = total_statement(query, *args)
+    contagem = ((await db.scalar(stmt)) or 0) if stmt is not None else None
+    total, total_mode = resolver_total(contagem, *args)
+
+    return montar_pagina(items, limit, offset, total, cursor, total_mode)
+
+
+async def _buscar_pagina_ids(
+    db: AsyncSession,
+    ids: Sequence[int],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+    detail: GeomDetail,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    """Página a partir de ids já resolvidos em memória: o banco só hidrata os
+    atributos da página e o total exato sai de graça."""
+    pagina = paginar_ids(ids, limit, offset, cursor)
+    items = []
+    if pagina:
+        query = consulta_ids(pagina, detail, campos)
+        items = (await db.execute(query)).mappings().all()
+
+    total = None if total_mode == TotalMode.none else len(ids)
+    total_mode = TotalMode.none if total is None else TotalMode.exact
+    return montar_pagina(items, limit, offset, total, cursor, total_mode)
+
+
+async def _com_cache(
+    db: AsyncSession,
+    operacao: str,
+    executar: Callable[[], Awaitable[dict]],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+    detail: GeomDetail,
+    **params: Any,
+) -> dict:
+    """Executa a busca passando pelo cache de resultados (chave normalizada
+    pelos parâmetros de busca e de paginação + versão dos dados)."""
+    chave = chave_busca(
+        await obter_versao_dados(db),
+        operacao,
+        limit=clamp_limit(limit),
+        offset=None if cursor else offset,
+        cursor=cursor,
+        total_mode=total_mode,
+        detail=detail,
+        **params,
+    )
+    result = result_cache.get(chave)
+    if result is None:
+        result = await executar()
+        result_cache.set(chave, result)
+    return result
+
+
+# -------------------- ETags --------------------
+@medir_servico
+async def etag_fazenda(
+    db: AsyncSession, fazenda_id: int, detail: GeomDetail = GeomDetail.full
+) -> Optional[str]:
+    """ETag do detalhe da fazenda (ou None se ela não existe), calculada a
+    partir de `dat_atuali` e da versão dos dados, sem ler a linha completa."""
+    linha = (await db.execute(consulta_dat_atuali(fazenda_id))).first()
+    if linha is None:
+        return None
+    versao = await obter_versao_dados(db)
+    return gerar_etag(versao, "fazenda", fazenda_id, linha.dat_atuali, detail.value)
+
+
+@medir_servico
+async def etag_busca(db: AsyncSession, operacao: str, **params: Any) -> str:
+    """ETag de uma busca: o resultado só depende dos parâmetros e da versão
+    dos dados, então pode ser validada antes de executar a consulta."""
+    return gerar_etag(*chave_busca(await obter_versao_dados(db), operacao, **params))
+
+
+# -------------------- Obter por ID --------------------
+@medir_servico
+async def obter_fazenda_por_id(
+    db: AsyncSession, fazenda_id: int, detail: GeomDetail = GeomDetail.full
+) -> Optional[str]:
+    """Retorna a fazenda já serializada em JSON (formato `FazendaOut`)."""
+    fazenda = (await db.execute(consulta_por_id(fazenda_id, detail))).mappings().first()
+    if fazenda:
+        logger.info("Fazenda encontrada por ID", extra={"id": fazenda_id})
+        return fazenda_json(fazenda)
+    logger.warning("Fazenda não encontrada", extra={"id": fazenda_id})
+    return None
+
+
+# -------------------- Busca por ponto --------------------
+@medir_servico
+async def buscar_fazendas_por_ponto(
+    db: AsyncSession,
+    latitude: float,
+    longitude: float,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+
+    async def executar() -> dict:
+        if indice_espacial is not None:
+            await indice_espacial.garantir_atualizado(db)
+            ids = indice_espacial.ids_contendo_ponto(latitude, longitude)
+            return await _buscar_pagina_ids(
+                db, ids, limit, offset, cursor, total_mode, detail, campos
+            )
+        return await _buscar_pagina(
+            db,
+            consulta_ponto(latitude, longitude, detail, campos),
+            limit,
+            offset,
+            cursor,
+            total_mode,
+        )
+
+    result = await _com_cache(
+        db,
+        "ponto",
+        executar,
+        limit,
+        offset,
+        cursor,
+        total_mode,
+        detail,
+        latitude=latitude,
+        longitude=longitude,
+        campos=campos,
+    )
+
+    logger.info(
+        "Busca por ponto concluída",
+        extra={"latitude": latitude, "longitude": longitude, "total": result["total"]},
+    )
+
+    return result
+
+
+# -------------------- Busca por raio --------------------
+@medir_servico
+async def buscar_fazendas_por_raio(
+    db: AsyncSession,
+    latitude: float,
+    longitude: float,
+    raio_km: float,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    query = consulta_raio(latitude, longitude, raio_km, detail, campos)
+
+    result = await _com_cache(
+        db,
+        "raio",
+        lambda: _buscar_pagina(db, query, limit, offset, cursor, total_mode),
+        limit,
+        offset,
+        cursor,
+        total_mode,
+        detail,
+        latitude=latitude,
+        longitude=longitude,
+        raio_km=raio_km,
+        campos=campos,
+    )
+
+    logger.info(
+        "Busca por raio concluída",
+        extra={
+            "latitude": latitude,
+            "longitude": longitude,
+            "raio_km": raio_km,
+            "total": result["total"],
+        },
+    )
+
+    return result
+
+
+# -------------------- Busca por proximidade (KNN) --------------------
+@medir_servico
+async def buscar_fazendas_proximas(
+    db: AsyncSession,
+    latitude: float,
+    longitude: float,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    query = consulta_proximas(latitude, longitude, limit, cursor, detail, campos)
+
+    async def executar() -> dict:
+        linhas = (await db.execute(query)).mappings().all()
+        return montar_pagina_proximas(linhas, limit)
+
+    result = await _com_cache(
+        db,
+        "proximas",
+        executar,
+        limit,
+        0,
+        cursor,
+        TotalMode.none,
+        detail,
+        latitude=latitude,
+        longitude=longitude,
+        campos=campos,
+    )
+
+    logger.info(
+        "Busca por proximidade concluída",
+        extra={
+            "latitude": latitude,
+            "longitude": longitude,
+            "itens": len(result["items"]),
+        },
+    )
+
+    return result
+
+
+# -------------------- Busca por polígono (AOI) --------------------
+@medir_servico
+async def buscar_fazendas_por_poligono(
+    db: AsyncSession,
+    geojson: str,
+    subdividir: bool = False,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    partes = partes_aoi(geojson, subdividir)
+    query = consulta_poligono(partes)
+    hidratar = hidratar_poligono(partes, detail, campos)
+
+    result = await _com_cache(
+        db,
+        "poligono",
+        lambda: _buscar_pagina(db, query, limit, offset, cursor, total_mode, hidratar),
+        limit,
+        offset,
+        cursor,
+        total_mode,
+        detail,
+        geometria=geojson,
+        campos=campos,
+    )
+
+    logger.info(
+        "Busca por polígono concluída",
+        extra={"subdividir": subdividir, "total": result["total"]},
+    )
+
+    return result
+
+
+# -------------------- Busca por área com filtros adicionais --------------------
+@medir_servico
+async def buscar_fazendas_por_area(
+    db: AsyncSession,
+    area_min: Optional[float] = None,
+    area_max: Optional[float] = None,
+    nom_tema: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.exact,
+    detail: GeomDetail = GeomDetail.full,
+    campos: Optional[Sequence[str]] = None,
+) -> dict:
+    """
+    Busca fazendas filtrando por área e nome do tema.
+    """
+    query = consulta_area(area_min, area_max, nom_tema, detail, campos)
+
+    result = await _com_cache(
+        db,
+        "area",
+        lambda: _buscar_pagina(db, query, limit, offset, cursor, total_mode),
+        limit,
+        offset,
+        cursor,
+        total_mode,
+        detail,
+        area_min=area_min,
+        area_max=area_max,
+        nom_tema=nom_tema,
+        campos=campos,
+    )
+
+    logger.info(
+        "Busca por área concluída",
+        extra={
+            "area_min": area_min,
+            "area_max": area_max,
+            "nom_tema": nom_tema,
+            "total": result["total"],
+        },
+    )
+
+    return result
+
+
+# -------------------- Busca em lote por pontos --------------------
+@medir_servico
+async def buscar_fazendas_por_pontos(
+    db: AsyncSession,
+    pontos: List[Tuple[float, float]],
+    incluir_atributos: bool = False,
+    detail: GeomDetail = GeomDetail.full,
+) -> dict:
+    """
+    Resolve, para cada (latitude, longitude), os ids das fazendas que contêm o
+    ponto, com uma única consulta set-based (ou no índice em memória, quando
+    habilitado). Os atributos, se pedidos, são lidos uma vez por fazenda.
+    """
+    fazenda_ids: List[List[int]] = [[] for _ in pontos]
+
+    if indice_espacial is not None:
+        await indice_espacial.garantir_atualizado(db)
+        for i, (latitude, longitude) in enumerate(pontos):
+            fazenda_ids[i] = indice_espacial.ids_contendo_ponto(latitude, longitude)
+    else:
+        result = await db.execute(
+            consulta_pontos_lote(),
+            {
+                "lons": [longitude for _, longitude in pontos],
+                "lats": [latitude for latitude, _ in pontos],
+            },
+        )
+        for idx, fazenda_id in result:
+            fazenda_ids[idx - 1].append(fazenda_id)
+
+    fazendas = None
+    if incluir_atributos:
+        unicos = sorted({i for ids in fazenda_ids for i in ids})
+        fazendas = []
+        if unicos:
+            linhas = (await db.execute(consulta_ids(unicos, detail))).mappings()
+            fazendas = [fazenda_json(linha) for linha in linhas]
+
+    logger.info(
+        "Busca em lote por pontos concluída",
+        extra={
+            "pontos": len(pontos),
+            "com_fazenda": sum(1 for ids in fazenda_ids if ids),
+        },
+    )
+
+    return {
+        "resultados": [
+            {"indice": i, "fazenda_ids": ids} for i, ids in enumerate(fazenda_ids)
+        ],
+        "fazendas": fazendas,
+    }
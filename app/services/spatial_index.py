@@ -0,0 +1,123 @@
+"""
+Motor de ponto-em-polígono em memória (Shapely 2 `STRtree`).
+
+Carrega todas as geometrias uma vez, monta uma `STRtree` com as bounding
+boxes e prepara as geometrias (`shapely.prepare`), de modo que `busca-ponto`
+resolve quais fazendas contêm o ponto sem consultar o PostGIS. O banco só é
+usado depois para hidratar os atributos da página pedida.
+
+O índice guarda a versão dos dados com que foi montado e é recarregado quando
+ela muda (nova execução do seed). Habilitado com `SPATIAL_ENGINE=memory`.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import anyio.to_thread
+import numpy as np
+import shapely
+from sqlalchemy import LargeBinary, func, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import SPATIAL_ENGINE
+from app.db.models import Fazenda
+from app.services.dataset_version import obter_versao_dados
+
+logger = logging.getLogger("spatial_index")
+
+
+@dataclass(frozen=True)
+class _Dados:
+    """Índice montado: ids e geometrias (ordenados por id) e a árvore."""
+
+    ids: np.ndarray
+    geoms: np.ndarray
+    tree: shapely.STRtree
+
+
+class IndiceEspacial:
+    def __init__(self) -> None:
+        self.versao: Optional[int] = None
+        self._dados: Optional[_Dados] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def carregado(self) -> bool:
+        return self._dados is not None
+
+    def __len__(self) -> int:
+        dados = self._dados
+        return 0 if dados is None else len(dados.ids)
+
+    # -------------------- Carga --------------------
+    async def carregar(self, db: AsyncSession) -> None:
+        """Lê (id, WKB) de todas as fazendas e monta o índice."""
+        inicio = time.perf_counter()
+        versao = await obter_versao_dados(db)
+
+        ids: List[int] = []
+        wkbs: List[bytes] = []
+        result = await db.stream(
+            select(
+                Fazenda.id, type_coerce(func.ST_AsBinary(Fazenda.geom), LargeBinary)
+            ).execution_options(yield_per=5000)
+        )
+        async for linhas in result.partitions():
+            for fazenda_id, wkb in linhas:
+                ids.append(fazenda_id)
+                wkbs.append(wkb)
+
+        await anyio.to_thread.run_sync(self._montar, ids, wkbs, versao)
+        logger.info(
+            "Índice espacial carregado",
+            extra={
+                "total": len(ids),
+                "versao": versao,
+                "duration_ms": round((time.perf_counter() - inicio) * 1000, 2),
+            },
+        )
+
+    def _montar(self, ids: List[int], wkbs: List[bytes], versao: int) -> None:
+        geoms = shapely.from_wkb(np.array(wkbs, dtype=object))
+        ordem = np.argsort(ids)
+        geoms = geoms[ordem]
+        shapely.prepare(geoms)
+        dados = _Dados(
+            ids=np.asarray(ids, dtype=np.int64)[ordem],
+            geoms=geoms,
+            tree=shapely.STRtree(geoms),
+        )
+        # Troca atômica (uma única atribuição): consultas em andamento
+        # continuam com o snapshot anterior, que leram uma vez só
+        self._dados = dados
+        self.versao = versao
+
+    async def garantir_atualizado(self, db: AsyncSession) -> None:
+        """Gancho de recarga: (re)carrega se vazio ou se o seed rodou de novo."""
+        versao = await obter_versao_dados(db)
+        if self.carregado and versao == self.versao:
+            return
+        async with self._lock:
+            if not self.carregado or versao != self.versao:
+                await self.carregar(db)
+
+    # -------------------- Consulta --------------------
+    def ids_contendo_ponto(self, latitude: float, longitude: float) -> List[int]:
+        """Ids (ordenados) das fazendas cuja geometria contém o ponto."""
+        dados = self._dados
+        if dados is None:
+            return []
+        candidatos = dados.tree.query(shapely.points(longitude, latitude))
+        if len(candidatos) == 0:
+            return []
+        candidatos.sort()
+        contem = shapely.contains_xy(dados.geoms[candidatos], longitude, latitude)
+        return dados.ids[candidatos[contem]].tolist()
+
+
+indice_espacial: Optional[IndiceEspacial] = (
+    IndiceEspacial() if SPATIAL_ENGINE == "memory" else None
+)
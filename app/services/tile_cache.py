@@ -0,0 +1,119 @@
+"""
+Cache de tiles vetoriais (MVT).
+
+Dois níveis: LRU em memória e, opcionalmente, um diretório em disco
+(`TILE_CACHE_DIR`) compartilhável entre workers. As chaves incluem a versão
+dos dados: quando o seed roda de novo a versão muda, o LRU é esvaziado e os
+diretórios de versões antigas são removidos.
+"""
+
+import logging
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import anyio.to_thread
+
+from app.core.config import TILE_CACHE_DIR, TILE_CACHE_SIZE
+
+logger = logging.getLogger("tile_cache")
+
+TileKey = Tuple[int, int, int]
+
+
+class TileCache:
+    def __init__(self, max_itens: int, diretorio: Optional[str] = None) -> None:
+        self.max_itens = max_itens
+        self.diretorio = Path(diretorio) if diretorio else None
+        self._versao: Optional[int] = None
+        self._itens: "OrderedDict[TileKey, bytes]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------- API --------------------
+    async def get(self, versao: int, z: int, x: int, y: int) -> Optional[bytes]:
+        await self._sincronizar_versao(versao)
+
+        tile = self._itens.get((z, x, y))
+        if tile is not None:
+            self._itens.move_to_end((z, x, y))
+            self.hits += 1
+            return tile
+
+        if self.diretorio is not None:
+            tile = await anyio.to_thread.run_sync(self._ler_disco, versao, z, x, y)
+            if tile is not None:
+                self.disk_hits += 1
+                self._guardar((z, x, y), tile)
+                return tile
+
+        self.misses += 1
+        return None
+
+    async def set(self, versao: int, z: int, x: int, y: int, tile: bytes) -> None:
+        await self._sincronizar_versao(versao)
+        self._guardar((z, x, y), tile)
+        if self.diretorio is not None:
+            await anyio.to_thread.run_sync(self._gravar_disco, versao, z, x, y, tile)
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        return {
+            "versao": self._versao,
+            "itens": len(self._itens),
+            "max_itens": self.max_itens,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    # -------------------- Internos --------------------
+    def _guardar(self, chave: TileKey, tile: bytes) -> None:
+        self._itens[chave] = tile
+        self._itens.move_to_end(chave)
+        while len(self._itens) > self.max_itens:
+            self._itens.popitem(last=False)
+            self.evictions += 1
+
+    async def _sincronizar_versao(self, versao: int) -> None:
+        if versao == self._versao:
+            return
+        if self._versao is not None:
+            logger.info(
+                "Versão dos dados mudou; invalidando cache de tiles",
+                extra={"de": self._versao, "para": versao},
+            )
+        self._versao = versao
+        self._itens.clear()
+        if self.diretorio is not None:
+            await anyio.to_thread.run_sync(self._limpar_versoes_antigas, versao)
+
+    def _caminho(self, versao: int, z: int, x: int, y: int) -> Path:
+        return self.diretorio / str(versao) / str(z) / str(x) / f"{y}.mvt"
+
+    def _ler_disco(self, versao: int, z: int, x: int, y: int) -> Optional[bytes]:
+        try:
+            return self._caminho(versao, z, x, y).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _gravar_disco(self, versao: int, z: int, x: int, y: int, tile: bytes) -> None:
+        caminho = self._caminho(versao, z, x, y)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        temporario = caminho.with_name(f"{y}.{os.getpid()}.tmp")
+        temporario.write_bytes(tile)
+        temporario.replace(caminho)
+
+    def _limpar_versoes_antigas(self, versao: int) -> None:
+        if not self.diretorio.exists():
+            return
+        for entrada in self.diretorio.iterdir():
+            if entrada.is_dir() and entrada.name != str(versao):
+                shutil.rmtree(entrada, ignore_errors=True)
+
+
+tile_cache = TileCache(TILE_CACHE_SIZE, TILE_CACHE_DIR)
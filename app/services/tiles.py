@@ -0,0 +1,87 @@
+"""
+Tiles vetoriais (Mapbox Vector Tile) das fazendas.
+
+O filtro usa `geom && envelope` (índice GiST `idx_fazendas_geom`) e a
+geometria codificada vem das versões simplificadas conforme o zoom, o que
+reduz o custo de `ST_Transform`/`ST_AsMVTGeom` nas visões mais afastadas.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ParametroInvalido
+from app.services.dataset_version import obter_versao_dados
+from app.services.tile_cache import tile_cache
+
+logger = logging.getLogger("tiles")
+
+MAX_ZOOM = 22
+EXTENT = 4096
+BUFFER = 64
+
+# Coluna de geometria por faixa de zoom (zoom máximo inclusivo -> coluna)
+GEOMETRIA_POR_ZOOM = ((9, "geom_low"), (12, "geom_medium"))
+
+
+def coluna_para_zoom(z: int) -> str:
+    for zoom_max, coluna in GEOMETRIA_POR_ZOOM:
+        if z <= zoom_max:
+            return f"coalesce(f.{coluna}, f.geom)"
+    return "f.geom"
+
+
+def validar_tile(z: int, x: int, y: int) -> None:
+    if not 0 <= z <= MAX_ZOOM:
+        raise ParametroInvalido(f"Zoom deve estar entre 0 e {MAX_ZOOM}")
+    limite = 2**z
+    if not (0 <= x < limite and 0 <= y < limite):
+        raise ParametroInvalido(f"Tile fora dos limites para o zoom {z}")
+
+
+def tile_sql(z: int) -> str:
+    return f"""
+        WITH limites AS (
+            SELECT
+                ST_TileEnvelope(:z, :x, :y) AS env,
+                ST_Transform(
+                    ST_TileEnvelope(:z, :x, :y, margin => {BUFFER / EXTENT}), 4326
+                ) AS env_4326
+        ),
+        mvtgeom AS (
+            SELECT
+                ST_AsMVTGeom(
+                    ST_Transform({coluna_para_zoom(z)}, 3857),
+                    limites.env, {EXTENT}, {BUFFER}, true
+                ) AS geom,
+                f.id,
+                f.cod_imovel,
+                f.municipio,
+                f.num_area,
+                f.ind_status
+            FROM fazendas f, limites
+            WHERE f.geom && limites.env_4326
+        )
+        SELECT ST_AsMVT(mvtgeom.*, 'fazendas', {EXTENT}, 'geom')
+        FROM mvtgeom
+        WHERE geom IS NOT NULL
+    """
+
+
+async def gerar_tile(db: AsyncSession, z: int, x: int, y: int) -> bytes:
+    tile = await db.scalar(text(tile_sql(z)), {"z": z, "x": x, "y": y})
+    return bytes(tile or b"")
+
+
+async def obter_tile(db: AsyncSession, z: int, x: int, y: int) -> bytes:
+    """Tile MVT de (z, x, y), servido do cache quando possível."""
+    validar_tile(z, x, y)
+
+    versao = await obter_versao_dados(db)
+    tile = await tile_cache.get(versao, z, x, y)
+    if tile is None:
+        tile = await gerar_tile(db, z, x, y)
+        await tile_cache.set(versao, z, x, y, tile)
+        logger.info("Tile gerado", extra={"z": z, "x": x, "y": y, "bytes": len(tile)})
+    return tile
@@ -0,0 +1,157 @@
+"""
+Benchmark da API: cargas de trabalho em /fazendas/{id}, busca-ponto,
+busca-raio e busca-area.
+
+Cada carga dispara `--requisicoes` requisições com `--concorrencia` clientes
+e reporta throughput e latência p50/p95/p99, além da contagem por status. Por
+padrão as requisições passam pela aplicação in-process (`httpx.ASGITransport`,
+sem rede); com `--url`, vão para um servidor já em execução. O JSON de saída
+inclui o commit e os parâmetros, para comparar execuções com
+`benchmarks.comparar`.
+
+Uso:
+    python -m benchmarks.bench_api --requisicoes 2000 --concorrencia 20 \\
+        --saida resultados/$(git rev-parse --short HEAD).json
+"""
+
+import argparse
+import asyncio
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import func, select
+
+from app.db.models import Fazenda
+from app.db.session import AsyncSessionLocal, async_engine
+from benchmarks.common import imprimir, ponto_aleatorio_sp, resumir, salvar_json
+
+Requisicao = Tuple[str, str, Optional[dict]]
+
+
+def _cargas(args: argparse.Namespace, ids: List[int]) -> Dict[str, Callable]:
+    def por_id(rng: random.Random) -> Requisicao:
+        return "GET", f"/fazendas/{rng.choice(ids)}", None
+
+    def ponto(rng: random.Random) -> Requisicao:
+        latitude, longitude = ponto_aleatorio_sp(rng)
+        corpo = {"latitude": latitude, "longitude": longitude}
+        return "POST", "/fazendas/busca-ponto", corpo
+
+    def raio(rng: random.Random) -> Requisicao:
+        latitude, longitude = ponto_aleatorio_sp(rng)
+        corpo = {"latitude": latitude, "longitude": longitude, "raio_km": args.raio_km}
+        return "POST", "/fazendas/busca-raio", corpo
+
+    def area(rng: random.Random) -> Requisicao:
+        area_min = rng.uniform(0, 200)
+        corpo = {"area_min": area_min, "area_max": area_min + rng.uniform(1, 100)}
+        return "POST", "/fazendas/busca-area", corpo
+
+    return {"id": por_id, "ponto": ponto, "raio": raio, "area": area}
+
+
+async def _amostra_ids(n: int) -> List[int]:
+    async with AsyncSessionLocal() as db:
+        ids = (
+            await db.scalars(select(Fazenda.id).order_by(func.random()).limit(n))
+        ).all()
+    if not ids:
+        raise SystemExit("Base vazia: rode benchmarks.carregar_sintetico antes")
+    return list(ids)
+
+
+async def _executar(
+    cliente: httpx.AsyncClient,
+    gerar: Callable[[random.Random], Requisicao],
+    args: argparse.Namespace,
+) -> dict:
+    rng = random.Random(args.seed)
+    params = {"detail": args.detail, "total": args.total}
+    requisicoes = [gerar(rng) for _ in range(args.requisicoes)]
+    for metodo, caminho, corpo in requisicoes[: args.aquecimento]:
+        await cliente.request(metodo, caminho, json=corpo, params=params)
+
+    latencias: List[float] = []
+    status: Counter = Counter()
+    fila = iter(requisicoes)
+
+    async def trabalhador() -> None:
+        for metodo, caminho, corpo in fila:
+            inicio = time.perf_counter()
+            r = await cliente.request(metodo, caminho, json=corpo, params=params)
+            latencias.append(time.perf_counter() - inicio)
+            status[r.status_code] += 1
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabalhador() for _ in range(args.concorrencia)))
+    resumo = resumir(latencias, time.perf_counter() - inicio)
+    resumo["status"] = {str(k): v for k, v in sorted(status.items())}
+    return resumo
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> None:
+    ids = await _amostra_ids(args.amostra_ids)
+    cargas = _cargas(args, ids)
+
+    if args.url:
+        cliente = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        cliente = httpx.AsyncClient(transport=transport, base_url="http://bench")
+
+    resultados: Dict[str, dict] = {}
+    async with cliente:
+        for nome in args.cargas:
+            resultados[nome] = await _executar(cliente, cargas[nome], args)
+            imprimir(nome, {k: v for k, v in resultados[nome].items() if k != "status"})
+
+    await async_engine.dispose()
+    salvar_json(
+        args.saida,
+        {
+            "commit": _commit(),
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "parametros": {k: v for k, v in vars(args).items() if k != "saida"},
+            "resultados": resultados,
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--cargas",
+        nargs="+",
+        choices=("id", "ponto", "raio", "area"),
+        default=["id", "ponto", "raio", "area"],
+    )
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    parser.add_argument("--aquecimento", type=int, default=50)
+    parser.add_argument("--raio-km", type=float, default=10)
+    parser.add_argument("--detail", default="full")
+    parser.add_argument("--total", default="exact")
+    parser.add_argument("--amostra-ids", type=int, default=10000)
+    parser.add_argument("--url", help="Servidor em execução (padrão: in-process)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,82 @@
+"""
+Benchmark: pilha síncrona (psycopg2 + threadpool) vs assíncrona (asyncpg).
+
+Simula N clientes concorrentes executando `busca-ponto` em pontos aleatórios
+de SP. O modo síncrono reproduz o que o Starlette faz com endpoints `def`
+(threadpool de 40 workers por padrão); o modo assíncrono executa as mesmas
+consultas via `AsyncSession`.
+
+Uso:
+    python -m benchmarks.bench_async_db --clientes 200 --requisicoes 5000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+import anyio
+import anyio.to_thread
+
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine
+from app.services import geospatial, geospatial_async
+from benchmarks.common import imprimir, ponto_aleatorio_sp, resumir, salvar_json
+
+
+def _consulta_sync(latitude: float, longitude: float) -> None:
+    db = SessionLocal()
+    try:
+        geospatial.buscar_fazendas_por_ponto(db, latitude, longitude, limit=10)
+    finally:
+        db.close()
+
+
+async def _consulta_async(latitude: float, longitude: float) -> None:
+    async with AsyncSessionLocal() as db:
+        await geospatial_async.buscar_fazendas_por_ponto(
+            db, latitude, longitude, limit=10
+        )
+
+
+async def _executar(modo: str, clientes: int, requisicoes: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    pontos = [ponto_aleatorio_sp(rng) for _ in range(requisicoes)]
+    latencias: List[float] = []
+    fila = iter(pontos)
+
+    async def cliente() -> None:
+        for latitude, longitude in fila:
+            inicio = time.perf_counter()
+            if modo == "sync":
+                await anyio.to_thread.run_sync(_consulta_sync, latitude, longitude)
+            else:
+                await _consulta_async(latitude, longitude)
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(clientes)))
+    return resumir(latencias, time.perf_counter() - inicio)
+
+
+async def main(args: argparse.Namespace) -> None:
+    resultados = {}
+    for modo in ("sync", "async"):
+        # aquecimento do pool
+        await _executar(modo, min(args.clientes, 20), 100, args.seed + 1)
+        resultados[modo] = await _executar(
+            modo, args.clientes, args.requisicoes, args.seed
+        )
+        imprimir(f"busca-ponto [{modo}]", resultados[modo])
+
+    await async_engine.dispose()
+    salvar_json(args.saida, {"clientes": args.clientes, "resultados": resultados})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clientes", type=int, default=200)
+    parser.add_argument("--requisicoes", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,67 @@
+"""
+Benchmark: geocodificação de N pontos, loop em /busca-ponto vs /busca-pontos.
+
+As requisições passam pela pilha HTTP completa da aplicação (in-process, via
+`httpx.ASGITransport`). Reporta pontos/s de cada estratégia e o ganho.
+
+Uso:
+    python -m benchmarks.bench_busca_pontos --pontos 1000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import httpx
+
+from app.db.session import async_engine
+from app.main import app
+from benchmarks.common import ponto_aleatorio_sp, salvar_json
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    pontos = [
+        {"latitude": lat, "longitude": lon}
+        for lat, lon in (ponto_aleatorio_sp(rng) for _ in range(args.pontos))
+    ]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        await c.post("/fazendas/busca-ponto", json=pontos[0])  # aquecimento
+
+        inicio = time.perf_counter()
+        for ponto in pontos:
+            r = await c.post("/fazendas/busca-ponto?detail=none", json=ponto)
+            r.raise_for_status()
+        loop_s = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for i in range(0, len(pontos), args.lote):
+            r = await c.post(
+                "/fazendas/busca-pontos",
+                json={"pontos": pontos[i : i + args.lote]},
+            )
+            r.raise_for_status()
+        lote_s = time.perf_counter() - inicio
+
+    await async_engine.dispose()
+
+    resultados = {
+        "pontos": len(pontos),
+        "loop_pontos_s": round(len(pontos) / loop_s, 1),
+        "lote_pontos_s": round(len(pontos) / lote_s, 1),
+        "ganho": round(loop_s / lote_s, 1),
+    }
+    print(resultados)
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pontos", type=int, default=1000)
+    parser.add_argument("--lote", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,73 @@
+"""
+Benchmark: busca-ponto via PostGIS (ST_Contains) vs índice STRtree em memória.
+
+Mede, para os mesmos pontos aleatórios em SP:
+- sql: `buscar_fazendas_por_ponto` com o motor PostGIS;
+- memoria: apenas a resolução dos ids no `IndiceEspacial`;
+- memoria+hidratacao: ids em memória + leitura dos atributos da página.
+
+Uso:
+    python -m benchmarks.bench_indice_memoria --requisicoes 2000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from app.db.session import AsyncSessionLocal, async_engine
+from app.services import geospatial_async
+from app.services.geospatial import consulta_ids, paginar_ids
+from app.services.spatial_index import IndiceEspacial
+from benchmarks.common import imprimir, ponto_aleatorio_sp, resumir, salvar_json
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    pontos = [ponto_aleatorio_sp(rng) for _ in range(args.requisicoes)]
+    resultados = {}
+
+    async with AsyncSessionLocal() as db:
+        indice = IndiceEspacial()
+        inicio = time.perf_counter()
+        await indice.carregar(db)
+        resultados["carga_s"] = round(time.perf_counter() - inicio, 2)
+        print(f"índice carregado: {len(indice)} fazendas em {resultados['carga_s']}s")
+
+        async def sql(latitude: float, longitude: float) -> None:
+            await geospatial_async.buscar_fazendas_por_ponto(
+                db, latitude, longitude, limit=10
+            )
+
+        async def memoria(latitude: float, longitude: float) -> None:
+            indice.ids_contendo_ponto(latitude, longitude)
+
+        async def memoria_hidratacao(latitude: float, longitude: float) -> None:
+            pagina = paginar_ids(indice.ids_contendo_ponto(latitude, longitude), 10, 0)
+            if pagina:
+                (await db.execute(consulta_ids(pagina))).mappings().all()
+
+        for nome, fn in (
+            ("sql", sql),
+            ("memoria", memoria),
+            ("memoria+hidratacao", memoria_hidratacao),
+        ):
+            latencias: List[float] = []
+            for latitude, longitude in pontos:
+                inicio = time.perf_counter()
+                await fn(latitude, longitude)
+                latencias.append(time.perf_counter() - inicio)
+            resultados[nome] = resumir(latencias, sum(latencias))
+            imprimir(nome, resultados[nome])
+
+    await async_engine.dispose()
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    asyncio.run(main(parser.parse_args()))
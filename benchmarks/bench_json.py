@@ -0,0 +1,152 @@
+"""
+Micro-benchmark: CPU por página de fazendas em cada caminho de resposta JSON.
+
+Sobre páginas de fazendas sintéticas (multipolígonos, sem banco), mede o
+tempo de CPU (`process_time`) para produzir o corpo de uma página:
+- pydantic: itens como dicts, validação de `PageResponse[FazendaOut]`,
+  `jsonable_encoder` e `json.dumps` (o que o FastAPI faz com um dict
+  retornado numa rota com `response_model`);
+- stdlib: fragmentos pré-codificados (`fazenda_json` + `page_json`) com o
+  `json` da stdlib, implementação anterior reproduzida aqui como referência;
+- orjson: os mesmos fragmentos com orjson (caminho atual das rotas).
+
+Uso:
+    python -m benchmarks.bench_json --paginas 200 --por-pagina 100 --vertices 64
+"""
+
+import argparse
+import json
+import math
+import time
+from datetime import date
+from typing import Any, Callable, Dict, List, Mapping
+
+import shapely
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.fazenda import FazendaOut, fazenda_json
+from app.schemas.pagination import PageResponse, TotalMode, page_json
+from benchmarks.common import salvar_json
+from benchmarks.sintetico import gerar_geodataframe
+from seed.seedFazendas import CAMPOS_DATA, transformar_geodataframe
+
+
+# -------------------- Referência: json da stdlib --------------------
+def _json_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(value)}")
+
+
+def _dumps_stdlib(valor: Any) -> str:
+    return json.dumps(
+        valor, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def _fazenda_stdlib(row: Mapping[str, Any]) -> str:
+    atributos = {
+        k: (None if isinstance(v, float) and math.isnan(v) else v)
+        for k, v in row.items()
+        if k != "geom"
+    }
+    corpo = _dumps_stdlib(atributos)
+    return f'{corpo[:-1]},"geom":{row["geom"]}}}'
+
+
+def _pagina_stdlib(linhas: List[Mapping[str, Any]]) -> bytes:
+    items = ",".join(_fazenda_stdlib(linha) for linha in linhas)
+    meta = _dumps_stdlib(_meta(len(linhas)))
+    return f'{{"items":[{items}],{meta[1:]}'.encode()
+
+
+# -------------------- Caminhos --------------------
+def _meta(n: int) -> dict:
+    return {
+        "limit": n,
+        "offset": 0,
+        "total": n,
+        "total_mode": TotalMode.exact,
+        "next_cursor": None,
+    }
+
+
+def _pagina_pydantic(linhas: List[Mapping[str, Any]]) -> bytes:
+    items = [{**linha, "geom": json.loads(linha["geom"])} for linha in linhas]
+    page = PageResponse[FazendaOut].model_validate(
+        {"items": items, **_meta(len(linhas))}
+    )
+    return json.dumps(jsonable_encoder(page)).encode()
+
+
+def _pagina_orjson(linhas: List[Mapping[str, Any]]) -> bytes:
+    return page_json(
+        {"items": [fazenda_json(linha) for linha in linhas], **_meta(len(linhas))}
+    )
+
+
+CAMINHOS: Dict[str, Callable[[List[Mapping[str, Any]]], bytes]] = {
+    "pydantic": _pagina_pydantic,
+    "stdlib": _pagina_stdlib,
+    "orjson": _pagina_orjson,
+}
+
+
+# -------------------- Benchmark --------------------
+def gerar_paginas(args: argparse.Namespace) -> List[List[dict]]:
+    """Linhas no formato das consultas (`geom` em GeoJSON textual)."""
+    total = args.paginas * args.por_pagina
+    atributos, geoms = transformar_geodataframe(
+        gerar_geodataframe(total, args.seed, fracao_multi=1.0, vertices=args.vertices)
+    )
+    for campo in CAMPOS_DATA:
+        atributos[campo] = atributos[campo].dt.date
+    atributos = atributos.astype(object).where(atributos.notna(), None)
+    atributos["geom"] = shapely.to_geojson(geoms)
+    linhas = [
+        {"id": i, **linha}
+        for i, linha in enumerate(atributos.to_dict("records"), start=1)
+    ]
+    return [linhas[i : i + args.por_pagina] for i in range(0, total, args.por_pagina)]
+
+
+def medir(nome: str, fn, paginas: List[List[dict]]) -> dict:
+    inicio = time.process_time()
+    tamanho = sum(len(fn(pagina)) for pagina in paginas)
+    cpu = time.process_time() - inicio
+    resultado = {
+        "cpu_ms_pagina": round(cpu / len(paginas) * 1000, 3),
+        "kb_pagina": round(tamanho / len(paginas) / 1024, 1),
+    }
+    print(f"{nome:<10} " + "  ".join(f"{k}={v}" for k, v in resultado.items()))
+    return resultado
+
+
+def main(args: argparse.Namespace) -> None:
+    paginas = gerar_paginas(args)
+    print(f"{len(paginas)} páginas de {args.por_pagina} fazendas")
+
+    resultados = {"paginas": args.paginas, "por_pagina": args.por_pagina}
+    for nome in args.caminhos:
+        resultados[nome] = medir(nome, CAMINHOS[nome], paginas)
+
+    if "pydantic" in resultados and "orjson" in resultados:
+        ganho = (
+            resultados["pydantic"]["cpu_ms_pagina"]
+            / resultados["orjson"]["cpu_ms_pagina"]
+        )
+        print(f"ganho orjson vs pydantic: {ganho:.1f}x")
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--caminhos", nargs="+", choices=tuple(CAMINHOS), default=list(CAMINHOS)
+    )
+    parser.add_argument("--paginas", type=int, default=200)
+    parser.add_argument("--por-pagina", type=int, default=100)
+    parser.add_argument("--vertices", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    main(parser.parse_args())
@@ -0,0 +1,160 @@
+"""
+Benchmark: middleware de logging em `BaseHTTPMiddleware` vs ASGI puro.
+
+Roda a aplicação in-process (`httpx.ASGITransport`) duas vezes, trocando só o
+middleware de logging: a implementação anterior sobre `BaseHTTPMiddleware`
+(reproduzida aqui como referência) e o `LoggingMiddleware` atual. Para cada
+uma, mede throughput e latência em `/health` e `/fazendas/{id}`. Os logs são
+formatados normalmente e descartados (`os.devnull`), para que o custo do
+logging entre na medida sem poluir a saída.
+
+Uso:
+    python -m benchmarks.bench_middleware --requisicoes 5000 --concorrencia 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Callable, Dict, List
+
+import httpx
+from fastapi import Request
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.logging import setup_logging
+from app.core.middleware import LoggingMiddleware
+from app.core.profiling import encerrar_perfil, iniciar_perfil
+from app.db.session import async_engine
+from benchmarks.bench_api import _amostra_ids
+from benchmarks.common import imprimir, resumir, salvar_json
+
+logger = logging.getLogger("middleware")
+
+
+# -------------------- Referência: BaseHTTPMiddleware --------------------
+class LoggingMiddlewareBase(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.perf_counter()
+        perfil, token = iniciar_perfil()
+
+        logger.info(
+            "request_started",
+            extra={"method": request.method, "path": str(request.url)},
+        )
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            logger.exception(
+                "request_failed",
+                extra={"method": request.method, "path": str(request.url)},
+            )
+            raise exc
+        finally:
+            encerrar_perfil(token)
+
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        logger.info(
+            "request_finished",
+            extra={
+                "method": request.method,
+                "path": str(request.url),
+                "status_code": response.status_code,
+                "duration_ms": duration_ms,
+                "extra_data": {
+                    "db_queries": perfil.consultas,
+                    "db_ms": perfil.tempo_ms,
+                },
+            },
+        )
+        response.headers["Server-Timing"] = perfil.server_timing(duration_ms)
+        return response
+
+
+VARIANTES = {"base": LoggingMiddlewareBase, "asgi": LoggingMiddleware}
+
+
+# -------------------- Benchmark --------------------
+def _usar_middleware(app, classe: type) -> None:
+    """Troca o middleware de logging da aplicação (a pilha é remontada)."""
+    app.user_middleware = [
+        Middleware(classe) if m.cls in VARIANTES.values() else m
+        for m in app.user_middleware
+    ]
+    app.middleware_stack = None
+
+
+async def _executar(
+    cliente: httpx.AsyncClient, caminho: Callable[[random.Random], str], args
+) -> dict:
+    rng = random.Random(args.seed)
+    caminhos = [caminho(rng) for _ in range(args.requisicoes)]
+    for c in caminhos[: args.aquecimento]:
+        await cliente.get(c)
+
+    latencias: List[float] = []
+    fila = iter(caminhos)
+
+    async def trabalhador() -> None:
+        for c in fila:
+            inicio = time.perf_counter()
+            await cliente.get(c)
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabalhador() for _ in range(args.concorrencia)))
+    return resumir(latencias, time.perf_counter() - inicio)
+
+
+async def main(args: argparse.Namespace) -> None:
+    from app.main import app
+
+    setup_logging()
+    logging.getLogger().handlers[0].setStream(open(os.devnull, "w"))
+
+    ids = await _amostra_ids(args.amostra_ids)
+    cargas: Dict[str, Callable[[random.Random], str]] = {
+        "health": lambda rng: "/health",
+        "id": lambda rng: f"/fazendas/{rng.choice(ids)}?detail={args.detail}",
+    }
+
+    resultados: Dict[str, dict] = {}
+    for variante in args.variantes:
+        _usar_middleware(app, VARIANTES[variante])
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+            for nome in args.cargas:
+                resultados[f"{variante}.{nome}"] = await _executar(
+                    c, cargas[nome], args
+                )
+                imprimir(f"{variante} {nome}", resultados[f"{variante}.{nome}"])
+
+    for nome in args.cargas:
+        if f"base.{nome}" in resultados and f"asgi.{nome}" in resultados:
+            base = resultados[f"base.{nome}"]["req_s"]
+            ganho = resultados[f"asgi.{nome}"]["req_s"] / base if base else 0.0
+            print(f"ganho asgi vs base ({nome}): {ganho:.2f}x")
+
+    await async_engine.dispose()
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--variantes", nargs="+", choices=tuple(VARIANTES), default=list(VARIANTES)
+    )
+    parser.add_argument(
+        "--cargas", nargs="+", choices=("health", "id"), default=["health", "id"]
+    )
+    parser.add_argument("--requisicoes", type=int, default=5000)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    parser.add_argument("--aquecimento", type=int, default=100)
+    parser.add_argument("--detail", default="none")
+    parser.add_argument("--amostra-ids", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,73 @@
+"""
+Benchmark: latência por profundidade de página, OFFSET vs cursor (keyset).
+
+Usa `busca-area` sem filtros (todas as fazendas, ordenadas por id). Para cada
+página alvo mede a mediana/p99 de buscar a página via `offset` e via `cursor`
+equivalente. Com cursor a latência da página 1.000 deve ficar próxima à da
+página 1.
+
+Uso:
+    python -m benchmarks.bench_pagination --paginas 1 10 100 1000 --limit 10
+"""
+
+import argparse
+import time
+from typing import List, Optional
+
+from sqlalchemy import select
+
+from app.db.models import Fazenda
+from app.db.session import SessionLocal
+from app.services.cursor import encode_cursor
+from app.services.geospatial import buscar_fazendas_por_area
+from benchmarks.common import imprimir, resumir, salvar_json
+
+
+def _cursor_para_pagina(db, pagina: int, limit: int) -> Optional[str]:
+    """Cursor equivalente ao início da página (id do último item da anterior)."""
+    if pagina <= 1:
+        return None
+    ultimo_id = db.scalar(
+        select(Fazenda.id).order_by(Fazenda.id).offset((pagina - 1) * limit - 1)
+    )
+    return encode_cursor({"id": ultimo_id}) if ultimo_id is not None else None
+
+
+def _medir(db, repeticoes: int, **kwargs) -> dict:
+    latencias: List[float] = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        buscar_fazendas_por_area(db, **kwargs)
+        latencias.append(time.perf_counter() - inicio)
+    return resumir(latencias, sum(latencias))
+
+
+def main(args: argparse.Namespace) -> None:
+    resultados = {}
+    db = SessionLocal()
+    try:
+        for pagina in args.paginas:
+            offset = (pagina - 1) * args.limit
+            cursor = _cursor_para_pagina(db, pagina, args.limit)
+            if pagina > 1 and cursor is None:
+                print(f"página {pagina}: dataset pequeno demais, ignorada")
+                continue
+
+            por_offset = _medir(db, args.repeticoes, limit=args.limit, offset=offset)
+            por_cursor = _medir(db, args.repeticoes, limit=args.limit, cursor=cursor)
+            imprimir(f"página {pagina} [offset]", por_offset)
+            imprimir(f"página {pagina} [cursor]", por_cursor)
+            resultados[pagina] = {"offset": por_offset, "cursor": por_cursor}
+    finally:
+        db.close()
+
+    salvar_json(args.saida, {"limit": args.limit, "paginas": resultados})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paginas", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeticoes", type=int, default=50)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    main(parser.parse_args())
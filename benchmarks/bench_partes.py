@@ -0,0 +1,218 @@
+"""
+Benchmark: candidatas por `fazendas.geom` vs pela tabela `fazendas_partes`.
+
+Trabalha no subconjunto das `--fazendas` maiores fazendas (em vértices), onde
+as bboxes enormes tornam o pré-filtro do índice GiST em `fazendas.geom` pouco
+seletivo. Para cada uma, gera um ponto dentro da fazenda (`ST_GeneratePoints`)
+e um ponto aleatório na sua bbox (em geral fora dela) e mede, sobre a lista
+completa de ids:
+
+- ponto: `ST_Contains` em `fazendas.geom` vs `consulta_ponto`;
+- raio: `filtro_raio` em `fazendas.geom` vs `consulta_raio`;
+- poligono: quadrado de `--lado-km` em volta do ponto, `EXISTS` +
+  `ST_Intersects` em `fazendas.geom` vs `consulta_poligono`.
+
+As consultas por `fazendas.geom` são a implementação anterior, reproduzida
+aqui como referência. Também conta os pontos em que as duas respostas
+diferem (esperado 0).
+
+Uso:
+    python -m benchmarks.bench_partes --fazendas 500 --raio-km 1 --lado-km 2
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import shapely
+from sqlalchemy import Select, exists, func, select, text
+
+from app.db.models import Fazenda
+from app.db.session import SessionLocal
+from app.schemas.fazenda import GeomDetail
+from app.services.geospatial import (
+    consulta_poligono,
+    consulta_ponto,
+    consulta_raio,
+    geography,
+    partes_aoi,
+    ponto_wgs84,
+    resolver_campos,
+)
+from benchmarks.common import imprimir, resumir, salvar_json
+
+Ponto = Tuple[float, float]
+
+SUBCONJUNTO = """
+    SELECT id, geom FROM fazendas ORDER BY ST_NPoints(geom) DESC LIMIT :n
+"""
+
+
+# -------------------- Referência: candidatas por fazendas.geom --------------------
+def bbox_raio(latitude: float, raio_m: float) -> Optional[Tuple[float, float]]:
+    """Meias-larguras (graus de longitude, latitude) de uma bbox que contém
+    com folga o círculo de `raio_m` metros; None perto dos polos."""
+    dlat = raio_m / 110_574 * 1.01  # menor comprimento de 1° de latitude
+    lat_max = abs(latitude) + dlat
+    if lat_max >= 89:
+        return None
+    dlon = raio_m / (111_320 * math.cos(math.radians(lat_max))) * 1.01
+    return dlon, dlat
+
+
+def filtro_raio(latitude: float, longitude: float, raio_m: float) -> list:
+    """
+    Predicados da busca por raio: pré-filtro por bbox na geometria (índice
+    GiST `idx_fazendas_geom`) e `ST_DWithin` exato em geography (índice
+    funcional `idx_fazendas_geog`).
+    """
+    ponto = ponto_wgs84(latitude, longitude)
+    filtros = [func.ST_DWithin(geography(Fazenda.geom), geography(ponto), raio_m)]
+    bbox = bbox_raio(latitude, raio_m)
+    if bbox is not None:
+        filtros.insert(0, Fazenda.geom.op("&&")(func.ST_Expand(ponto, *bbox)))
+    return filtros
+
+
+def _ponto_fazendas(ponto: Ponto, args) -> Select:
+    return select(Fazenda.id).where(func.ST_Contains(Fazenda.geom, ponto_wgs84(*ponto)))
+
+
+def _raio_fazendas(ponto: Ponto, args) -> Select:
+    return select(Fazenda.id).where(*filtro_raio(*ponto, args.raio_km * 1000))
+
+
+def _poligono_fazendas(ponto: Ponto, args) -> Select:
+    partes = partes_aoi(_quadrado(ponto, args.lado_km), False)
+    intersecta = exists().where(func.ST_Intersects(Fazenda.geom, partes.c.geom))
+    return select(Fazenda.id).where(intersecta)
+
+
+# -------------------- Atual: candidatas por fazendas_partes --------------------
+SO_ID = resolver_campos("id")
+
+
+def _ponto_partes(ponto: Ponto, args) -> Select:
+    return consulta_ponto(*ponto, GeomDetail.none, SO_ID)
+
+
+def _raio_partes(ponto: Ponto, args) -> Select:
+    return consulta_raio(*ponto, args.raio_km, GeomDetail.none, SO_ID)
+
+
+def _poligono_partes(ponto: Ponto, args) -> Select:
+    return consulta_poligono(partes_aoi(_quadrado(ponto, args.lado_km), False))
+
+
+BUSCAS: Dict[str, Dict[str, Callable[[Ponto, argparse.Namespace], Select]]] = {
+    "ponto": {"fazendas": _ponto_fazendas, "partes": _ponto_partes},
+    "raio": {"fazendas": _raio_fazendas, "partes": _raio_partes},
+    "poligono": {"fazendas": _poligono_fazendas, "partes": _poligono_partes},
+}
+
+
+# -------------------- Benchmark --------------------
+def _quadrado(ponto: Ponto, lado_km: float) -> str:
+    """GeoJSON de um quadrado (aproximado, em graus) centrado no ponto."""
+    latitude, longitude = ponto
+    meio = lado_km / 111.32 / 2
+    return shapely.to_geojson(
+        shapely.box(
+            longitude - meio, latitude - meio, longitude + meio, latitude + meio
+        )
+    )
+
+
+def gerar_pontos(db, args: argparse.Namespace) -> List[Ponto]:
+    """Um ponto dentro de cada fazenda do subconjunto e um na sua bbox."""
+    rng = random.Random(args.seed)
+    linhas = db.execute(
+        text(f"""
+            SELECT ST_Y(p.geom), ST_X(p.geom),
+                   ST_XMin(f.geom), ST_YMin(f.geom), ST_XMax(f.geom), ST_YMax(f.geom)
+            FROM ({SUBCONJUNTO}) f,
+                 LATERAL ST_Dump(ST_GeneratePoints(f.geom, 1, :seed)) p
+            """),
+        {"n": args.fazendas, "seed": args.seed},
+    ).all()
+
+    pontos: List[Ponto] = []
+    for latitude, longitude, xmin, ymin, xmax, ymax in linhas:
+        pontos.append((latitude, longitude))
+        pontos.append((rng.uniform(ymin, ymax), rng.uniform(xmin, xmax)))
+    return pontos
+
+
+def descrever_subconjunto(db, args: argparse.Namespace) -> dict:
+    vertices, partes = db.execute(
+        text(f"""
+            SELECT avg(ST_NPoints(f.geom)),
+                   avg((SELECT count(*) FROM fazendas_partes p
+                        WHERE p.fazenda_id = f.id))
+            FROM ({SUBCONJUNTO}) f
+            """),
+        {"n": args.fazendas},
+    ).one()
+    return {
+        "fazendas": args.fazendas,
+        "vertices_medio": round(float(vertices or 0), 1),
+        "partes_medio": round(float(partes or 0), 1),
+    }
+
+
+def medir(db, fn, pontos: List[Ponto], args) -> Tuple[dict, List[List[int]]]:
+    respostas: List[List[int]] = []
+    latencias: List[float] = []
+    for ponto in pontos:
+        query = fn(ponto, args).order_by(Fazenda.id)
+        inicio = time.perf_counter()
+        respostas.append(list(db.scalars(query)))
+        latencias.append(time.perf_counter() - inicio)
+    return resumir(latencias, sum(latencias)), respostas
+
+
+def main(args: argparse.Namespace) -> None:
+    resultados: Dict[str, dict] = {}
+    with SessionLocal() as db:
+        resultados["subconjunto"] = descrever_subconjunto(db, args)
+        print(
+            "subconjunto: "
+            + "  ".join(f"{k}={v}" for k, v in resultados["subconjunto"].items())
+        )
+        pontos = gerar_pontos(db, args)
+
+        for busca in args.buscas:
+            respostas = {}
+            for variante, fn in BUSCAS[busca].items():
+                for ponto in pontos[: args.aquecimento]:
+                    db.scalars(fn(ponto, args)).all()
+                resultado, respostas[variante] = medir(db, fn, pontos, args)
+                resultados[f"{busca}.{variante}"] = resultado
+                imprimir(f"{busca} {variante}", resultado)
+
+            divergentes = sum(
+                a != b for a, b in zip(respostas["fazendas"], respostas["partes"])
+            )
+            atual = resultados[f"{busca}.partes"]["p50_ms"]
+            ganho = resultados[f"{busca}.fazendas"]["p50_ms"] / atual if atual else 0.0
+            resultados[f"{busca}.divergentes"] = divergentes
+            print(f"ganho p50 partes vs fazendas ({busca}): {ganho:.2f}x")
+            print(f"respostas divergentes ({busca}): {divergentes}")
+
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--buscas", nargs="+", choices=tuple(BUSCAS), default=list(BUSCAS)
+    )
+    parser.add_argument("--fazendas", type=int, default=500)
+    parser.add_argument("--raio-km", type=float, default=1.0)
+    parser.add_argument("--lado-km", type=float, default=2.0)
+    parser.add_argument("--aquecimento", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    main(parser.parse_args())
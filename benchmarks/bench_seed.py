@@ -0,0 +1,86 @@
+"""
+Benchmark: carga do seed via ORM (`add_all`) vs COPY em lotes (EWKB).
+
+Gera um shapefile sintético, carrega-o com cada modo e reporta linhas/s.
+As fazendas inseridas (e os registros em `seed_control`) são removidas ao
+final de cada execução; ainda assim, rode contra um banco descartável.
+
+Uso:
+    python -m benchmarks.bench_seed --fazendas 50000 --modos orm copy copy-staging
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import func, select, text
+
+from app.db.models import Fazenda
+from app.db.session import SessionLocal
+from benchmarks.common import salvar_json
+from benchmarks.sintetico import gerar_shapefile
+from seed.seedFazendas import run_seed
+
+
+def carregar(shapefile: Path, modo: str, chunk_size: int) -> dict:
+    staging = modo == "copy-staging"
+    seed_name = f"bench_seed_{modo}_{int(time.time())}"
+
+    with SessionLocal() as db:
+        ultimo_id = db.scalar(select(func.coalesce(func.max(Fazenda.id), 0)))
+        inicio = time.perf_counter()
+        run_seed(
+            db,
+            shapefile,
+            seed_name,
+            modo="orm" if modo == "orm" else "copy",
+            staging=staging,
+            chunk_size=chunk_size,
+        )
+        duracao = time.perf_counter() - inicio
+
+        inseridas = db.scalar(select(func.count()).where(Fazenda.id > ultimo_id))
+        db.execute(text("DELETE FROM fazendas WHERE id > :id"), {"id": ultimo_id})
+        db.execute(text("DELETE FROM seed_control WHERE name = :n"), {"n": seed_name})
+        db.commit()
+
+    return {
+        "linhas": inseridas,
+        "duracao_s": round(duracao, 2),
+        "linhas_s": round(inseridas / duracao, 1) if duracao else 0.0,
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    resultados = {"fazendas": args.fazendas}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inicio = time.perf_counter()
+        shapefile = gerar_shapefile(Path(tmp) / "sintetico.shp", args.fazendas)
+        print(f"shapefile sintético gerado em {time.perf_counter() - inicio:.1f}s")
+
+        for modo in args.modos:
+            resultados[modo] = carregar(shapefile, modo, args.chunk_size)
+            campos = "  ".join(f"{k}={v}" for k, v in resultados[modo].items())
+            print(f"{modo:<14} {campos}")
+
+    if "orm" in resultados and "copy" in resultados:
+        ganho = resultados["orm"]["duracao_s"] / resultados["copy"]["duracao_s"]
+        print(f"ganho copy vs orm: {ganho:.1f}x")
+
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fazendas", type=int, default=50000)
+    parser.add_argument(
+        "--modos",
+        nargs="+",
+        choices=("orm", "copy", "copy-staging"),
+        default=["orm", "copy", "copy-staging"],
+    )
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    main(parser.parse_args())
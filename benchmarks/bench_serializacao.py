@@ -0,0 +1,144 @@
+"""
+Benchmark: serialização de 100 fazendas, Shapely/Pydantic vs GeoJSON do PostGIS.
+
+- legado: carrega models `Fazenda` (WKB), `fazenda_out_legado` (to_shape +
+  mapping), valida `PageResponse[FazendaOut]` e serializa com o encoder do
+  FastAPI (caminho anterior das rotas);
+- postgis: `ST_AsGeoJSON` na consulta e montagem do JSON por concatenação
+  (`fazenda_json` + `page_json`), caminho atual das rotas.
+
+Reporta o tempo de CPU em Python (após a consulta) e o tempo total por 100
+fazendas. Por padrão usa as 100 maiores fazendas (multipolígonos mais pesados).
+
+Uso:
+    python -m benchmarks.bench_serializacao --repeticoes 20
+"""
+
+import argparse
+import json
+import time
+from typing import List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from geoalchemy2.shape import to_shape
+from shapely.geometry import GeometryCollection, MultiPolygon, Polygon, mapping
+from sqlalchemy import func, select
+
+from app.db.models import Fazenda
+from app.db.session import SessionLocal
+from app.schemas.fazenda import FazendaOut, GeoJSONGeometry
+from app.schemas.pagination import PageResponse, page_json
+from app.services.geospatial import colunas_saida, montar_pagina
+from benchmarks.common import imprimir, resumir, salvar_json
+
+
+# -------------------- Referência: conversão anterior das rotas --------------------
+def fazenda_out_legado(fazenda: Fazenda) -> FazendaOut:
+    """Converte o model Fazenda (SQLAlchemy) para schema com GeoJSON."""
+
+    geom_geojson: Optional[GeoJSONGeometry] = None
+
+    if fazenda.geom is not None:
+        shape_obj = to_shape(fazenda.geom)
+
+        # Normaliza GeometryCollection para Polygon/MultiPolygon
+        if isinstance(shape_obj, GeometryCollection):
+            polygons = [
+                g for g in shape_obj.geoms if isinstance(g, (Polygon, MultiPolygon))
+            ]
+            if len(polygons) == 1:
+                shape_obj = polygons[0]
+            elif len(polygons) > 1:
+                shape_obj = MultiPolygon(polygons)
+            else:
+                shape_obj = None
+
+        if shape_obj is not None:
+            geojson = mapping(shape_obj)
+            geom_geojson = GeoJSONGeometry(
+                type=geojson.get("type"),
+                coordinates=geojson.get("coordinates"),
+            )
+
+    return FazendaOut(
+        id=fazenda.id,
+        cod_tema=fazenda.cod_tema,
+        nom_tema=fazenda.nom_tema,
+        cod_imovel=fazenda.cod_imovel,
+        mod_fiscal=fazenda.mod_fiscal,
+        num_area=fazenda.num_area,
+        ind_status=fazenda.ind_status,
+        ind_tipo=fazenda.ind_tipo,
+        des_condic=fazenda.des_condic,
+        municipio=fazenda.municipio,
+        cod_estado=fazenda.cod_estado,
+        dat_criaca=fazenda.dat_criaca,
+        dat_atuali=fazenda.dat_atuali,
+        geom=geom_geojson,
+    )
+
+
+# -------------------- Benchmark --------------------
+def _legado(db, ids: List[int]) -> float:
+    fazendas = db.scalars(select(Fazenda).where(Fazenda.id.in_(ids))).all()
+    inicio = time.perf_counter()
+    items = [fazenda_out_legado(f) for f in fazendas]
+    page = PageResponse[FazendaOut].model_validate(
+        {"items": items, "limit": len(ids), "offset": 0, "total": len(ids)}
+    )
+    json.dumps(jsonable_encoder(page))
+    return time.perf_counter() - inicio
+
+
+def _postgis(db, ids: List[int]) -> float:
+    linhas = (
+        db.execute(select(*colunas_saida()).where(Fazenda.id.in_(ids))).mappings().all()
+    )
+    inicio = time.perf_counter()
+    page_json(montar_pagina(linhas, len(ids), 0, len(ids)))
+    return time.perf_counter() - inicio
+
+
+def main(args: argparse.Namespace) -> None:
+    resultados = {}
+    db = SessionLocal()
+    try:
+        ids = db.scalars(
+            select(Fazenda.id)
+            .order_by(
+                func.ST_NPoints(Fazenda.geom).desc() if args.maiores else Fazenda.id
+            )
+            .limit(args.fazendas)
+        ).all()
+
+        for nome, fn in (("legado", _legado), ("postgis", _postgis)):
+            cpu: List[float] = []
+            total: List[float] = []
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                cpu.append(fn(db, ids))
+                total.append(time.perf_counter() - inicio)
+            resultados[nome] = {
+                "cpu_python": resumir(cpu, sum(cpu)),
+                "total": resumir(total, sum(total)),
+            }
+            imprimir(f"{nome} [cpu python]", resultados[nome]["cpu_python"])
+            imprimir(f"{nome} [total]", resultados[nome]["total"])
+    finally:
+        db.close()
+
+    salvar_json(args.saida, {"fazendas": len(ids), "resultados": resultados})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fazendas", type=int, default=100)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    parser.add_argument(
+        "--maiores",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Usa as fazendas com mais vértices (padrão)",
+    )
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    main(parser.parse_args())
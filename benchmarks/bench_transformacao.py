@@ -0,0 +1,119 @@
+"""
+Micro-benchmark: transformação do seed linha a linha (iterrows) vs vetorizada.
+
+Sobre um GeoDataFrame sintético (sem banco), mede o tempo para produzir as
+linhas de COPY de todas as fazendas:
+- iterrows: a implementação original (`row.get`, `strptime` com tentativas,
+  `normalize_geometry` por geometria), reproduzida aqui como referência;
+- vetorizada: `lotes_copy` do seed (pandas + funções de array do Shapely 2).
+
+Uso:
+    python -m benchmarks.bench_transformacao --fazendas 100000
+"""
+
+import argparse
+import time
+from datetime import date, datetime
+from typing import Any, Iterator, Optional
+
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+
+from benchmarks.common import salvar_json
+from benchmarks.sintetico import gerar_geodataframe
+from seed.seedFazendas import CAMPOS_ATRIBUTOS, CAMPOS_DATA, lotes_copy
+
+
+# -------------------- Referência: implementação linha a linha --------------------
+def _parse_date(value: Any) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        for fmt in ("%d/%m/%Y", "%Y-%m-%d"):
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+    return None
+
+
+def _normalize_geometry(geom):
+    if isinstance(geom, Polygon):
+        return MultiPolygon([geom])
+    if isinstance(geom, MultiPolygon):
+        return geom
+    raise ValueError(f"Geometria inválida: {type(geom)}")
+
+
+def _valor(valor: Any) -> str:
+    if valor is None or valor != valor:  # None ou NaN
+        return "\\N"
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return str(valor).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def linhas_iterrows(gdf) -> Iterator[str]:
+    for _, row in gdf.iterrows():
+        try:
+            geom = _normalize_geometry(row.geometry)
+        except ValueError:
+            continue
+        atributos = {campo: row.get(campo) for campo in CAMPOS_ATRIBUTOS}
+        for campo in CAMPOS_DATA:
+            atributos[campo] = _parse_date(atributos[campo])
+        ewkb = shapely.to_wkb(shapely.set_srid(geom, 4326), hex=True, include_srid=True)
+        valores = [_valor(atributos[campo]) for campo in CAMPOS_ATRIBUTOS]
+        yield "\t".join([*valores, ewkb]) + "\n"
+
+
+# -------------------- Benchmark --------------------
+def medir(nome: str, fn, n: int, repeticoes: int) -> dict:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        fn()
+        tempos.append(time.perf_counter() - inicio)
+    melhor = min(tempos)
+    resultado = {"melhor_s": round(melhor, 3), "linhas_s": round(n / melhor, 1)}
+    print(
+        f"{nome:<12} melhor_s={resultado['melhor_s']}  linhas_s={resultado['linhas_s']}"
+    )
+    return resultado
+
+
+def main(args: argparse.Namespace) -> None:
+    gdf = gerar_geodataframe(args.fazendas, args.seed)
+    print(f"{len(gdf)} fazendas sintéticas")
+
+    resultados = {
+        "fazendas": args.fazendas,
+        "iterrows": medir(
+            "iterrows",
+            lambda: "".join(linhas_iterrows(gdf)),
+            args.fazendas,
+            args.repeticoes,
+        ),
+        "vetorizada": medir(
+            "vetorizada",
+            lambda: [texto for texto, _ in lotes_copy(gdf, args.chunk_size)],
+            args.fazendas,
+            args.repeticoes,
+        ),
+    }
+    ganho = resultados["iterrows"]["melhor_s"] / resultados["vetorizada"]["melhor_s"]
+    resultados["ganho"] = round(ganho, 1)
+    print(f"ganho: {ganho:.1f}x")
+    salvar_json(args.saida, resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fazendas", type=int, default=100000)
+    parser.add_argument("--repeticoes", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    main(parser.parse_args())
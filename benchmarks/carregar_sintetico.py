@@ -0,0 +1,62 @@
+"""
+Carrega fazendas sintéticas no PostGIS local (Docker Compose) para os
+benchmarks da API.
+
+Gera o shapefile com `benchmarks.sintetico` e o carrega pelo seed em modo
+COPY. O nome do seed inclui os parâmetros do gerador, então rodar de novo com
+os mesmos parâmetros não duplica dados. `--limpar` esvazia `fazendas` antes
+(use apenas em um banco de benchmark).
+
+Uso:
+    python -m benchmarks.carregar_sintetico --fazendas 200000 --clusters 20 --limpar
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from benchmarks.sintetico import adicionar_argumentos, gerar_shapefile, opcoes_gerador
+from seed.seedFazendas import run_seed
+
+
+def main(args: argparse.Namespace) -> None:
+    seed_name = (
+        f"sintetico_n{args.fazendas}_s{args.seed}_v{args.vertices}"
+        f"_c{args.clusters}_d{args.dispersao}"
+    )
+
+    with SessionLocal() as db:
+        if args.limpar:
+            db.execute(text("TRUNCATE fazendas, fazendas_partes RESTART IDENTITY"))
+            db.execute(text("DELETE FROM seed_control"))
+            db.commit()
+            print("tabela fazendas esvaziada")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            shapefile = gerar_shapefile(
+                Path(tmp) / "sintetico.shp",
+                args.fazendas,
+                args.seed,
+                **opcoes_gerador(args),
+            )
+            run_seed(db, shapefile, seed_name, modo="copy", staging=True)
+
+        db.execute(text("ANALYZE fazendas"))
+        db.execute(text("ANALYZE fazendas_partes"))
+        db.commit()
+        total = db.scalar(text("SELECT count(*) FROM fazendas"))
+    print(f"seed {seed_name} carregado; fazendas na base: {total}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    adicionar_argumentos(parser)
+    parser.add_argument(
+        "--limpar",
+        action="store_true",
+        help="Esvazia fazendas e seed_control antes de carregar",
+    )
+    main(parser.parse_args())
@@ -0,0 +1,65 @@
+"""Utilitários compartilhados pelos scripts de benchmark."""
+
+import json
+import math
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Bounding box aproximada do estado de São Paulo (lon_min, lat_min, lon_max, lat_max)
+SP_BBOX: Tuple[float, float, float, float] = (-53.11, -25.31, -44.16, -19.78)
+
+
+def ponto_aleatorio_sp(rng: Optional[random.Random] = None) -> Tuple[float, float]:
+    """Retorna (latitude, longitude) aleatórios dentro da bbox de SP."""
+    rng = rng or random
+    lon_min, lat_min, lon_max, lat_max = SP_BBOX
+    return rng.uniform(lat_min, lat_max), rng.uniform(lon_min, lon_max)
+
+
+def percentil(valores: Sequence[float], p: float) -> float:
+    """Percentil por interpolação linear (p entre 0 e 100)."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    k = (len(ordenados) - 1) * p / 100
+    f, c = math.floor(k), math.ceil(k)
+    if f == c:
+        return ordenados[int(k)]
+    return ordenados[f] + (ordenados[c] - ordenados[f]) * (k - f)
+
+
+def resumir(latencias_s: List[float], duracao_s: float) -> Dict[str, float]:
+    """Resume latências (em segundos) em throughput e percentis (em ms)."""
+    return {
+        "requisicoes": len(latencias_s),
+        "req_s": round(len(latencias_s) / duracao_s, 2) if duracao_s else 0.0,
+        "p50_ms": round(percentil(latencias_s, 50) * 1000, 2),
+        "p95_ms": round(percentil(latencias_s, 95) * 1000, 2),
+        "p99_ms": round(percentil(latencias_s, 99) * 1000, 2),
+    }
+
+
+@contextmanager
+def cronometro() -> Iterator[List[float]]:
+    """Mede o tempo do bloco; o valor (s) fica em `resultado[0]` ao sair."""
+    resultado: List[float] = [0.0]
+    inicio = time.perf_counter()
+    try:
+        yield resultado
+    finally:
+        resultado[0] = time.perf_counter() - inicio
+
+
+def imprimir(titulo: str, resumo: Dict[str, float]) -> None:
+    campos = "  ".join(f"{k}={v}" for k, v in resumo.items())
+    print(f"{titulo:<28} {campos}")
+
+
+def salvar_json(caminho: Optional[str], dados: dict) -> None:
+    """Grava o resultado em JSON (quando um caminho é informado)."""
+    if not caminho:
+        return
+    Path(caminho).write_text(json.dumps(dados, indent=2, ensure_ascii=False))
@@ -0,0 +1,56 @@
+"""
+Compara dois resultados JSON de `benchmarks.bench_api` (ex.: dois commits).
+
+Mostra, por carga, a variação de throughput e de p50/p95/p99; variações de
+latência acima de `--limite` (%) são marcadas como regressão.
+
+Uso:
+    python -m benchmarks.comparar resultados/base.json resultados/novo.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICAS = ("req_s", "p50_ms", "p95_ms", "p99_ms")
+
+
+def variacao(antes: float, depois: float) -> float:
+    return (depois - antes) / antes * 100 if antes else 0.0
+
+
+def main(args: argparse.Namespace) -> int:
+    base = json.loads(Path(args.base).read_text())
+    novo = json.loads(Path(args.novo).read_text())
+    print(f"base: {base.get('commit')}  novo: {novo.get('commit')}")
+
+    regressoes = 0
+    for carga, depois in novo["resultados"].items():
+        antes = base["resultados"].get(carga)
+        if antes is None:
+            continue
+        campos = []
+        for metrica in METRICAS:
+            delta = variacao(antes[metrica], depois[metrica])
+            # Throughput menor ou latência maior é pior
+            pior = -delta if metrica == "req_s" else delta
+            marca = " !" if pior > args.limite else ""
+            regressoes += bool(marca)
+            campos.append(f"{metrica}={depois[metrica]} ({delta:+.1f}%){marca}")
+        print(f"{carga:<8} " + "  ".join(campos))
+
+    return 1 if regressoes and args.falhar else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base")
+    parser.add_argument("novo")
+    parser.add_argument("--limite", type=float, default=10.0)
+    parser.add_argument(
+        "--falhar",
+        action="store_true",
+        help="Sai com código 1 se houver regressão acima do limite",
+    )
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,75 @@
+"""
+Verificação via EXPLAIN: a busca por raio usa um índice geography.
+
+Roda `EXPLAIN (FORMAT JSON)` das consultas de página e de contagem de
+`busca-raio` e procura, no plano, um Index/Bitmap Index Scan em
+`idx_fazendas_geog` ou `idx_fazendas_partes_geog`. O planner roda com as
+configurações padrão: numa base pequena demais o seq scan é legítimo, então
+use uma base com volume real (ou veja tests/test_plano_raio.py).
+Sai com código 1 se nenhum dos índices for usado.
+
+Uso:
+    python -m benchmarks.explain_raio --latitude -22.9 --longitude -47.06 --raio-km 10
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, List
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.schemas.pagination import TotalMode
+from app.services.geospatial import consulta_raio, paginate, total_statement
+
+# `ST_DWithin(geography(geom), ...)` só casa com os índices de expressão
+INDICES = {"idx_fazendas_geog", "idx_fazendas_partes_geog"}
+
+
+def _nos(plano: dict) -> Iterator[dict]:
+    yield plano
+    for filho in plano.get("Plans", []):
+        yield from _nos(filho)
+
+
+def indices_usados(db, stmt, mostrar: bool = False) -> List[str]:
+    sql = stmt.compile(db.bind, compile_kwargs={"literal_binds": True})
+    (resultado,) = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    if mostrar:
+        print(json.dumps(resultado["Plan"], indent=2))
+    return [n["Index Name"] for n in _nos(resultado["Plan"]) if "Index Name" in n]
+
+
+def indices_raio(
+    db, latitude: float, longitude: float, raio_km: float, mostrar: bool = False
+) -> Dict[str, List[str]]:
+    """Índices usados nas consultas de página e de contagem da busca por raio."""
+    query = consulta_raio(latitude, longitude, raio_km)
+    consultas = {
+        "pagina": paginate(query, 10, 0),
+        "contagem": total_statement(query, 11, 10, 0, None, TotalMode.exact),
+    }
+    return {nome: indices_usados(db, stmt, mostrar) for nome, stmt in consultas.items()}
+
+
+def main(args: argparse.Namespace) -> int:
+    with SessionLocal() as db:
+        usados = indices_raio(
+            db, args.latitude, args.longitude, args.raio_km, mostrar=True
+        )
+
+    ok = True
+    for nome, indices in usados.items():
+        acertou = bool(INDICES.intersection(indices))
+        ok &= acertou
+        print(f"{nome}: índices={indices} {'OK' if acertou else 'SEM ÍNDICE'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latitude", type=float, default=-22.9)
+    parser.add_argument("--longitude", type=float, default=-47.06)
+    parser.add_argument("--raio-km", type=float, default=10)
+    sys.exit(main(parser.parse_args()))
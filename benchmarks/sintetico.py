@@ -0,0 +1,155 @@
+"""
+Gerador de fazendas sintéticas no formato dos shapefiles do CAR.
+
+Polígonos aleatórios dentro da bbox de SP (uma fração como MultiPolygon de
+duas partes), com os mesmos campos e formatos de data do arquivo original
+(`dd/mm/aaaa`). São configuráveis:
+
+- `vertices`: complexidade de cada polígono (número de vértices do anel);
+- `clusters`/`dispersao`: densidade espacial; com `clusters=0` as fazendas
+  se distribuem uniformemente, senão se concentram (normal com desvio
+  `dispersao`, em graus) em torno de `clusters` centros aleatórios.
+
+Uso (gera um shapefile):
+    python -m benchmarks.sintetico saida/sintetico.shp --fazendas 100000
+"""
+
+import argparse
+from pathlib import Path
+from typing import Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from benchmarks.common import SP_BBOX
+
+TEMAS = ("Area do Imovel", "Reserva Legal", "Area de Preservacao Permanente")
+STATUS = ("AT", "PE", "SU", "CA")
+
+
+def _centros(
+    rng: np.random.Generator, n: int, clusters: int, dispersao: float
+) -> tuple:
+    lon_min, lat_min, lon_max, lat_max = SP_BBOX
+    if clusters <= 0:
+        return rng.uniform(lon_min, lon_max, n), rng.uniform(lat_min, lat_max, n)
+
+    centros_lon = rng.uniform(lon_min, lon_max, clusters)
+    centros_lat = rng.uniform(lat_min, lat_max, clusters)
+    grupo = rng.integers(0, clusters, n)
+    lon = rng.normal(centros_lon[grupo], dispersao)
+    lat = rng.normal(centros_lat[grupo], dispersao)
+    return np.clip(lon, lon_min, lon_max), np.clip(lat, lat_min, lat_max)
+
+
+def _poligonos(
+    rng: np.random.Generator,
+    lon: np.ndarray,
+    lat: np.ndarray,
+    raio: np.ndarray,
+    vertices: int,
+) -> np.ndarray:
+    """Polígonos estrelados (sem auto-interseção) com `vertices` vértices."""
+    n = len(lon)
+    passo = 2 * np.pi / vertices
+    angulos = np.arange(vertices) * passo + rng.uniform(0, passo * 0.8, (n, vertices))
+    raios = raio[:, None] * rng.uniform(0.6, 1.0, (n, vertices))
+    coords = np.stack(
+        [
+            lon[:, None] + raios * np.cos(angulos),
+            lat[:, None] + raios * np.sin(angulos),
+        ],
+        axis=-1,
+    )
+    return shapely.polygons(coords)
+
+
+def gerar_geodataframe(
+    n: int,
+    seed: int = 42,
+    fracao_multi: float = 0.1,
+    vertices: int = 4,
+    clusters: int = 0,
+    dispersao: float = 0.2,
+) -> gpd.GeoDataFrame:
+    """GeoDataFrame com `n` fazendas sintéticas (EPSG:4326)."""
+    rng = np.random.default_rng(seed)
+
+    lon, lat = _centros(rng, n, clusters, dispersao)
+    raio = rng.uniform(0.001, 0.015, n)
+    geoms = _poligonos(rng, lon, lat, raio, vertices)
+
+    multi = rng.random(n) < fracao_multi
+    segundas = _poligonos(
+        rng, lon[multi] + 2.5 * raio[multi], lat[multi], raio[multi], vertices
+    )
+    geoms[multi] = [
+        shapely.MultiPolygon([a, b]) for a, b in zip(geoms[multi], segundas)
+    ]
+
+    dias = rng.integers(0, 3650, n)
+    criacao = np.datetime64("2014-01-01") + dias.astype("timedelta64[D]")
+    atualizacao = criacao + rng.integers(0, 365, n).astype("timedelta64[D]")
+
+    tema = rng.integers(0, len(TEMAS), n)
+    return gpd.GeoDataFrame(
+        {
+            "cod_tema": [f"TEMA_{t}" for t in tema],
+            "nom_tema": np.asarray(TEMAS)[tema],
+            "cod_imovel": [f"SP-{i:07d}-SINTETICO" for i in range(n)],
+            "mod_fiscal": rng.uniform(0.1, 20, n).round(4),
+            "num_area": (raio * 111320 * 1.4) ** 2 / 10000,
+            "ind_status": np.asarray(STATUS)[rng.integers(0, len(STATUS), n)],
+            "ind_tipo": "IRU",
+            "des_condic": "Aguardando analise",
+            "municipio": "Municipio Sintetico",
+            "cod_estado": "SP",
+            "dat_criaca": pd.DatetimeIndex(criacao).strftime("%d/%m/%Y"),
+            "dat_atuali": pd.DatetimeIndex(atualizacao).strftime("%d/%m/%Y"),
+        },
+        geometry=geoms,
+        crs="EPSG:4326",
+    )
+
+
+def gerar_shapefile(
+    caminho: Union[str, Path], n: int, seed: int = 42, **opcoes
+) -> Path:
+    """Grava `n` fazendas sintéticas em `caminho` (.shp) e retorna o caminho.
+
+    `opcoes` são repassadas a `gerar_geodataframe` (vertices, clusters...).
+    """
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    gerar_geodataframe(n, seed, **opcoes).to_file(caminho)
+    return caminho
+
+
+def adicionar_argumentos(parser: argparse.ArgumentParser) -> None:
+    """Opções do gerador, compartilhadas pelos scripts que o usam."""
+    parser.add_argument("--fazendas", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--vertices", type=int, default=4)
+    parser.add_argument("--clusters", type=int, default=0)
+    parser.add_argument("--dispersao", type=float, default=0.2)
+
+
+def opcoes_gerador(args: argparse.Namespace) -> dict:
+    return {
+        "vertices": args.vertices,
+        "clusters": args.clusters,
+        "dispersao": args.dispersao,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera um shapefile sintético")
+    parser.add_argument("saida", help="Caminho do .shp a gerar")
+    adicionar_argumentos(parser)
+    args = parser.parse_args()
+    caminho = gerar_shapefile(
+        args.saida, args.fazendas, args.seed, **opcoes_gerador(args)
+    )
+    print(f"{args.fazendas} fazendas gravadas em {caminho}")
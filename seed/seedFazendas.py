@@ -1,16 +1,39 @@
+import argparse
+import glob
+import hashlib
+import io
 import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime, date
-from typing import Any, Optional, List
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple
 import sys
 
 import geopandas as gpd
-from shapely.geometry import Polygon, MultiPolygon
+import numpy as np
+import pandas as pd
+import shapely
 from geoalchemy2 import WKTElement
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 
+from app.core.config import (
+    SEED_CHUNK_SIZE,
+    SEED_MODE,
+    SEED_QUEUE_SIZE,
+    SEED_WORKERS,
+    SEED_WRITERS,
+)
 from app.db.session import SessionLocal
-from app.db.models import Fazenda, SeedControl
+from app.db.models import (
+    GEOM_TOLERANCIAS,
+    HASH_CONTEUDO_SQL,
+    Fazenda,
+    SeedControl,
+)
+from app.services.dataset_version import incrementar_versao_dados
 
 # -------------------- Logging --------------------
 logging.basicConfig(
@@ -22,22 +45,6 @@ logger = logging.getLogger(__name__)
 
 
 # -------------------- Helpers --------------------
-def parse_date(value: Any) -> Optional[date]:
-    """Converte datas vindas do shapefile para date."""
-    if value is None:
-        return None
-    if isinstance(value, date):
-        return value
-    if isinstance(value, str):
-        for fmt in ("%d/%m/%Y", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(value, fmt).date()
-            except ValueError:
-                continue
-    logger.warning("Data inválida ignorada: %s", value)
-    return None
-
-
 def load_geodataframe(path: Path) -> gpd.GeoDataFrame:
     """Carrega shapefile e garante CRS 4326."""
     if not path.exists():
@@ -51,20 +58,286 @@ def load_geodataframe(path: Path) -> gpd.GeoDataFrame:
     return gdf
 
 
-def normalize_geometry(geom):
-    """Garante que geometria seja MultiPolygon."""
-    if geom is None:
-        return None
-    if isinstance(geom, Polygon):
-        return MultiPolygon([geom])
-    if isinstance(geom, MultiPolygon):
-        return geom
-    raise ValueError(f"Geometria inválida: {type(geom)}")
+def atualizar_geometrias_simplificadas(db: Session, tabela: str = "fazendas") -> int:
+    """Preenche as geometrias simplificadas (níveis de detalhe) pendentes."""
+    colunas = ", ".join(
+        f"{coluna} = ST_Multi(ST_SimplifyPreserveTopology(geom, :{coluna}))"
+        for coluna in GEOM_TOLERANCIAS
+    )
+    pendentes = " OR ".join(f"{coluna} IS NULL" for coluna in GEOM_TOLERANCIAS)
+    result = db.execute(
+        text(f"UPDATE {tabela} SET {colunas} WHERE {pendentes}"), GEOM_TOLERANCIAS
+    )
+    return result.rowcount
+
+
+def atualizar_hash_conteudo(db: Session, tabela: str = "fazendas") -> int:
+    """Calcula o hash de conteúdo (seed incremental) das linhas pendentes."""
+    result = db.execute(
+        text(
+            f"UPDATE {tabela} SET hash_conteudo = {HASH_CONTEUDO_SQL} "
+            "WHERE hash_conteudo IS NULL"
+        )
+    )
+    return result.rowcount
+
+
+def checksum_arquivo(path: Path) -> str:
+    """SHA-256 do arquivo (no shapefile, também de .dbf, .shx, .prj...)."""
+    if path.suffix.lower() == ".shp":
+        arquivos = sorted(path.parent.glob(f"{glob.escape(path.stem)}.*"))
+    else:
+        arquivos = [path]
+    sha = hashlib.sha256()
+    for arquivo in arquivos:
+        with open(arquivo, "rb") as f:
+            for bloco in iter(lambda: f.read(1 << 20), b""):
+                sha.update(bloco)
+    return sha.hexdigest()
+
+
+# -------------------- Transformação --------------------
+CAMPOS_ATRIBUTOS = (
+    "cod_tema",
+    "nom_tema",
+    "cod_imovel",
+    "mod_fiscal",
+    "num_area",
+    "ind_status",
+    "ind_tipo",
+    "des_condic",
+    "municipio",
+    "cod_estado",
+    "dat_criaca",
+    "dat_atuali",
+)
+CAMPOS_DATA = ("dat_criaca", "dat_atuali")
+
+
+TIPO_POLYGON = 3
+TIPO_MULTIPOLYGON = 6
+
+
+def _datas(serie: pd.Series, campo: str) -> pd.Series:
+    """Converte uma coluna de datas (`dd/mm/aaaa` ou `aaaa-mm-dd`)."""
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+    datas = pd.to_datetime(serie, format="%d/%m/%Y", errors="coerce")
+    pendentes = datas.isna() & serie.notna()
+    if pendentes.any():
+        datas[pendentes] = pd.to_datetime(
+            serie[pendentes], format="%Y-%m-%d", errors="coerce"
+        )
+    invalidas = datas.isna() & serie.notna()
+    if invalidas.any():
+        logger.warning(
+            "Datas inválidas ignoradas. campo=%s total=%d exemplos=%s",
+            campo,
+            invalidas.sum(),
+            serie[invalidas].head(5).tolist(),
+        )
+    return datas
+
+
+def transformar_geodataframe(
+    gdf: gpd.GeoDataFrame,
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Transformação vetorizada do GeoDataFrame: retorna os atributos e as
+    geometrias (MultiPolygon) das linhas válidas, na mesma ordem.
+
+    Polygons são promovidos a MultiPolygon de uma vez; linhas sem geometria
+    ou com outro tipo são descartadas e reportadas pelo índice.
+    """
+    geoms = gdf.geometry.values.to_numpy()
+    tipos = shapely.get_type_id(geoms)
+    validas = (tipos == TIPO_POLYGON) | (tipos == TIPO_MULTIPOLYGON)
+    for idx, geom in zip(gdf.index[~validas], geoms[~validas]):
+        motivo = "vazia" if geom is None else f"inválida: {geom.geom_type}"
+        logger.warning("Registro ignorado no índice %s: Geometria %s", idx, motivo)
+
+    geoms = geoms[validas]
+    poligonos = tipos[validas] == TIPO_POLYGON
+    if poligonos.any():
+        geoms[poligonos] = shapely.multipolygons(
+            geoms[poligonos], indices=np.arange(poligonos.sum())
+        )
+
+    atributos = pd.DataFrame(index=gdf.index[validas])
+    for campo in CAMPOS_ATRIBUTOS:
+        serie = gdf[campo][validas] if campo in gdf else None
+        if serie is not None and campo in CAMPOS_DATA:
+            serie = _datas(serie, campo)
+        atributos[campo] = serie
+    return atributos, geoms
+
+
+# -------------------- Carga via ORM --------------------
+def inserir_fazendas_orm(db: Session, gdf: gpd.GeoDataFrame) -> int:
+    """Carga original: um objeto `Fazenda` por linha, inserido no flush."""
+    atributos, geoms = transformar_geodataframe(gdf)
+    for campo in CAMPOS_DATA:
+        if pd.api.types.is_datetime64_any_dtype(atributos[campo]):
+            atributos[campo] = atributos[campo].dt.date
+    registros = atributos.astype(object).where(atributos.notna(), None)
+
+    fazendas: List[Fazenda] = [
+        Fazenda(
+            geom=WKTElement(wkt, srid=4326),
+            **{k: v for k, v in registro.items() if v is not None},
+        )
+        for registro, wkt in zip(
+            registros.to_dict("records"), shapely.to_wkt(geoms, rounding_precision=-1)
+        )
+    ]
+    logger.info("Inserindo fazendas no banco. total_validos=%d", len(fazendas))
+    db.add_all(fazendas)
+    db.flush()
+    return len(fazendas)
+
+
+# -------------------- Carga via COPY --------------------
+COLUNAS_COPY = (*CAMPOS_ATRIBUTOS, "geom")
+TABELA_STAGING = "fazendas_staging"
+
+
+ESCAPES_COPY = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def _escapar_copy(texto: pd.Series) -> pd.Series:
+    """Escapa a coluna inteira de uma vez: os valores são unidos por NUL (que
+    não pode aparecer em texto no PostgreSQL) e só há trabalho se algum
+    caractere especial estiver presente."""
+    unido = "\x00".join(texto.fillna(""))
+    if not any(especial in unido for especial, _ in ESCAPES_COPY):
+        return texto
+    for especial, escape in ESCAPES_COPY:
+        unido = unido.replace(especial, escape)
+    return pd.Series(unido.split("\x00"), index=texto.index)
+
+
+def _coluna_copy(serie: pd.Series) -> pd.Series:
+    """Coluna no formato texto do COPY (NULL como \\N, com escapes)."""
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        texto = serie.dt.strftime("%Y-%m-%d")
+    elif pd.api.types.is_numeric_dtype(serie):
+        texto = serie.astype(str)
+    else:
+        texto = _escapar_copy(serie.astype(str))
+    return texto.where(serie.notna(), "\\N")
+
+
+def linhas_copy(atributos: pd.DataFrame, geoms: np.ndarray) -> pd.Series:
+    """Linhas do COPY, com a geometria em EWKB hexadecimal (SRID 4326)."""
+    ewkb = shapely.to_wkb(shapely.set_srid(geoms, 4326), hex=True, include_srid=True)
+    colunas = [_coluna_copy(atributos[campo]) for campo in CAMPOS_ATRIBUTOS]
+    ewkb = pd.Series(ewkb, index=atributos.index, dtype=object)
+    return colunas[0].str.cat([*colunas[1:], ewkb], sep="\t") + "\n"
+
+
+def lotes_copy(
+    gdf: gpd.GeoDataFrame, chunk_size: int = SEED_CHUNK_SIZE
+) -> Iterator[Tuple[str, int]]:
+    """Agrupa as linhas do COPY em lotes de até `chunk_size`: (texto, linhas).
+
+    Cada fatia de `chunk_size` registros é transformada só quando o lote é
+    pedido, então a memória além do GeoDataFrame fica limitada a um lote.
+    """
+    for inicio in range(0, len(gdf), chunk_size):
+        atributos, geoms = transformar_geodataframe(
+            gdf.iloc[inicio : inicio + chunk_size]
+        )
+        if len(geoms):
+            linhas = linhas_copy(atributos, geoms)
+            yield "".join(linhas), len(linhas)
+
+
+def enviar_copy(db: Session, texto: str, tabela: str = "fazendas") -> None:
+    """Envia um lote via `COPY ... FROM STDIN` na transação da sessão."""
+    cursor = db.connection().connection.cursor()
+    cursor.copy_expert(
+        f"COPY {tabela} ({', '.join(COLUNAS_COPY)}) FROM STDIN", io.StringIO(texto)
+    )
+
+
+def copiar_lotes(
+    db: Session,
+    lotes: Iterable[Tuple[str, int]],
+    tabela: str = "fazendas",
+    commit_por_lote: bool = False,
+) -> int:
+    """Copia os lotes, um de cada vez (memória limitada a um lote).
+
+    Com `commit_por_lote`, cada lote é commitado ao ser copiado: só para a
+    tabela de staging, recriada a cada execução. Sem ele, os lotes ficam na
+    transação da sessão, commitada pelo chamador.
+    """
+    total = 0
+    inicio = time.perf_counter()
+    for texto, n_linhas in lotes:
+        enviar_copy(db, texto, tabela)
+        if commit_por_lote:
+            db.commit()
+        total += n_linhas
+        logger.info("Lote copiado. tabela=%s total=%d", tabela, total)
+
+    duracao = time.perf_counter() - inicio
+    logger.info(
+        "COPY concluído. tabela=%s total=%d duracao_s=%.2f linhas_s=%.0f",
+        tabela,
+        total,
+        duracao,
+        total / duracao if duracao else 0.0,
+    )
+    return total
+
+
+def inserir_fazendas_copy(
+    db: Session,
+    gdf: gpd.GeoDataFrame,
+    staging: bool = False,
+    chunk_size: int = SEED_CHUNK_SIZE,
+) -> int:
+    """
+    Carga em massa via COPY.
+
+    Direto na tabela `fazendas`, todos os lotes entram numa única transação,
+    commitada pelo chamador junto do registro em `seed_control` (uma falha no
+    meio não deixa carga parcial). Com `staging`, os lotes vão para uma
+    tabela UNLOGGED com a mesma estrutura (e a mesma sequência de ids),
+    commitados um a um: uma falha perde só o lote em andamento, e a próxima
+    execução recria a tabela. As geometrias simplificadas são geradas lá e
+    tudo é publicado em `fazendas` por um único INSERT, na transação do
+    chamador.
+    """
+    lotes = lotes_copy(gdf, chunk_size)
+
+    if not staging:
+        return copiar_lotes(db, lotes, "fazendas")
+
+    db.execute(text(f"DROP TABLE IF EXISTS {TABELA_STAGING}"))
+    db.execute(
+        text(
+            f"CREATE UNLOGGED TABLE {TABELA_STAGING} "
+            "(LIKE fazendas INCLUDING DEFAULTS)"
+        )
+    )
+    db.commit()
+    total = copiar_lotes(db, lotes, TABELA_STAGING, commit_por_lote=True)
+    atualizar_geometrias_simplificadas(db, TABELA_STAGING)
+    db.execute(text(f"INSERT INTO fazendas SELECT * FROM {TABELA_STAGING}"))
+    db.execute(text(f"DROP TABLE {TABELA_STAGING}"))
+    return total
 
 
 # -------------------- Seed --------------------
 def run_seed(
-    db: Session, shapefile_path: Path, seed_name: str = "seed_fazendas_default"
+    db: Session,
+    shapefile_path: Path,
+    seed_name: str = "seed_fazendas_default",
+    modo: str = SEED_MODE,
+    staging: bool = False,
+    chunk_size: int = SEED_CHUNK_SIZE,
 ) -> None:
     """Executa seed de fazendas a partir de um shapefile.
 
@@ -72,57 +345,424 @@ def run_seed(
         db (Session): Sessão SQLAlchemy.
         shapefile_path (Path): Caminho do arquivo shapefile.
         seed_name (str): Nome único do seed.
+        modo (str): "orm" (objetos `Fazenda`) ou "copy" (COPY em lotes);
+            nos dois, `fazendas` recebe a carga num único commit, com o
+            `seed_control`.
+        staging (bool): No modo "copy", carrega numa tabela de staging
+            (commit por lote) e publica tudo de uma vez ao final.
+        chunk_size (int): Linhas por lote no modo "copy".
     """
     # Idempotência
     if db.query(SeedControl).filter_by(name=seed_name).first():
         logger.info("Seed já executado. Pulando execução. seed_name=%s", seed_name)
         return
 
-    logger.info("Iniciando seed de fazendas. seed_name=%s", seed_name)
+    logger.info("Iniciando seed de fazendas. seed_name=%s modo=%s", seed_name, modo)
     gdf = load_geodataframe(shapefile_path)
     logger.info("Shapefile carregado. total_registros=%d", len(gdf))
 
-    fazendas: List[Fazenda] = []
+    inicio = time.perf_counter()
+    if modo == "copy":
+        total = inserir_fazendas_copy(db, gdf, staging, chunk_size)
+    elif modo == "orm":
+        total = inserir_fazendas_orm(db, gdf)
+    else:
+        raise ValueError(f"Modo de seed inválido: {modo}")
+
+    total_simplificadas = atualizar_geometrias_simplificadas(db)
+    logger.info("Geometrias simplificadas geradas. total=%d", total_simplificadas)
+    atualizar_hash_conteudo(db)
+    db.add(
+        SeedControl(
+            name=seed_name,
+            checksum=checksum_arquivo(shapefile_path),
+            stats={"inseridos": total},
+        )
+    )
+    incrementar_versao_dados(db)
+    db.commit()
+
+    duracao = time.perf_counter() - inicio
+    logger.info(
+        "Seed de fazendas executado com sucesso. total_inseridos=%d "
+        "duracao_s=%.2f linhas_s=%.0f",
+        total,
+        duracao,
+        total / duracao if duracao else 0.0,
+    )
 
-    for idx, row in gdf.iterrows():
-        try:
-            geom = normalize_geometry(row.geometry)
-            geom_wkt = WKTElement(geom.wkt, srid=4326)
-
-            atributos = {
-                "cod_tema": row.get("cod_tema"),
-                "nom_tema": row.get("nom_tema"),
-                "cod_imovel": row.get("cod_imovel"),
-                "mod_fiscal": row.get("mod_fiscal"),
-                "num_area": row.get("num_area"),
-                "ind_status": row.get("ind_status"),
-                "ind_tipo": row.get("ind_tipo"),
-                "des_condic": row.get("des_condic"),
-                "municipio": row.get("municipio"),
-                "cod_estado": row.get("cod_estado"),
-                "dat_criaca": parse_date(row.get("dat_criaca")),
-                "dat_atuali": parse_date(row.get("dat_atuali")),
-            }
-            atributos = {k: v for k, v in atributos.items() if v is not None}
-
-            fazendas.append(Fazenda(geom=geom_wkt, **atributos))
 
+# -------------------- Seed de vários arquivos (paralelo) --------------------
+EXTENSOES_SEED = (".shp", ".geojson", ".gpkg")
+
+
+def resolver_arquivos(padrao: str) -> List[Path]:
+    """Arquivos espaciais de um diretório, ou os que casam com um glob."""
+    caminho = Path(padrao)
+    if caminho.is_dir():
+        return sorted(
+            p for p in caminho.iterdir() if p.suffix.lower() in EXTENSOES_SEED
+        )
+    return sorted(Path(p) for p in glob.glob(padrao, recursive=True))
+
+
+def raiz_padrao(padrao: str) -> Path:
+    """Diretório base de um padrão: o próprio diretório, ou o prefixo do glob
+    sem curingas (`data/**/*.shp` -> `data`)."""
+    caminho = Path(padrao)
+    if caminho.is_dir():
+        return caminho
+    fixas = []
+    for parte in caminho.parts:
+        if any(curinga in parte for curinga in "*?["):
+            return Path(*fixas) if fixas else Path(".")
+        fixas.append(parte)
+    return caminho.parent
+
+
+def nome_seed_arquivo(seed_name: str, arquivo: Path, raiz: Path) -> str:
+    """Nome do registro em `seed_control` de um arquivo da carga.
+
+    Usa o caminho relativo à raiz do padrão: o CAR publica o mesmo nome de
+    arquivo (`AREA_IMOVEL_1.shp`) para todos os estados.
+    """
+    return f"{seed_name}:{arquivo.relative_to(raiz).as_posix()}"
+
+
+def nomes_seed_arquivos(
+    seed_name: str, arquivos: Iterable[Path], raiz: Path
+) -> Dict[str, Path]:
+    """Registro em `seed_control` de cada arquivo; erro se dois colidirem."""
+    nomes: Dict[str, Path] = {}
+    for arquivo in arquivos:
+        nome = nome_seed_arquivo(seed_name, arquivo, raiz)
+        if nome in nomes:
+            raise ValueError(
+                f"Arquivos com o mesmo registro em seed_control ({nome}): "
+                f"{nomes[nome]} e {arquivo}"
+            )
+        nomes[nome] = arquivo
+    return nomes
+
+
+def _produzir_lotes(arquivo: str, fila, chunk_size: int) -> None:
+    """Executa num processo do pool: lê, reprojeta e transforma o arquivo,
+    enviando os lotes de COPY para a fila (limitada) do escritor."""
+    try:
+        gdf = load_geodataframe(Path(arquivo))
+        for texto, n_linhas in lotes_copy(gdf, chunk_size):
+            fila.put((arquivo, "lote", texto, n_linhas))
+        fila.put((arquivo, "fim", checksum_arquivo(Path(arquivo)), 0))
+    except Exception as e:
+        fila.put((arquivo, "erro", str(e), 0))
+
+
+def _escrever_lotes(
+    fila, nomes: Dict[str, str], resultados: Dict[str, Optional[int]]
+) -> None:
+    """
+    Thread escritora (`nomes`: caminho -> registro em `seed_control`): cada
+    arquivo é carregado numa transação própria, que só é commitada (junto do
+    seu registro em `seed_control` e do incremento da versão dos dados)
+    quando o arquivo termina. Um arquivo que falha é
+    desfeito por inteiro e recarregado na próxima execução; os já commitados
+    invalidam caches e ETags mesmo que a execução seja interrompida depois.
+    """
+    sessoes: Dict[str, Session] = {}
+    totais: Dict[str, int] = {}
+
+    while (mensagem := fila.get()) is not None:
+        arquivo, tipo, dados, n_linhas = mensagem
+        if arquivo in resultados:  # já falhou; descarta o restante
+            continue
+        if arquivo not in sessoes:
+            sessoes[arquivo] = SessionLocal()
+            totais[arquivo] = 0
+        db = sessoes[arquivo]
+
+        try:
+            if tipo == "lote":
+                enviar_copy(db, dados)
+                totais[arquivo] += n_linhas
+                continue
+            if tipo == "erro":
+                raise RuntimeError(dados)
+            db.add(
+                SeedControl(
+                    name=nomes[arquivo],
+                    checksum=dados,
+                    stats={"inseridos": totais[arquivo]},
+                )
+            )
+            # Por último: o lock da linha de `dataset_version` serializa os
+            # escritores só durante o commit
+            incrementar_versao_dados(db)
+            db.commit()
+            resultados[arquivo] = totais[arquivo]
+            logger.info(
+                "Arquivo carregado. arquivo=%s total=%d", arquivo, totais[arquivo]
+            )
         except Exception as e:
-            logger.warning("Registro ignorado no índice %d: %s", idx, str(e))
+            db.rollback()
+            resultados[arquivo] = None
+            logger.error("Falha ao carregar arquivo. arquivo=%s erro=%s", arquivo, e)
+        sessoes.pop(arquivo).close()
 
-    logger.info("Inserindo fazendas no banco. total_validos=%d", len(fazendas))
-    db.add_all(fazendas)
-    db.add(SeedControl(name=seed_name))
-    db.commit()
+    # Arquivos cujo processo não chegou ao fim (ex.: pool quebrado)
+    for arquivo, db in sessoes.items():
+        db.rollback()
+        db.close()
+        resultados[arquivo] = None
+
+
+def run_seed_paralelo(
+    padrao: str,
+    seed_name: str = "seed_fazendas_default",
+    workers: int = SEED_WORKERS,
+    escritores: int = SEED_WRITERS,
+    chunk_size: int = SEED_CHUNK_SIZE,
+) -> Dict[str, Optional[int]]:
+    """Carrega vários arquivos (diretório ou glob) em paralelo.
+
+    A leitura, a reprojeção e a transformação (CPU) rodam num pool de
+    `workers` processos; os lotes resultantes passam por filas limitadas até
+    `escritores` threads que fazem o COPY. Cada arquivo é registrado em
+    `seed_control` separadamente, então uma nova execução retoma apenas os
+    arquivos que faltaram.
+
+    Returns:
+        Dict[str, Optional[int]]: Linhas carregadas por arquivo (None se falhou).
+    """
+    arquivos = resolver_arquivos(padrao)
+    if not arquivos:
+        raise FileNotFoundError(f"Nenhum arquivo encontrado: {padrao}")
+
+    nomes = nomes_seed_arquivos(seed_name, arquivos, raiz_padrao(padrao))
+    with SessionLocal() as db:
+        concluidos = set(
+            db.scalars(select(SeedControl.name).where(SeedControl.name.in_(nomes)))
+        )
+    pendentes = [a for nome, a in nomes.items() if nome not in concluidos]
+    # Os escritores identificam o arquivo pelo caminho enviado pelo processo
+    nomes_por_caminho = {str(a): nome for nome, a in nomes.items()}
     logger.info(
-        "Seed de fazendas executado com sucesso. total_inseridos=%d", len(fazendas)
+        "Iniciando seed paralelo. seed_name=%s arquivos=%d ja_carregados=%d "
+        "workers=%d escritores=%d",
+        seed_name,
+        len(arquivos),
+        len(concluidos),
+        workers,
+        escritores,
     )
 
+    resultados: Dict[str, Optional[int]] = {}
+    inicio = time.perf_counter()
+    # "spawn": os processos não herdam as threads escritoras nem o pool do engine
+    contexto = multiprocessing.get_context("spawn")
+    with contexto.Manager() as manager, ProcessPoolExecutor(
+        max_workers=workers, mp_context=contexto
+    ) as pool:
+        filas = [manager.Queue(maxsize=SEED_QUEUE_SIZE) for _ in range(escritores)]
+        threads = [
+            threading.Thread(
+                target=_escrever_lotes, args=(fila, nomes_por_caminho, resultados)
+            )
+            for fila in filas
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Um arquivo vai sempre para a mesma fila: o escritor recebe seus
+        # lotes em ordem, terminando com "fim" ou "erro"
+        futuros = [
+            pool.submit(_produzir_lotes, str(a), filas[i % escritores], chunk_size)
+            for i, a in enumerate(pendentes)
+        ]
+        for arquivo, futuro in zip(pendentes, futuros):
+            if futuro.exception() is not None:
+                logger.error(
+                    "Processo de leitura falhou. arquivo=%s erro=%s",
+                    arquivo,
+                    futuro.exception(),
+                )
+        for fila in filas:
+            fila.put(None)
+        for thread in threads:
+            thread.join()
+
+    carregados = {a: n for a, n in resultados.items() if n is not None}
+    # Também sem arquivos novos: completa o pós-processamento de uma execução
+    # anterior interrompida depois de commitar algum arquivo
+    with SessionLocal() as db:
+        simplificadas = atualizar_geometrias_simplificadas(db)
+        atualizar_hash_conteudo(db)
+        if simplificadas:
+            incrementar_versao_dados(db)
+        db.commit()
+
+    total = sum(carregados.values())
+    duracao = time.perf_counter() - inicio
+    logger.info(
+        "Seed paralelo concluído. arquivos_ok=%d arquivos_falhos=%d "
+        "total_inseridos=%d duracao_s=%.2f linhas_s=%.0f",
+        len(carregados),
+        len(resultados) - len(carregados),
+        total,
+        duracao,
+        total / duracao if duracao else 0.0,
+    )
+    return resultados
+
+
+# -------------------- Seed incremental --------------------
+TABELA_INCREMENTAL = "fazendas_incremental"
+
+
+def run_seed_incremental(
+    db: Session,
+    shapefile_path: Path,
+    seed_name: str = "seed_fazendas_default",
+    chunk_size: int = SEED_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Aplica um snapshot atualizado do CAR alterando só o que mudou.
+
+    O arquivo é copiado para uma tabela temporária e comparado com `fazendas`
+    pela chave (`cod_imovel`, `cod_tema`) e pelo hash de conteúdo:
+
+    - chave nova: insere;
+    - hash diferente: atualiza (e recalcula as geometrias simplificadas);
+    - chave ausente no snapshot: remove, restrito aos estados (`cod_estado`)
+      presentes no arquivo, para que o snapshot de um estado não apague os
+      demais.
+
+    Registros sem chave completa (`cod_imovel` ou `cod_tema` nulos) não têm
+    como ser casados entre snapshots e ficam fora do modo incremental: os do
+    arquivo são ignorados (não inseridos, para não duplicar a cada execução)
+    e os já existentes em `fazendas` nunca são atualizados nem removidos por
+    ele; só a carga completa (`run_seed`) os cria. Registros com chave
+    repetida no arquivo também são ignorados.
+
+    Tudo roda numa única transação; um arquivo com checksum já registrado em
+    `seed_control` não é reprocessado, e a versão dos dados só é incrementada
+    se algo mudou (caches e índices seguem válidos).
+
+    Returns:
+        Dict[str, Any]: Estatísticas da execução (também gravadas em
+        `seed_control.stats`).
+    """
+    checksum = checksum_arquivo(shapefile_path)
+    anterior = db.scalar(
+        select(SeedControl.name).where(SeedControl.checksum == checksum)
+    )
+    if anterior:
+        logger.info(
+            "Snapshot já carregado. Pulando execução. seed_name=%s checksum=%s",
+            anterior,
+            checksum,
+        )
+        return {}
+
+    logger.info("Iniciando seed incremental. seed_name=%s", seed_name)
+    gdf = load_geodataframe(shapefile_path)
+    logger.info("Shapefile carregado. total_registros=%d", len(gdf))
+    inicio = time.perf_counter()
+
+    t = TABELA_INCREMENTAL
+    colunas = ", ".join(COLUNAS_COPY)
+    chave = "s.cod_imovel = f.cod_imovel AND s.cod_tema = f.cod_tema"
+
+    db.execute(
+        text(
+            f"CREATE TEMP TABLE {t} ON COMMIT DROP AS "
+            f"SELECT {colunas} FROM fazendas WITH NO DATA"
+        )
+    )
+    for texto, _ in lotes_copy(gdf, chunk_size):
+        enviar_copy(db, texto, t)
+
+    ignorados = db.execute(
+        text(f"DELETE FROM {t} WHERE cod_imovel IS NULL OR cod_tema IS NULL")
+    ).rowcount
+    ignorados += db.execute(
+        text(
+            f"DELETE FROM {t} a USING {t} b WHERE a.cod_imovel = b.cod_imovel "
+            "AND a.cod_tema = b.cod_tema AND a.ctid > b.ctid"
+        )
+    ).rowcount
+    db.execute(text(f"ALTER TABLE {t} ADD COLUMN hash_conteudo varchar(32)"))
+    db.execute(text(f"UPDATE {t} SET hash_conteudo = {HASH_CONTEUDO_SQL}"))
+    db.execute(text(f"CREATE INDEX ON {t} (cod_imovel, cod_tema)"))
+    db.execute(text(f"ANALYZE {t}"))
+    total = db.scalar(text(f"SELECT count(*) FROM {t}"))
+
+    removidos = db.execute(
+        text(
+            f"DELETE FROM fazendas f "
+            f"WHERE f.cod_estado IN (SELECT DISTINCT cod_estado FROM {t}) "
+            "AND f.cod_imovel IS NOT NULL AND f.cod_tema IS NOT NULL "
+            f"AND NOT EXISTS (SELECT 1 FROM {t} s WHERE {chave})"
+        )
+    ).rowcount
+    atribuicoes = ", ".join(f"{c} = s.{c}" for c in (*COLUNAS_COPY, "hash_conteudo"))
+    atualizados = db.execute(
+        text(
+            f"UPDATE fazendas f SET {atribuicoes}, "
+            "geom_medium = NULL, geom_low = NULL "
+            f"FROM {t} s WHERE {chave} "
+            "AND f.hash_conteudo IS DISTINCT FROM s.hash_conteudo"
+        )
+    ).rowcount
+    inseridos = db.execute(
+        text(
+            f"INSERT INTO fazendas ({colunas}, hash_conteudo) "
+            f"SELECT {colunas}, hash_conteudo FROM {t} s "
+            f"WHERE NOT EXISTS (SELECT 1 FROM fazendas f WHERE {chave})"
+        )
+    ).rowcount
+
+    stats: Dict[str, Any] = {
+        "total": total,
+        "inseridos": inseridos,
+        "atualizados": atualizados,
+        "removidos": removidos,
+        "inalterados": total - inseridos - atualizados,
+        "ignorados": ignorados,
+    }
+    if inseridos or atualizados or removidos:
+        atualizar_geometrias_simplificadas(db)
+        incrementar_versao_dados(db)
+    stats["duracao_s"] = round(time.perf_counter() - inicio, 2)
+
+    db.add(
+        SeedControl(
+            name=f"{seed_name}:incremental:{checksum[:16]}",
+            checksum=checksum,
+            stats=stats,
+        )
+    )
+    db.commit()
+    logger.info("Seed incremental concluído. %s", stats)
+    return stats
+
 
 # -------------------- Entrypoint --------------------
 def main(
-    shapefile_path: Optional[str] = None, seed_name: str = "seed_fazendas_default"
+    shapefile_path: Optional[str] = None,
+    seed_name: str = "seed_fazendas_default",
+    modo: str = SEED_MODE,
+    staging: bool = False,
+    chunk_size: int = SEED_CHUNK_SIZE,
+    workers: int = SEED_WORKERS,
+    escritores: int = SEED_WRITERS,
+    incremental: bool = False,
 ):
+    # Diretório ou glob: carga paralela, arquivo a arquivo
+    if shapefile_path and (
+        Path(shapefile_path).is_dir() or any(c in shapefile_path for c in "*?[")
+    ):
+        run_seed_paralelo(shapefile_path, seed_name, workers, escritores, chunk_size)
+        return
+
     db = SessionLocal()
     try:
         path = (
@@ -130,7 +770,10 @@ def main(
             if shapefile_path
             else Path("seed/data/AREA_IMOVEL_1.shp")
         )
-        run_seed(db, path, seed_name)
+        if incremental:
+            run_seed_incremental(db, path, seed_name, chunk_size)
+        else:
+            run_seed(db, path, seed_name, modo, staging, chunk_size)
     except Exception:
         logger.exception("Erro ao executar seed")
         db.rollback()
@@ -140,4 +783,45 @@ def main(
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Seed de fazendas")
+    parser.add_argument(
+        "arquivo",
+        nargs="?",
+        help="Shapefile/GeoJSON de entrada, ou diretório/glob para carga paralela",
+    )
+    parser.add_argument("--seed-name", default="seed_fazendas_default")
+    parser.add_argument("--modo", choices=("orm", "copy"), default=SEED_MODE)
+    parser.add_argument(
+        "--staging",
+        action="store_true",
+        help="No modo copy, carrega em tabela de staging e publica ao final",
+    )
+    parser.add_argument("--chunk-size", type=int, default=SEED_CHUNK_SIZE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SEED_WORKERS,
+        help="Processos de leitura na carga de vários arquivos",
+    )
+    parser.add_argument(
+        "--escritores",
+        type=int,
+        default=SEED_WRITERS,
+        help="Threads de escrita (COPY) na carga de vários arquivos",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Aplica o arquivo como snapshot: insere/atualiza/remove só o que mudou",
+    )
+    args = parser.parse_args()
+    main(
+        args.arquivo,
+        args.seed_name,
+        args.modo,
+        args.staging,
+        args.chunk_size,
+        args.workers,
+        args.escritores,
+        args.incremental,
+    )
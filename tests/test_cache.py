@@ -0,0 +1,71 @@
+"""Cache de resultados: LRU, expiração, versão dos dados e chave normalizada."""
+
+from app.schemas.fazenda import GeomDetail
+from app.services import cache
+from app.services.cache import LRUTTLCache, chave_busca
+
+
+def test_lru_descarta_o_menos_usado():
+    lru = LRUTTLCache(max_itens=2, ttl=60)
+    lru.set((1, "a"), "A")
+    lru.set((1, "b"), "B")
+    assert lru.get((1, "a")) == "A"  # "b" passa a ser o menos usado
+
+    lru.set((1, "c"), "C")
+
+    assert lru.get((1, "b")) is None
+    assert lru.get((1, "a")) == "A"
+    assert lru.get((1, "c")) == "C"
+    assert lru.evictions == 1
+
+
+def test_ttl_expira_entrada(monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: agora[0])
+    lru = LRUTTLCache(max_itens=10, ttl=5)
+    lru.set((1, "a"), "A")
+
+    agora[0] += 4.9
+    assert lru.get((1, "a")) == "A"
+    agora[0] += 0.1
+    assert lru.get((1, "a")) is None
+    assert lru.expirations == 1
+    assert lru.stats()["itens"] == 0
+
+
+def test_nova_versao_descarta_entradas_anteriores():
+    lru = LRUTTLCache(max_itens=10, ttl=60)
+    lru.set((1, "a"), "A")
+
+    assert lru.get((2, "a")) is None
+    assert lru.get((1, "a")) is None  # versão 1 já foi descartada
+    assert lru.stats()["versao"] == 1
+
+
+def test_chave_independe_da_ordem_dos_parametros():
+    assert chave_busca(1, "raio", latitude=-22.9, raio_km=10) == chave_busca(
+        1, "raio", raio_km=10, latitude=-22.9
+    )
+
+
+def test_chave_usa_valor_dos_enums():
+    chave = chave_busca(1, "ponto", detail=GeomDetail.low)
+    assert chave == (1, "ponto", (("detail", GeomDetail.low.value),))
+
+
+def test_chave_arredonda_so_coordenadas():
+    a = chave_busca(
+        1, "raio", latitude=-22.12345671, longitude=-47.1, raio_km=1.23456789
+    )
+    b = chave_busca(
+        1, "raio", latitude=-22.12345674, longitude=-47.1, raio_km=1.23456789
+    )
+    assert a == b
+    assert dict(a[2])["raio_km"] == 1.23456789
+
+
+def test_chave_separa_versoes_e_operacoes():
+    assert chave_busca(1, "ponto", latitude=0.0) != chave_busca(
+        2, "ponto", latitude=0.0
+    )
+    assert chave_busca(1, "ponto", latitude=0.0) != chave_busca(1, "raio", latitude=0.0)
@@ -0,0 +1,49 @@
+"""Cursores opacos da paginação keyset."""
+
+import base64
+
+import pytest
+
+from app.core.exceptions import ParametroInvalido
+from app.services.cursor import decode_cursor, encode_cursor
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize(
+    "valores",
+    [{"id": 1}, {"id": 123456789}, {"id": 42, "distancia": 12.5}],
+)
+def test_ida_e_volta(valores):
+    cursor = encode_cursor(valores)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, valores) == valores
+
+
+def test_cursor_e_deterministico():
+    assert encode_cursor({"a": 1, "id": 2}) == encode_cursor({"id": 2, "a": 1})
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "!!!",
+        "a",  # base64 truncado
+        _b64(b"\xff\xfe"),  # não é UTF-8
+        _b64(b"{id: 1"),  # JSON quebrado
+        _b64(b"[1, 2]"),  # não é objeto
+        _b64(b'{"outro": 1}'),  # sem o campo esperado
+    ],
+)
+def test_cursor_adulterado(cursor):
+    with pytest.raises(ParametroInvalido):
+        decode_cursor(cursor)
+
+
+def test_exige_todos_os_campos():
+    cursor = encode_cursor({"id": 1})
+    with pytest.raises(ParametroInvalido):
+        decode_cursor(cursor, ("id", "distancia"))
@@ -0,0 +1,28 @@
+"""ETags e avaliação de `If-None-Match`."""
+
+import pytest
+
+from app.services.etag import etag_corresponde, gerar_etag
+
+ETAG = gerar_etag(1, "ponto", (("latitude", -22.9),))
+
+
+def test_gerar_etag_e_forte_e_deterministica():
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert ETAG == gerar_etag(1, "ponto", (("latitude", -22.9),))
+    assert ETAG != gerar_etag(2, "ponto", (("latitude", -22.9),))
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [ETAG, f"W/{ETAG}", f'"outra", {ETAG}', f' "outra" , W/{ETAG} ', "*", " * "],
+)
+def test_corresponde(if_none_match):
+    assert etag_corresponde(if_none_match, ETAG)
+
+
+@pytest.mark.parametrize(
+    "if_none_match", [None, "", '"outra"', ETAG.strip('"'), '"outra", W/"x"']
+)
+def test_nao_corresponde(if_none_match):
+    assert not etag_corresponde(if_none_match, ETAG)
@@ -0,0 +1,82 @@
+"""Helpers puros de app.services.geospatial (sem banco)."""
+
+import pytest
+
+from app.core.config import TOTAL_ESTIMATE_CAP
+from app.core.exceptions import ParametroInvalido
+from app.schemas.pagination import TotalMode
+from app.services.geospatial import CAMPOS_ATRIBUTOS, resolver_campos, resolver_total
+
+
+# -------------------- resolver_total --------------------
+def test_total_none():
+    assert resolver_total(50, 10, 10, 0, None, TotalMode.none) == (
+        None,
+        TotalMode.none,
+    )
+
+
+def test_total_pela_ultima_pagina():
+    # Sem contagem executada: a página incompleta é a última
+    assert resolver_total(None, 3, 10, 20, None, TotalMode.exact) == (
+        23,
+        TotalMode.exact,
+    )
+
+
+def test_total_indeterminado_com_cursor():
+    assert resolver_total(None, 3, 10, 0, "c", TotalMode.exact) == (
+        None,
+        TotalMode.exact,
+    )
+
+
+def test_total_contado():
+    assert resolver_total(57, 11, 10, 0, None, TotalMode.exact) == (
+        57,
+        TotalMode.exact,
+    )
+
+
+def test_estimativa_abaixo_do_teto_e_exata():
+    assert resolver_total(TOTAL_ESTIMATE_CAP, 11, 10, 0, None, TotalMode.estimate) == (
+        TOTAL_ESTIMATE_CAP,
+        TotalMode.exact,
+    )
+
+
+def test_estimativa_acima_do_teto():
+    assert resolver_total(
+        TOTAL_ESTIMATE_CAP + 1, 11, 10, 0, None, TotalMode.estimate
+    ) == (TOTAL_ESTIMATE_CAP, TotalMode.estimate)
+
+
+# -------------------- resolver_campos --------------------
+def test_campos_omitidos():
+    assert resolver_campos(None) is None
+    assert resolver_campos(None, include_geom=False) == CAMPOS_ATRIBUTOS
+
+
+def test_campos_na_ordem_da_tabela_com_id():
+    campos = resolver_campos(" geom, municipio ,cod_imovel,,")
+    assert campos[0] == "id"
+    assert set(campos) == {"id", "cod_imovel", "municipio", "geom"}
+    assert list(campos) == [c for c in (*CAMPOS_ATRIBUTOS, "geom") if c in campos]
+
+
+def test_include_geom_false_remove_geom():
+    assert "geom" not in resolver_campos("municipio,geom", include_geom=False)
+
+
+@pytest.mark.parametrize(
+    "fields, invalidos",
+    [
+        ("municipio,senha", "senha"),
+        ("zzz,aaa", "aaa, zzz"),
+        ("geom_low", "geom_low"),
+        ("hash_conteudo", "hash_conteudo"),
+    ],
+)
+def test_campos_invalidos(fields, invalidos):
+    with pytest.raises(ParametroInvalido, match=f"Campos inválidos: {invalidos}$"):
+        resolver_campos(fields)
@@ -0,0 +1,54 @@
+"""
+Plano da busca por raio: as consultas de página e de contagem devem usar um
+índice geography (`idx_fazendas_geog` ou `idx_fazendas_partes_geog`).
+
+O planner roda com as configurações padrão (sem `enable_seqscan = off`): o que
+se verifica é que ele escolhe o índice sozinho. Por isso o teste é pulado sem
+banco acessível e em bases pequenas demais, onde o seq scan é a escolha certa.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+# Sem o driver do banco instalado, não há o que verificar
+session = pytest.importorskip("app.db.session", reason="driver do banco ausente")
+explain_raio = pytest.importorskip("benchmarks.explain_raio")
+
+# Abaixo disso o seq scan em fazendas_partes é legitimamente mais barato
+MIN_PARTES = 10_000
+RAIO_KM = 1.0
+
+
+@pytest.fixture(scope="module")
+def db():
+    sessao = session.SessionLocal()
+    try:
+        partes = sessao.execute(text("SELECT count(*) FROM fazendas_partes")).scalar()
+    except SQLAlchemyError as exc:
+        sessao.close()
+        pytest.skip(f"banco indisponível: {exc.__class__.__name__}")
+    if partes < MIN_PARTES:
+        sessao.close()
+        pytest.skip(f"base pequena demais ({partes} partes < {MIN_PARTES})")
+    yield sessao
+    sessao.rollback()
+    sessao.close()
+
+
+@pytest.fixture(scope="module")
+def ponto(db):
+    """Um ponto dentro de uma fazenda da base, para a busca ter resultado."""
+    return db.execute(text("""
+            SELECT ST_Y(ST_PointOnSurface(geom)), ST_X(ST_PointOnSurface(geom))
+            FROM fazendas ORDER BY id LIMIT 1
+            """)).one()
+
+
+@pytest.mark.parametrize("consulta", ["pagina", "contagem"])
+def test_busca_raio_usa_indice_geography(db, ponto, consulta):
+    latitude, longitude = ponto
+    usados = explain_raio.indices_raio(db, latitude, longitude, RAIO_KM)[consulta]
+    assert explain_raio.INDICES.intersection(
+        usados
+    ), f"{consulta} sem índice geography: {usados}"
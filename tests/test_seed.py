@@ -0,0 +1,163 @@
+"""Transformação do shapefile e formato texto do COPY no seed."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+gpd = pytest.importorskip("geopandas")
+# O módulo do seed cria o engine ao ser importado (exige o driver do banco)
+seed = pytest.importorskip("seed.seedFazendas", reason="driver do banco ausente")
+
+
+# -------------------- Escapes do COPY --------------------
+def test_escapa_caracteres_especiais():
+    serie = pd.Series(["a\tb", "linha\nnova", "c:\\dir", "fim\r", "simples"])
+    assert seed._escapar_copy(serie).tolist() == [
+        "a\\tb",
+        "linha\\nnova",
+        "c:\\\\dir",
+        "fim\\r",
+        "simples",
+    ]
+
+
+def test_barra_escapada_antes_dos_demais():
+    # "\t" literal (barra + t) não pode virar tabulação ao ser lido pelo COPY
+    assert seed._escapar_copy(pd.Series(["\\t"])).tolist() == ["\\\\t"]
+
+
+def test_sem_especiais_devolve_a_serie():
+    serie = pd.Series(["a", "b"])
+    assert seed._escapar_copy(serie) is serie
+
+
+def test_coluna_texto_com_nulos():
+    serie = pd.Series(["a\tb", None, np.nan, "ok"], dtype=object)
+    assert seed._coluna_copy(serie).tolist() == ["a\\tb", "\\N", "\\N", "ok"]
+
+
+def test_coluna_numerica_com_nulos():
+    assert seed._coluna_copy(pd.Series([1.5, None])).tolist() == ["1.5", "\\N"]
+
+
+def test_coluna_de_datas():
+    serie = pd.Series(pd.to_datetime(["2026-10-17", None]))
+    assert seed._coluna_copy(serie).tolist() == ["2026-10-17", "\\N"]
+
+
+# -------------------- transformar_geodataframe --------------------
+def _gdf() -> "gpd.GeoDataFrame":
+    quadrado = shapely.box(0, 0, 1, 1)
+    return gpd.GeoDataFrame(
+        {
+            "cod_imovel": ["A", "B", "C", "D"],
+            "num_area": [1.0, 2.0, 3.0, 4.0],
+            "dat_criaca": ["17/10/2026", "2026-10-17", None, "17/10/2026"],
+        },
+        geometry=[
+            quadrado,
+            shapely.multipolygons([quadrado]),
+            None,
+            shapely.Point(0, 0),
+        ],
+        crs="EPSG:4326",
+    )
+
+
+def test_descarta_geometrias_vazias_ou_de_outro_tipo():
+    atributos, geoms = seed.transformar_geodataframe(_gdf())
+    assert atributos["cod_imovel"].tolist() == ["A", "B"]
+    assert len(geoms) == 2
+
+
+def test_promove_polygon_a_multipolygon():
+    _, geoms = seed.transformar_geodataframe(_gdf())
+    assert shapely.get_type_id(geoms).tolist() == [
+        seed.TIPO_MULTIPOLYGON,
+        seed.TIPO_MULTIPOLYGON,
+    ]
+    assert shapely.equals(geoms[0], shapely.box(0, 0, 1, 1))
+
+
+def test_atributos_completos_e_datas_convertidas():
+    atributos, _ = seed.transformar_geodataframe(_gdf())
+    assert tuple(atributos.columns) == seed.CAMPOS_ATRIBUTOS
+    assert atributos["municipio"].isna().all()
+    assert atributos["dat_criaca"].tolist() == [pd.Timestamp("2026-10-17")] * 2
+
+
+def test_linhas_copy():
+    atributos, geoms = seed.transformar_geodataframe(_gdf())
+    linha = seed.linhas_copy(atributos, geoms).iloc[0]
+    colunas = linha.rstrip("\n").split("\t")
+    assert len(colunas) == len(seed.COLUNAS_COPY)
+    assert colunas[seed.CAMPOS_ATRIBUTOS.index("municipio")] == "\\N"
+    assert colunas[seed.CAMPOS_ATRIBUTOS.index("dat_criaca")] == "2026-10-17"
+    geom = shapely.from_wkb(colunas[-1])
+    assert shapely.get_srid(geom) == 4326
+
+
+# -------------------- Lotes do COPY --------------------
+def test_lotes_transformam_uma_fatia_por_vez(monkeypatch):
+    fatias = []
+    transformar = seed.transformar_geodataframe
+
+    def registrar(gdf):
+        fatias.append(len(gdf))
+        return transformar(gdf)
+
+    monkeypatch.setattr(seed, "transformar_geodataframe", registrar)
+    lotes = seed.lotes_copy(_gdf(), chunk_size=3)
+
+    texto, n_linhas = next(lotes)
+    assert fatias == [3]
+    assert n_linhas == 2 and texto.count("\n") == 2
+    # A última fatia só tem um Point: nenhum lote vazio é emitido
+    assert list(lotes) == []
+    assert fatias == [3, 1]
+
+
+# -------------------- Registros do seed paralelo --------------------
+def _layout_car(raiz) -> list:
+    """Um `AREA_IMOVEL_1.shp` por estado, como o CAR publica."""
+    arquivos = []
+    for uf in ("SP", "MG"):
+        (raiz / uf).mkdir()
+        arquivo = raiz / uf / "AREA_IMOVEL_1.shp"
+        arquivo.touch()
+        arquivos.append(arquivo)
+    return arquivos
+
+
+@pytest.mark.parametrize(
+    "padrao, raiz",
+    [
+        ("data/**/*.shp", "data"),
+        ("data/SP/*.shp", "data/SP"),
+        ("data/[SM]*/AREA_IMOVEL_1.shp", "data"),
+        ("*.shp", "."),
+        ("data/SP/AREA_IMOVEL_1.shp", "data/SP"),
+    ],
+)
+def test_raiz_do_glob(padrao, raiz):
+    assert seed.raiz_padrao(padrao) == Path(raiz)
+
+
+def test_mesmo_nome_em_estados_diferentes(tmp_path):
+    _layout_car(tmp_path)
+    padrao = str(tmp_path / "**" / "*.shp")
+    arquivos = seed.resolver_arquivos(padrao)
+
+    nomes = seed.nomes_seed_arquivos("carga", arquivos, seed.raiz_padrao(padrao))
+
+    assert sorted(nomes) == ["carga:MG/AREA_IMOVEL_1.shp", "carga:SP/AREA_IMOVEL_1.shp"]
+    assert sorted(nomes.values()) == arquivos
+
+
+def test_registros_duplicados_sao_erro(tmp_path):
+    arquivos = _layout_car(tmp_path)
+    with pytest.raises(ValueError, match="mesmo registro"):
+        seed.nomes_seed_arquivos("carga", [*arquivos, arquivos[0]], tmp_path)